@@ -6,23 +6,66 @@ Usage:
     python generate_feeds.py --source mistral   # Une source spécifique
     python generate_feeds.py --no-merge         # Sans fusion
     python generate_feeds.py --log-level DEBUG  # Niveau de log personnalisé
+    python generate_feeds.py --selector-report  # Sélecteurs qui ne matchent plus
+    python generate_feeds.py --workers 4        # 4 processus en parallèle
+    python generate_feeds.py --shard 1/3        # Premier tiers des sources (sans fusion)
+    python generate_feeds.py --reduce           # Agréger les shards et fusionner
+    python generate_feeds.py --search "agents"  # Rechercher dans tous les articles collectés
+    python generate_feeds.py --record           # Archiver le trafic réseau de chaque source
+    python generate_feeds.py --replay           # Scraper hors ligne depuis les archives
+    python generate_feeds.py --notify-hubs      # Notifier les hubs WebSub des flux modifiés
+    python generate_feeds.py --profile          # Profiler chaque source (Python + page)
+    python generate_feeds.py --deadline 25m     # Terminer en 25 minutes, sources les plus utiles d'abord
 """
 import argparse
+import asyncio
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Any, Optional, Tuple
 
 from src import (
-    scrape_source,
-    generate_rss_from_config,
+    process_source_async,
+    run_exit_code,
+    SUCCESS,
+    DEGRADED,
+    FAILED,
+    SKIPPED,
     merge_from_sources_config,
+    selector_health_report,
+    prune_stale_profiles,
+    shard_sources,
+    save_shard_costs,
+    SHARD_COSTS_FILE,
+    parse_shard,
+    order_by_cost,
+    parse_duration,
+    DeadlineBudget,
+    plan_summary,
+    generate_query_feeds,
+    ArticleIndex,
+    RECORD,
+    REPLAY,
+    REPLAY_OUTPUT_DIR,
+    ARCHIVES_DIR,
+    flush_notifications,
+    SourceProfiler,
+    profiling_run_dir,
+    write_profile_summary,
     load_yaml_config,
+    load_json_state,
+    save_json_state,
     setup_logging
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Résultats intermédiaires des shards, agrégés par --reduce
+SHARD_RESULTS_DIR = Path('.cache') / 'shards'
+
 
 def parse_arguments():
     """Parse les arguments de ligne de commande"""
@@ -35,6 +78,14 @@ Exemples:
   %(prog)s --source mistral         # Générer uniquement Mistral AI
   %(prog)s --no-merge               # Générer sans fusionner
   %(prog)s --log-level DEBUG        # Mode debug détaillé
+  %(prog)s --selector-report        # Lister les sélecteurs cassés
+  %(prog)s --workers 4              # Traiter 4 sources en parallèle
+  %(prog)s --shard 2/3 --workers 2  # Deuxième shard sur 3, 2 processus
+  %(prog)s --reduce                 # Résumé des shards + fusion unique
+  %(prog)s --search "claude code"   # Recherche plein texte dans l'historique
+  %(prog)s --source mistral --record  # Archiver les pages de Mistral AI
+  %(prog)s --source mistral --replay  # Tester les sélecteurs hors ligne
+  %(prog)s --deadline 25m           # Budget de temps global de l'exécution
         """
     )
 
@@ -65,55 +116,475 @@ Exemples:
         help='Chemin vers le fichier de configuration sources.yaml'
     )
 
+    parser.add_argument(
+        '--selector-report',
+        action='store_true',
+        help='Afficher les sélecteurs qui ne matchent plus et quitter'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Nombre de processus traitant les sources en parallèle (défaut: 1)'
+    )
+
+    parser.add_argument(
+        '--deadline',
+        type=str,
+        metavar='DURATION',
+        help="Durée maximale de l'exécution (ex: 1500, 25m, 1h) : sources priorisées, délais réduits, "
+             "sources en trop ignorées"
+    )
+
+    parser.add_argument(
+        '--shard',
+        type=str,
+        help='Ne traiter que le shard i/n des sources actives (ex: 1/4) ; la fusion est laissée à --reduce'
+    )
+
+    parser.add_argument(
+        '--reduce',
+        action='store_true',
+        help='Agréger les résultats des shards et lancer la fusion, sans scraper'
+    )
+
+    parser.add_argument(
+        '--search',
+        type=str,
+        metavar='QUERY',
+        help="Rechercher dans l'index plein texte des articles collectés et quitter"
+    )
+
+    network_group = parser.add_mutually_exclusive_group()
+    network_group.add_argument(
+        '--record',
+        action='store_true',
+        help='Archiver le trafic réseau de chaque source dans archives/'
+    )
+    network_group.add_argument(
+        '--replay',
+        action='store_true',
+        help="Scraper depuis les archives, sans accès réseau ni modification de l'état"
+    )
+
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Profiler chaque source (cProfile + trace Playwright) et écrire un résumé dans profiling/'
+    )
+
+    parser.add_argument(
+        '--notify-hubs',
+        action='store_true',
+        help='Notifier les hubs WebSub des flux modifiés depuis la dernière notification et quitter'
+    )
+
     return parser.parse_args()
 
 
-def process_source(source_name: str) -> bool:
+def process_source(source_name: str, sources_config: Optional[Dict[str, Any]] = None,
+                   network_mode: Optional[str] = None, profile_dir: Optional[Path] = None,
+                   wait_scale: float = 1.0, timeout: Optional[float] = None) -> str:
     """
-    Traite une source RSS : scraping + génération du flux
+    Traite une source RSS : scraping + génération du flux (voir src/pipeline.py)
 
     Args:
         source_name: Nom de la source (ex: 'mistral')
+        sources_config: Configuration centrale (sources.yaml), pour le disjoncteur, l'index de recherche et WebSub
+        network_mode: 'record' pour archiver le trafic, 'replay' pour scraper depuis l'archive
+        profile_dir: Si défini, le pipeline est profilé et ses artefacts écrits dans ce répertoire
+        wait_scale: Facteur des délais d'attente (--deadline)
+        timeout: Durée maximale du scraping en secondes (--deadline)
 
     Returns:
-        True si succès, False sinon
+        Issue du traitement : SUCCESS, DEGRADED (flux servi depuis l'instantané) ou FAILED
     """
-    config_file = f"config/{source_name}.yaml"
-    config_path = Path(config_file)
+    if not profile_dir:
+        return asyncio.run(process_source_async(source_name, sources_config, network_mode=network_mode,
+                                                wait_scale=wait_scale, timeout=timeout)).status
 
-    if not config_path.exists():
-        logger.error(f"❌ Configuration file not found: {config_file}")
-        return False
+    # Une exécution profilée (cProfile + tracing) est plus lente : elle ne doit pas fausser l'historique
+    with SourceProfiler(source_name, profile_dir):
+        result = asyncio.run(process_source_async(source_name, sources_config, network_mode=network_mode,
+                                                  trace_dir=profile_dir, record_history=False,
+                                                  wait_scale=wait_scale, timeout=timeout))
+    return result.status
 
-    try:
-        logger.info(f"📥 Processing source: {source_name}")
 
-        # 1. Scraper les articles
-        logger.info(f"  🔍 Scraping {source_name}...")
-        articles = scrape_source(config_file)
+def print_selector_report() -> None:
+    """Affiche le rapport de santé des sélecteurs"""
+    report = selector_health_report()
+
+    logger.info("=" * 60)
+    logger.info("🩺 Selector health report")
+    logger.info("=" * 60)
+
+    if not report:
+        logger.info("  ✅ All tracked selectors are matching")
+        return
+
+    for stale in report:
+        last_hit = stale['last_hit'] or 'never'
+        logger.warning(f"  ⚠️  {stale['source']}.{stale['field']}: '{stale['selector']}' "
+                       f"- {stale['consecutive_misses']} consecutive misses (last hit: {last_hit})")
+
+
+def run_sources(sources: List[str], sources_config: Dict[str, Any], workers: int = 1,
+                log_level: str = 'INFO', network_mode: Optional[str] = None,
+                profile_dir: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Traite une liste de sources, séquentiellement ou dans un pool de processus
+
+    Chaque processus lance son propre navigateur. Les sources les plus coûteuses
+    (d'après l'historique) sont soumises en premier pour équilibrer la charge.
+
+    Args:
+        sources: Noms des sources à traiter
+        sources_config: Configuration centrale (sources.yaml)
+        workers: Nombre de processus (1 = séquentiel, dans ce processus)
+        log_level: Niveau de log des processus enfants
+        network_mode: 'record' ou 'replay' (voir src/archives.py)
+        profile_dir: Répertoire des artefacts de profilage (--profile), ou None
+
+    Returns:
+        Dictionnaire source → issue du traitement, dans l'ordre de la configuration
+    """
+    if workers <= 1 or len(sources) <= 1:
+        return {source_name: process_source(source_name, sources_config, network_mode, profile_dir)
+                for source_name in sources}
+
+    results: Dict[str, str] = {}
+    logger.info(f"⚙️  Using {min(workers, len(sources))} worker processes")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=setup_logging, initargs=(log_level,)) as pool:
+        futures = {
+            source_name: pool.submit(process_source, source_name, sources_config, network_mode, profile_dir)
+            for source_name in order_by_cost(sources)
+        }
+        for source_name, future in futures.items():
+            try:
+                results[source_name] = future.result()
+            except Exception as e:
+                logger.error(f"❌ Worker failed for {source_name}: {e}", exc_info=True)
+                results[source_name] = FAILED
+
+    return {source_name: results[source_name] for source_name in sources}
 
-        if not articles:
-            logger.warning(f"  ⚠️  No articles found for {source_name}")
-            return False
 
-        logger.info(f"  ✓ Found {len(articles)} articles")
+def run_sources_with_deadline(budget: DeadlineBudget, sources_config: Dict[str, Any], workers: int = 1,
+                              log_level: str = 'INFO', network_mode: Optional[str] = None,
+                              profile_dir: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Traite les sources par valeur décroissante, dans le budget de temps de l'exécution
 
-        # 2. Générer le flux RSS
-        logger.info(f"  📝 Generating RSS feed...")
-        success = generate_rss_from_config(config_file, articles)
+    Le budget de chaque source (facteur des délais d'attente, durée maximale) est
+    calculé au moment où elle démarre, d'après le temps réellement restant.
+
+    Args:
+        budget: Budget de l'exécution (ordre de traitement et sources ignorées)
+        sources_config: Configuration centrale (sources.yaml)
+        workers: Nombre de processus (1 = séquentiel, dans ce processus)
+        log_level: Niveau de log des processus enfants
+        network_mode: 'record' ou 'replay' (voir src/archives.py)
+        profile_dir: Répertoire des artefacts de profilage (--profile), ou None
+
+    Returns:
+        Dictionnaire source → issue du traitement, dans l'ordre de budget.order ;
+        les sources ignorées faute de temps sont SKIPPED (raison dans budget.skipped)
+    """
+    results: Dict[str, str] = {}
+
+    def next_source() -> Optional[Tuple[str, float, float]]:
+        while budget.pending:
+            source_name = budget.pending[0]
+            allocation = budget.allocate(source_name)
+            if allocation:
+                wait_scale, timeout = allocation
+                return source_name, wait_scale, timeout
+            logger.warning(f"⏭️  Skipping {source_name}: {budget.skipped[source_name]}")
+            results[source_name] = SKIPPED
+        return None
+
+    if workers <= 1:
+        while (job := next_source()):
+            source_name, wait_scale, timeout = job
+            results[source_name] = process_source(source_name, sources_config, network_mode, profile_dir,
+                                                  wait_scale, timeout)
+        return results
+
+    logger.info(f"⚙️  Using {workers} worker processes")
+    with ProcessPoolExecutor(max_workers=workers, initializer=setup_logging, initargs=(log_level,)) as pool:
+        running = {}
+        while True:
+            # Une source n'est soumise que lorsqu'un processus se libère : son budget est alors à jour
+            while len(running) < workers and (job := next_source()):
+                source_name, wait_scale, timeout = job
+                future = pool.submit(process_source, source_name, sources_config, network_mode, profile_dir,
+                                     wait_scale, timeout)
+                running[future] = source_name
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                source_name = running.pop(future)
+                try:
+                    results[source_name] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Worker failed for {source_name}: {e}", exc_info=True)
+                    results[source_name] = FAILED
+
+    return results
+
+
+def print_skipped(budget: DeadlineBudget) -> None:
+    """
+    Affiche les sources ignorées faute de temps (leur flux précédent reste publié)
 
+    Args:
+        budget: Budget de l'exécution
+    """
+    if not budget.skipped:
+        logger.info("⏱️  All sources fit in the deadline")
+        return
+
+    logger.warning(f"⏱️  {len(budget.skipped)} sources skipped to meet the deadline (previous feeds kept):")
+    for source_name, reason in budget.skipped.items():
+        logger.warning(f"  ⏭️  {source_name}: {reason}")
+
+
+def print_summary(results: Dict[str, str]) -> None:
+    """
+    Affiche le résumé par source
+
+    Une source servie depuis son instantané (scraping en échec ou disjoncteur
+    ouvert) est signalée comme dégradée : son flux est publié mais n'évolue plus.
+    Une source ignorée pour tenir le budget --deadline garde son flux précédent.
+
+    Args:
+        results: Dictionnaire source → issue du traitement
+    """
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info("📊 Summary")
+    logger.info("=" * 60)
+
+    labels = {SUCCESS: "✅ Success", DEGRADED: "⚠️  Degraded (served from snapshot)",
+              SKIPPED: "⏭️  Skipped (deadline, previous feed kept)"}
+    for source_name, status in results.items():
+        logger.info(f"  {source_name}: {labels.get(status, '❌ Failed')}")
+
+    statuses = list(results.values())
+    logger.info(f"\n  Total: {statuses.count(SUCCESS)}/{len(results)} successful, "
+                f"{statuses.count(DEGRADED)} degraded, {statuses.count(SKIPPED)} skipped")
+
+
+def run_merge(config_file: str, merge_config: Dict[str, Any]) -> None:
+    """
+    Lance la fusion des flux si elle est activée
+
+    Args:
+        config_file: Chemin vers sources.yaml
+        merge_config: Section merge de sources.yaml
+    """
+    if not merge_config.get('enabled', False):
+        logger.info("\n⏭️  Merge is disabled in configuration")
+        return
+
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info("🔀 Merging RSS feeds")
+    logger.info("=" * 60)
+
+    try:
+        success = merge_from_sources_config(config_file)
         if success:
-            config = load_yaml_config(config_file)
-            output_file = config['rss']['output_file']
-            logger.info(f"  ✅ RSS feed generated: output/{output_file}")
-            return True
+            output_file = merge_config.get('output_file', 'merged_feed.xml')
+            logger.info(f"✅ Merged feed generated: output/{output_file}")
         else:
-            logger.error(f"  ❌ Failed to generate RSS feed for {source_name}")
-            return False
-
+            logger.error("❌ Failed to merge feeds")
     except Exception as e:
-        logger.error(f"  ❌ Error processing {source_name}: {e}", exc_info=True)
-        return False
+        logger.error(f"❌ Error during merge: {e}", exc_info=True)
+
+
+def run_query_feeds(search_config: Dict[str, Any], websub_config: Optional[Dict[str, Any]] = None,
+                    default_link: Optional[str] = None) -> None:
+    """
+    Génère les flux des requêtes enregistrées (search.queries)
+
+    Args:
+        search_config: Section search de sources.yaml
+        websub_config: Section websub de sources.yaml
+        default_link: Lien des flux dont la requête n'en définit pas (merge.link)
+    """
+    results = generate_query_feeds(search_config, websub_config, default_link)
+    for name, success in results.items():
+        if success:
+            logger.info(f"🔎 Query feed generated: {name}")
+        else:
+            logger.error(f"❌ Failed to generate query feed: {name}")
+
+
+def run_hub_notifications(websub_config: Dict[str, Any]) -> None:
+    """
+    Notifie les hubs WebSub des flux modifiés depuis la dernière notification
+
+    Args:
+        websub_config: Section websub de sources.yaml
+    """
+    if not websub_config.get('enabled', False):
+        logger.info("⏭️  WebSub is disabled in configuration")
+        return
+
+    notified = flush_notifications(websub_config)
+    logger.info(f"📣 WebSub: {notified} changed feeds notified")
+
+
+def notify_hubs_if_immediate(websub_config: Dict[str, Any]) -> None:
+    """
+    Notifie les hubs en fin d'exécution si websub.notify vaut 'immediate'
+
+    Par défaut ('deferred'), la notification attend --notify-hubs : les flux
+    doivent d'abord être publiés, sinon le hub relirait l'ancienne version.
+
+    Args:
+        websub_config: Section websub de sources.yaml
+    """
+    if websub_config.get('notify', 'deferred') == 'immediate':
+        run_hub_notifications(websub_config)
+
+
+def print_search_results(query: str, search_config: Dict[str, Any]) -> None:
+    """
+    Affiche les résultats d'une recherche plein texte
+
+    Args:
+        query: Requête
+        search_config: Section search de sources.yaml
+    """
+    with ArticleIndex.from_config(search_config) as index:
+        start = time.monotonic()
+        articles = index.search(query, limit=search_config.get('max_results', 50))
+        elapsed = (time.monotonic() - start) * 1000
+
+        logger.info(f"🔎 {len(articles)} results for '{query}' "
+                    f"({index.count()} articles indexed, {elapsed:.1f} ms)")
+
+    for article in articles:
+        logger.info(f"  {article.date.strftime('%Y-%m-%d')} [{article.source}] {article.title}")
+        logger.info(f"      {article.link}")
+
+
+def print_profile_summary(profile_dir: Path) -> None:
+    """
+    Écrit et affiche le résumé d'une exécution profilée
+
+    Args:
+        profile_dir: Répertoire des artefacts de profilage
+    """
+    summary_path = write_profile_summary(profile_dir)
+    if not summary_path:
+        logger.warning(f"⚠️  No profile collected in {profile_dir}")
+        return
+
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info(f"⏱️  Profile ({summary_path})")
+    logger.info("=" * 60)
+    for line in summary_path.read_text(encoding='utf-8').splitlines():
+        logger.info(line)
+    logger.info(f"\nTraces: playwright show-trace {profile_dir}/<source>.trace.zip")
+    logger.info(f"Profiles: python -m pstats {profile_dir}/<source>.prof")
+
+
+def save_shard_results(index: int, total: int, results: Dict[str, str]) -> None:
+    """
+    Écrit les résultats d'un shard pour --reduce
+
+    Les résultats d'un découpage différent (ex: 1-of-3.json avant un passage
+    à 2 shards) sont supprimés : --reduce ne doit pas les agréger.
+
+    Args:
+        index: Numéro du shard
+        total: Nombre de shards
+        results: Dictionnaire source → issue du traitement
+    """
+    for shard_file in SHARD_RESULTS_DIR.glob('*-of-*.json'):
+        if not shard_file.name.endswith(f"-of-{total}.json"):
+            shard_file.unlink(missing_ok=True)
+    save_json_state(SHARD_RESULTS_DIR / f"{index}-of-{total}.json", results)
+
+
+def load_shard_results() -> Dict[str, str]:
+    """
+    Agrège les résultats écrits par les exécutions --shard
+
+    Si des fichiers de plusieurs découpages sont présents (ex: résultats
+    rapatriés de runners différents), seul le découpage le plus récent est agrégé.
+
+    Returns:
+        Dictionnaire source → issue du traitement, toutes shards confondues
+    """
+    shard_files: Dict[int, Dict[int, Path]] = {}
+    for shard_file in SHARD_RESULTS_DIR.glob('*-of-*.json'):
+        match = re.fullmatch(r'(\d+)-of-(\d+)\.json', shard_file.name)
+        if match:
+            shard_files.setdefault(int(match.group(2)), {})[int(match.group(1))] = shard_file
+
+    results: Dict[str, str] = {}
+    if not shard_files:
+        return results
+
+    total = max(shard_files, key=lambda t: max(f.stat().st_mtime for f in shard_files[t].values()))
+    for other_total, files in shard_files.items():
+        if other_total != total:
+            logger.warning(f"  ⚠️  Ignoring {len(files)} stale results from a {other_total}-shard run")
+
+    missing = [index for index in range(1, total + 1) if index not in shard_files[total]]
+    if missing:
+        logger.warning(f"  ⚠️  Missing results for shards {', '.join(f'{i}/{total}' for i in missing)}")
+
+    for index in sorted(shard_files[total]):
+        shard_file = shard_files[total][index]
+        shard_results = load_json_state(shard_file, {})
+        logger.info(f"  📦 {shard_file.name}: {len(shard_results)} sources")
+        results.update(shard_results)
+    return results
+
+
+def has_feeds(results: Dict[str, str]) -> bool:
+    """True si au moins une source a un flux à fusionner (scrapé ou depuis l'instantané)"""
+    return any(status in (SUCCESS, DEGRADED) for status in results.values())
+
+
+def exit_with_status(results: Dict[str, str]) -> None:
+    """
+    Quitte avec un code de sortie reflétant les résultats
+
+    Une source dégradée ne compte pas comme réussie : si aucune source n'a pu
+    être scrapée, l'exécution échoue même si des instantanés ont été servis.
+    Les sources ignorées pour tenir le budget --deadline ne comptent pas
+    (même règle que RunResult.exit_code, voir run_exit_code).
+
+    Args:
+        results: Dictionnaire source → issue du traitement
+    """
+    statuses = list(results.values())
+    successful_count = statuses.count(SUCCESS)
+
+    if run_exit_code(statuses) != 0:
+        logger.error("\n❌ All sources failed")
+        sys.exit(1)
+    elif statuses.count(SKIPPED) == len(statuses):
+        logger.warning("\n⏱️  All sources skipped to meet the deadline (previous feeds kept)")
+        sys.exit(0)
+    elif successful_count < len(results):
+        logger.warning(f"\n⚠️  Some sources failed, degraded or skipped ({len(results) - successful_count})")
+        sys.exit(0)  # Ne pas échouer si au moins une source a réussi
+    else:
+        logger.info("\n✅ All feeds generated successfully!")
+        sys.exit(0)
 
 
 def main():
@@ -123,6 +594,20 @@ def main():
     # Configuration du logging
     setup_logging(args.log_level)
 
+    # Le budget court dès le lancement
+    deadline = None
+    if args.deadline:
+        try:
+            deadline = parse_duration(args.deadline)
+        except ValueError as e:
+            logger.error(f"❌ {e}")
+            sys.exit(1)
+        deadline_start = time.monotonic()
+
+    if args.selector_report:
+        print_selector_report()
+        sys.exit(0)
+
     logger.info("=" * 60)
     logger.info("🚀 RSS Feed Generator - Multi-Sources")
     logger.info("=" * 60)
@@ -134,6 +619,34 @@ def main():
         logger.error(f"❌ Failed to load sources config: {e}")
         sys.exit(1)
 
+    merge_config = sources_config.get('merge', {})
+    search_config = sources_config.get('search', {})
+    websub_config = sources_config.get('websub', {})
+
+    if args.notify_hubs:
+        run_hub_notifications(websub_config)
+        sys.exit(0)
+
+    if args.search:
+        print_search_results(args.search, search_config)
+        sys.exit(0)
+
+    # Étape de réduction : agréger les shards puis fusionner une seule fois
+    if args.reduce:
+        results = load_shard_results()
+        if not results:
+            logger.error(f"❌ No shard results found in {SHARD_RESULTS_DIR}")
+            sys.exit(1)
+        print_summary(results)
+        # Coûts de la prochaine répartition, à versionner avec les flux
+        save_shard_costs(sources_config.get('active_sources', []))
+        logger.info(f"📦 Shard costs in {SHARD_COSTS_FILE} (commit it so every shard reads the same costs)")
+        if not args.no_merge and has_feeds(results):
+            run_merge(args.config, merge_config)
+        run_query_feeds(search_config, websub_config, merge_config.get('link'))
+        notify_hubs_if_immediate(websub_config)
+        exit_with_status(results)
+
     # Déterminer les sources à traiter
     if args.source:
         # Source spécifique
@@ -144,63 +657,70 @@ def main():
         sources_to_process = sources_config.get('active_sources', [])
         logger.info(f"📌 Processing {len(sources_to_process)} active sources")
 
+    if args.shard:
+        try:
+            sources_to_process = shard_sources(sources_to_process, args.shard)
+        except ValueError as e:
+            logger.error(f"❌ {e}")
+            sys.exit(1)
+
     if not sources_to_process:
         logger.error("❌ No sources to process")
         sys.exit(1)
 
-    # Traiter chaque source
-    results: Dict[str, bool] = {}
-    successful_count = 0
+    # Nettoyer les profils navigateur des sources qui ne sont plus scrapées
+    prune_stale_profiles()
 
-    for source_name in sources_to_process:
-        success = process_source(source_name)
-        results[source_name] = success
-        if success:
-            successful_count += 1
+    # Traiter chaque source
+    network_mode = RECORD if args.record else REPLAY if args.replay else None
+    if network_mode:
+        logger.info(f"📼 Network mode: {network_mode} (archives in {ARCHIVES_DIR}/)")
+    profile_dir = profiling_run_dir() if args.profile else None
+    if profile_dir:
+        logger.info(f"⏱️  Profiling enabled (artifacts in {profile_dir}/)")
+    budget = None
+    if deadline:
+        budget = DeadlineBudget(sources_to_process, deadline - (time.monotonic() - deadline_start),
+                                args.workers, sources_config.get('scheduling', {}))
+        logger.info(f"⏱️  Deadline {deadline:.0f}s, processing order: {plan_summary(budget)}")
+        results = run_sources_with_deadline(budget, sources_config, args.workers, args.log_level,
+                                            network_mode, profile_dir)
+        results = {source_name: results[source_name] for source_name in sources_to_process}
+    else:
+        results = run_sources(sources_to_process, sources_config, args.workers, args.log_level,
+                              network_mode, profile_dir)
 
     # Afficher le résumé
-    logger.info("")
-    logger.info("=" * 60)
-    logger.info("📊 Summary")
-    logger.info("=" * 60)
-
-    for source_name, success in results.items():
-        status = "✅ Success" if success else "❌ Failed"
-        logger.info(f"  {source_name}: {status}")
-
-    logger.info(f"\n  Total: {successful_count}/{len(sources_to_process)} successful")
+    print_summary(results)
+    if budget:
+        print_skipped(budget)
+    if profile_dir:
+        print_profile_summary(profile_dir)
+
+    # Replay : les flux sont dans .cache/replay/output, rien n'est publié
+    if network_mode == REPLAY:
+        logger.info(f"\n📼 Replay feeds written to {REPLAY_OUTPUT_DIR}/ (merge, query feeds and hubs skipped)")
+        exit_with_status(results)
+
+    # Shard : la fusion est faite une seule fois par --reduce
+    if args.shard:
+        index, total = parse_shard(args.shard)
+        save_shard_results(index, total, results)
+        logger.info("\n📦 Shard results saved, run --reduce to merge")
+        exit_with_status(results)
 
     # Fusion des flux (si activée)
-    if not args.no_merge and successful_count > 0:
-        merge_config = sources_config.get('merge', {})
-        if merge_config.get('enabled', False):
-            logger.info("")
-            logger.info("=" * 60)
-            logger.info("🔀 Merging RSS feeds")
-            logger.info("=" * 60)
+    if not args.no_merge and has_feeds(results):
+        run_merge(args.config, merge_config)
 
-            try:
-                success = merge_from_sources_config(args.config)
-                if success:
-                    output_file = merge_config.get('output_file', 'merged_feed.xml')
-                    logger.info(f"✅ Merged feed generated: output/{output_file}")
-                else:
-                    logger.error("❌ Failed to merge feeds")
-            except Exception as e:
-                logger.error(f"❌ Error during merge: {e}", exc_info=True)
-        else:
-            logger.info("\n⏭️  Merge is disabled in configuration")
+    # Flux des requêtes enregistrées
+    run_query_feeds(search_config, websub_config, merge_config.get('link'))
+
+    # Notifications WebSub des flux modifiés
+    notify_hubs_if_immediate(websub_config)
 
     # Code de sortie
-    if successful_count == 0:
-        logger.error("\n❌ All sources failed")
-        sys.exit(1)
-    elif successful_count < len(sources_to_process):
-        logger.warning(f"\n⚠️  Some sources failed ({len(sources_to_process) - successful_count})")
-        sys.exit(0)  # Ne pas échouer si au moins une source a réussi
-    else:
-        logger.info("\n✅ All feeds generated successfully!")
-        sys.exit(0)
+    exit_with_status(results)
 
 
 if __name__ == "__main__":
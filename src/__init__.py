@@ -5,13 +5,33 @@ Configuration over Code - Fail Gracefully - Document Everything
 
 __version__ = "1.0.0"
 
-from .scraper import scrape_source, GenericScraper
+from .models import Article
+from .scraper import scrape_source, scrape_source_async, GenericScraper
 from .rss_generator import generate_rss, generate_rss_from_config, RSSGenerator
 from .merger import merge_feeds, merge_from_sources_config, RSSMerger
-from .utils import load_yaml_config, make_absolute_url, setup_logging
+from .pipeline import (process_source_async, run_feeds_async, run_exit_code, SourceResult, RunResult,
+                       SUCCESS, DEGRADED, FAILED, SKIPPED)
+from .selector_health import SelectorHealth, selector_health_report
+from .circuit_breaker import CircuitBreaker
+from .snapshots import save_snapshot, load_snapshot
+from .browser_profile import prune_stale_profiles
+from .api_engine import ApiExtractor, json_path
+from .feed_sources import FeedIngester, DeadlineExceeded
+from .run_stats import record_run, load_run_stats
+from .scheduler import (
+    parse_shard, shard_sources, assign_shards, order_by_cost, load_shard_costs, save_shard_costs, SHARD_COSTS_FILE,
+    parse_duration, order_by_value, DeadlineBudget, plan_summary
+)
+from .search import ArticleIndex, index_source_articles, generate_query_feeds
+from .archives import RECORD, REPLAY, ARCHIVES_DIR, REPLAY_OUTPUT_DIR
+from .websub import write_feed_if_changed, flush_notifications, notify_hub
+from .profiling import SourceProfiler, profiling_run_dir, write_profile_summary
+from .utils import load_yaml_config, make_absolute_url, setup_logging, load_json_state, save_json_state
 
 __all__ = [
+    'Article',
     'scrape_source',
+    'scrape_source_async',
     'GenericScraper',
     'generate_rss',
     'generate_rss_from_config',
@@ -19,7 +39,54 @@ __all__ = [
     'merge_feeds',
     'merge_from_sources_config',
     'RSSMerger',
+    'process_source_async',
+    'run_feeds_async',
+    'SourceResult',
+    'RunResult',
+    'run_exit_code',
+    'SUCCESS',
+    'DEGRADED',
+    'FAILED',
+    'SKIPPED',
+    'SelectorHealth',
+    'selector_health_report',
+    'CircuitBreaker',
+    'save_snapshot',
+    'load_snapshot',
+    'prune_stale_profiles',
+    'ApiExtractor',
+    'json_path',
+    'FeedIngester',
+    'DeadlineExceeded',
+    'record_run',
+    'load_run_stats',
+    'parse_shard',
+    'shard_sources',
+    'load_shard_costs',
+    'save_shard_costs',
+    'SHARD_COSTS_FILE',
+    'assign_shards',
+    'order_by_cost',
+    'parse_duration',
+    'order_by_value',
+    'DeadlineBudget',
+    'plan_summary',
+    'ArticleIndex',
+    'index_source_articles',
+    'generate_query_feeds',
+    'RECORD',
+    'REPLAY',
+    'ARCHIVES_DIR',
+    'REPLAY_OUTPUT_DIR',
+    'write_feed_if_changed',
+    'flush_notifications',
+    'notify_hub',
+    'SourceProfiler',
+    'profiling_run_dir',
+    'write_profile_summary',
     'load_yaml_config',
     'make_absolute_url',
     'setup_logging',
+    'load_json_state',
+    'save_json_state',
 ]
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Moteur d'extraction par API (engine: api)
+Extrait les articles directement depuis les réponses JSON chargées par la page,
+sans attendre leur rendu dans le DOM ni parcourir de sélecteurs CSS
+"""
+import re
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+_PATH_TOKEN = re.compile(r"\.([A-Za-z_$][\w$-]*)|\.\*|\[(\*|-?\d+|'[^']*'|\"[^\"]*\")\]")
+
+
+def parse_json_path(path: str) -> List[Union[str, int]]:
+    """
+    Découpe une expression de type JSONPath en étapes
+
+    Syntaxe supportée : `$`, `.clé`, `['clé']`, `[0]`, `[-1]`, `[*]` et `.*`.
+    Un chemin sans `$` initial est relatif (ex: `author.name`).
+
+    Args:
+        path: Expression à découper
+
+    Returns:
+        Liste d'étapes : nom de clé, index entier ou '*'
+
+    Raises:
+        ValueError: Si l'expression est invalide
+    """
+    expression = path.strip()
+    if expression.startswith('$'):
+        expression = expression[1:]
+    elif expression and not expression.startswith(('.', '[')):
+        expression = '.' + expression
+
+    steps: List[Union[str, int]] = []
+    position = 0
+    while position < len(expression):
+        match = _PATH_TOKEN.match(expression, position)
+        if not match:
+            raise ValueError(f"Invalid JSON path '{path}' at position {position}")
+        key, bracket = match.groups()
+        if key is not None:
+            steps.append(key)
+        elif bracket is None or bracket == '*':
+            steps.append('*')
+        elif bracket[0] in '\'"':
+            steps.append(bracket[1:-1])
+        else:
+            steps.append(int(bracket))
+        position = match.end()
+
+    return steps
+
+
+def json_path(data: Any, path: str) -> List[Any]:
+    """
+    Évalue une expression de type JSONPath
+
+    Args:
+        data: Document JSON décodé
+        path: Expression (voir parse_json_path)
+
+    Returns:
+        Liste des valeurs trouvées (vide si aucune)
+    """
+    current = [data]
+    for step in parse_json_path(path):
+        following = []
+        for node in current:
+            if step == '*':
+                if isinstance(node, list):
+                    following.extend(node)
+                elif isinstance(node, dict):
+                    following.extend(node.values())
+            elif isinstance(step, int):
+                if isinstance(node, list) and -len(node) <= step < len(node):
+                    following.append(node[step])
+            elif isinstance(node, dict) and step in node:
+                following.append(node[step])
+        current = following
+
+    return current
+
+
+def json_path_first(data: Any, path: str) -> Optional[Any]:
+    """
+    Retourne la première valeur trouvée par une expression JSONPath
+
+    Args:
+        data: Document JSON décodé
+        path: Expression (voir parse_json_path)
+
+    Returns:
+        Première valeur non nulle, ou None
+    """
+    for value in json_path(data, path):
+        if value is not None and value != '':
+            return value
+    return None
+
+
+class ApiExtractor:
+    """
+    Transforme des réponses JSON en champs d'articles selon la section scraping.api
+    """
+
+    def __init__(self, api_config: Dict[str, Any]):
+        """
+        Initialise l'extracteur
+
+        Args:
+            api_config: Section scraping.api de la configuration
+
+        Raises:
+            ValueError: Si url_pattern est absent (toute réponse de la page, configuration
+                ou analytics compris, serait sinon prise pour l'API) ou si un chemin est invalide
+        """
+        self.api_config = api_config
+        if not api_config.get('url_pattern'):
+            raise ValueError("scraping.api.url_pattern is required with engine: api")
+        self.url_pattern = re.compile(api_config['url_pattern'])
+        self.items_path = api_config.get('items', '$[*]')
+        self.fields = api_config['fields']
+
+        # Valider les expressions dès le chargement plutôt qu'à chaque article
+        parse_json_path(self.items_path)
+        for field_config in self.fields.values():
+            parse_json_path(self._field_path(field_config))
+
+    @staticmethod
+    def _field_path(field_config: Union[str, Dict[str, Any]]) -> str:
+        """Chemin JSONPath d'un champ (forme courte ou objet {path, template})"""
+        if isinstance(field_config, dict):
+            return field_config['path']
+        return field_config
+
+    def matches(self, url: str) -> bool:
+        """
+        Indique si une URL de réponse réseau correspond à l'API de la source
+
+        Args:
+            url: URL de la réponse
+
+        Returns:
+            True si l'URL correspond à url_pattern
+        """
+        return bool(self.url_pattern.search(url))
+
+    def field_value(self, item: Any, field: str) -> Optional[str]:
+        """
+        Extrait la valeur d'un champ depuis un élément JSON
+
+        Args:
+            item: Élément JSON représentant un article
+            field: Nom du champ (title, link, date, description)
+
+        Returns:
+            Valeur sous forme de texte, ou None si absente
+        """
+        field_config = self.fields.get(field)
+        if field_config is None:
+            return None
+
+        value = json_path_first(item, self._field_path(field_config))
+        if value is None:
+            return None
+
+        # Timestamps numériques (secondes ou millisecondes)
+        if field == 'date' and isinstance(value, (int, float)):
+            seconds = value / 1000 if value > 1e11 else value
+            return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()
+
+        value = str(value).strip()
+        if isinstance(field_config, dict) and 'template' in field_config:
+            value = field_config['template'].format(value)
+
+        return value
+
+    def extract(self, payload: Any) -> List[Dict[str, Optional[str]]]:
+        """
+        Extrait les champs bruts de tous les articles d'une réponse JSON
+
+        Args:
+            payload: Réponse JSON décodée
+
+        Returns:
+            Liste de dictionnaires {title, link, date, description}
+        """
+        items = []
+        for item in json_path(payload, self.items_path):
+            items.append({
+                field: self.field_value(item, field)
+                for field in ('title', 'link', 'date', 'description')
+            })
+        return items
@@ -0,0 +1,47 @@
+"""
+Archives réseau pour le scraping hors ligne (--record / --replay)
+Une archive HAR par source pour les pages Playwright, des documents bruts pour les sitemaps et flux
+"""
+import hashlib
+from pathlib import Path
+
+# Répertoire des archives (versionnable : sert de jeu de tests figé)
+ARCHIVES_DIR = Path('archives')
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+# Flux générés en replay : jamais dans output/, qui est publié
+REPLAY_OUTPUT_DIR = Path('.cache') / 'replay' / 'output'
+
+
+def har_path(source_id: str, archives_dir: Path = ARCHIVES_DIR) -> Path:
+    """
+    Chemin de l'archive HAR d'une source
+
+    Le format .zip stocke les corps de réponse à part, ce qui garde l'archive compacte.
+
+    Args:
+        source_id: Identifiant de la source (nom du fichier de config)
+        archives_dir: Répertoire des archives
+
+    Returns:
+        Chemin de l'archive
+    """
+    return Path(archives_dir) / f"{source_id}.har.zip"
+
+
+def document_path(source_id: str, url: str, archives_dir: Path = ARCHIVES_DIR) -> Path:
+    """
+    Chemin de l'archive d'un document téléchargé sans navigateur (sitemap, flux)
+
+    Args:
+        source_id: Identifiant de la source
+        url: URL du document
+        archives_dir: Répertoire des archives
+
+    Returns:
+        Chemin de l'archive
+    """
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+    return Path(archives_dir) / source_id / f"{digest}.xml"
@@ -0,0 +1,136 @@
+"""
+Profils navigateur persistants par source
+Conservent le cache HTTP de Chromium et l'état de stockage (cookies, localStorage)
+d'une exécution à l'autre, avec des limites de taille pour éviter une croissance sans fin
+"""
+import shutil
+import time
+from typing import List
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Répertoire des profils (hors de state/ : ne doit pas être versionné)
+PROFILES_DIR = Path('.cache') / 'browser'
+
+# Sous-répertoires Chromium qui peuvent grossir indépendamment du cache HTTP
+_EVICTABLE_SUBDIRS = ('Service Worker', 'Code Cache', 'GPUCache', 'IndexedDB', 'File System')
+
+
+def profile_dir(source_id: str, profiles_dir: Path = PROFILES_DIR) -> Path:
+    """
+    Retourne le répertoire de profil d'une source
+
+    Args:
+        source_id: Identifiant de la source (nom du fichier de config)
+        profiles_dir: Répertoire racine des profils
+
+    Returns:
+        Chemin du profil (créé si nécessaire)
+    """
+    path = Path(profiles_dir) / source_id
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def directory_size(path: Path) -> int:
+    """
+    Calcule la taille totale d'un répertoire
+
+    Args:
+        path: Répertoire à mesurer
+
+    Returns:
+        Taille en octets
+    """
+    total = 0
+    for file in Path(path).rglob('*'):
+        try:
+            if file.is_file():
+                total += file.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def chromium_cache_args(profile: Path, cache_size_mb: int) -> List[str]:
+    """
+    Arguments Chromium pour un cache disque borné dans le profil
+
+    Chromium évince lui-même les entrées les moins récemment utilisées
+    quand le cache atteint la taille indiquée.
+
+    Args:
+        profile: Répertoire de profil de la source
+        cache_size_mb: Taille maximale du cache HTTP en Mo
+
+    Returns:
+        Liste d'arguments de ligne de commande
+    """
+    return [
+        f"--disk-cache-dir={profile / 'http-cache'}",
+        f"--disk-cache-size={cache_size_mb * 1024 * 1024}",
+    ]
+
+
+def enforce_profile_limit(profile: Path, max_profile_mb: int) -> None:
+    """
+    Ramène un profil sous sa taille maximale
+
+    Les données annexes (service workers, IndexedDB...) sont supprimées en premier ;
+    si le profil reste trop gros, il est réinitialisé entièrement.
+
+    Args:
+        profile: Répertoire de profil de la source
+        max_profile_mb: Taille maximale du profil en Mo
+    """
+    limit = max_profile_mb * 1024 * 1024
+    size = directory_size(profile)
+    if size <= limit:
+        return
+
+    logger.info(f"Browser profile {profile} is {size / 1024 / 1024:.1f} MB "
+                f"(limit {max_profile_mb} MB), evicting auxiliary data")
+    for subdir in list(profile.rglob('*')):
+        if subdir.is_dir() and subdir.name in _EVICTABLE_SUBDIRS:
+            shutil.rmtree(subdir, ignore_errors=True)
+
+    if directory_size(profile) > limit:
+        logger.warning(f"Browser profile {profile} still over limit, resetting it")
+        shutil.rmtree(profile, ignore_errors=True)
+        profile.mkdir(parents=True, exist_ok=True)
+
+
+def prune_stale_profiles(max_age_days: int = 30, profiles_dir: Path = PROFILES_DIR) -> List[str]:
+    """
+    Supprime les profils qui n'ont pas été utilisés depuis longtemps
+
+    Args:
+        max_age_days: Âge maximal d'un profil inutilisé, en jours
+        profiles_dir: Répertoire racine des profils
+
+    Returns:
+        Liste des identifiants de sources dont le profil a été supprimé
+    """
+    removed = []
+    root = Path(profiles_dir)
+    if not root.is_dir():
+        return removed
+
+    cutoff = time.time() - max_age_days * 86400
+    for profile in root.iterdir():
+        if profile.is_dir() and profile.stat().st_mtime < cutoff:
+            shutil.rmtree(profile, ignore_errors=True)
+            removed.append(profile.name)
+            logger.info(f"Removed stale browser profile: {profile.name}")
+
+    return removed
+
+
+def touch_profile(profile: Path) -> None:
+    """Marque un profil comme utilisé (pour prune_stale_profiles)"""
+    try:
+        profile.touch()
+    except OSError:
+        pass
@@ -0,0 +1,121 @@
+"""
+Disjoncteur par source
+Évite de payer le temps d'attente complet d'une source en panne à chaque exécution
+"""
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional
+from pathlib import Path
+import logging
+
+from .utils import STATE_DIR, load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur persistant d'une source
+
+    - closed : la source est scrapée normalement
+    - open : après N échecs consécutifs, la source est ignorée pendant le délai de refroidissement
+    - half_open : le délai est écoulé, une tentative de sonde est autorisée ;
+      un succès referme le disjoncteur, un échec le rouvre pour un nouveau délai
+    """
+
+    def __init__(self, source_id: str, failure_threshold: int = 3,
+                 cooldown_minutes: int = 360, state_dir: Path = STATE_DIR):
+        """
+        Initialise le disjoncteur d'une source
+
+        Args:
+            source_id: Identifiant de la source (nom du fichier de config)
+            failure_threshold: Nombre d'échecs consécutifs avant ouverture
+            cooldown_minutes: Durée pendant laquelle la source est ignorée une fois ouvert
+            state_dir: Répertoire de l'état persistant
+        """
+        self.source_id = source_id
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = timedelta(minutes=cooldown_minutes)
+        self.state_file = Path(state_dir) / 'circuits' / f"{source_id}.json"
+        self.state: Dict[str, Any] = load_json_state(self.state_file, {
+            'status': CLOSED,
+            'consecutive_failures': 0,
+            'opened_at': None,
+        })
+
+    @classmethod
+    def from_config(cls, source_id: str, breaker_config: Dict[str, Any]) -> Optional['CircuitBreaker']:
+        """
+        Construit un disjoncteur depuis la section circuit_breaker de sources.yaml
+
+        Args:
+            source_id: Identifiant de la source
+            breaker_config: Configuration du disjoncteur
+
+        Returns:
+            Instance CircuitBreaker, ou None si désactivé
+        """
+        if not breaker_config.get('enabled', True):
+            return None
+        return cls(
+            source_id,
+            failure_threshold=breaker_config.get('failure_threshold', 3),
+            cooldown_minutes=breaker_config.get('cooldown_minutes', 360),
+        )
+
+    @property
+    def status(self) -> str:
+        """Statut courant (closed, open ou half_open)"""
+        if self.state['status'] == OPEN and self._cooldown_elapsed():
+            return HALF_OPEN
+        return self.state['status']
+
+    def _cooldown_elapsed(self) -> bool:
+        """Indique si le délai de refroidissement est écoulé"""
+        opened_at = self.state.get('opened_at')
+        if not opened_at:
+            return True
+        return datetime.now(timezone.utc) >= datetime.fromisoformat(opened_at) + self.cooldown
+
+    def allow_request(self) -> bool:
+        """
+        Indique si la source doit être scrapée lors de cette exécution
+
+        Returns:
+            True si le disjoncteur est fermé ou si une sonde est autorisée
+        """
+        status = self.status
+        if status == HALF_OPEN:
+            logger.info(f"Circuit for {self.source_id} is half-open, probing source")
+        return status != OPEN
+
+    def record_success(self) -> None:
+        """Enregistre un scraping réussi et referme le disjoncteur"""
+        if self.state['status'] != CLOSED:
+            logger.info(f"Circuit for {self.source_id} closed after successful probe")
+        self.state = {'status': CLOSED, 'consecutive_failures': 0, 'opened_at': None}
+        self.save()
+
+    def record_failure(self) -> None:
+        """Enregistre un échec et ouvre le disjoncteur si le seuil est atteint"""
+        self.state['consecutive_failures'] += 1
+        was_open = self.state['status'] == OPEN
+
+        if was_open or self.state['consecutive_failures'] >= self.failure_threshold:
+            self.state['status'] = OPEN
+            self.state['opened_at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+            logger.warning(f"Circuit for {self.source_id} opened after "
+                           f"{self.state['consecutive_failures']} consecutive failures "
+                           f"(next probe in {self.cooldown})")
+        self.save()
+
+    def save(self) -> None:
+        """Persiste l'état du disjoncteur sur disque"""
+        try:
+            save_json_state(self.state_file, self.state)
+        except Exception as e:
+            logger.warning(f"Failed to save circuit state for {self.source_id}: {e}")
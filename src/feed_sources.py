@@ -0,0 +1,415 @@
+"""
+Sources sans navigateur : sitemaps et flux RSS/Atom existants
+Les documents sont lus en streaming (iterparse) sans être chargés entièrement en mémoire
+"""
+import gzip
+import heapq
+import io
+import re
+import time
+import urllib.parse
+import urllib.request
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Collection, BinaryIO
+from urllib.parse import urlparse, unquote
+import xml.etree.ElementTree as ET
+from dateutil import parser as date_parser
+import logging
+
+from .utils import make_absolute_url
+from .models import Article
+from .archives import RECORD, REPLAY, document_path
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (compatible; rss-feed-generator/1.0)'
+
+# Types de sources gérés par ce module (source.type)
+INGESTED_SOURCE_TYPES = ('sitemap', 'feed')
+
+# Nombre maximal d'URLs retenues depuis un sitemap (les plus récentes)
+DEFAULT_MAX_ITEMS = 100
+
+
+class DeadlineExceeded(Exception):
+    """L'ingestion a dépassé l'échéance fixée par le budget --deadline"""
+
+
+def local_name(tag: str) -> str:
+    """Nom d'une balise XML sans son espace de noms"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_elements(stream: BinaryIO, tags: Collection[str]) -> Iterator[ET.Element]:
+    """
+    Parcourt un document XML en streaming et retourne les éléments complets dont la balise est dans tags
+
+    Chaque élément est vidé et détaché de son parent dès que l'appelant passe au
+    suivant : la mémoire reste bornée par la taille d'un élément, quelle que
+    soit la taille du document.
+
+    Args:
+        stream: Document XML
+        tags: Noms des balises recherchées (sans espace de noms)
+
+    Yields:
+        Éléments complets, à lire avant de passer au suivant
+    """
+    parents: List[ET.Element] = []
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if local_name(element.tag) not in tags:
+            continue
+
+        yield element
+        element.clear()
+        if parents:
+            parents[-1].remove(element)
+
+
+def parse_feed_date(date_text: Optional[str]) -> Optional[datetime]:
+    """
+    Parse une date de sitemap ou de flux (RFC 822 pour RSS, ISO 8601 pour Atom/sitemap)
+
+    Args:
+        date_text: Texte de la date
+
+    Returns:
+        datetime avec timezone (UTC par défaut), ou None si illisible
+    """
+    if not date_text:
+        return None
+
+    date_text = date_text.strip()
+    parsed_date = None
+    try:
+        parsed_date = parsedate_to_datetime(date_text)
+    except (TypeError, ValueError):
+        try:
+            parsed_date = date_parser.parse(date_text)
+        except (ValueError, OverflowError):
+            logger.debug(f"Unparseable feed date: '{date_text}'")
+            return None
+
+    if parsed_date.tzinfo is None:
+        parsed_date = parsed_date.replace(tzinfo=timezone.utc)
+    return parsed_date
+
+
+def title_from_url(url: str) -> str:
+    """
+    Déduit un titre lisible du dernier segment d'une URL
+
+    Args:
+        url: URL de l'article (ex: https://example.com/blog/new-model-release)
+
+    Returns:
+        Titre (ex: "New model release")
+    """
+    slug = unquote(urlparse(url).path.rstrip('/').rsplit('/', 1)[-1])
+    slug = re.sub(r'\.\w+$', '', slug)
+    words = re.sub(r'[-_]+', ' ', slug).strip()
+    return words[:1].upper() + words[1:] if words else url
+
+
+class FeedIngester:
+    """
+    Ingestion d'une source de type sitemap ou feed, sans navigateur
+    """
+
+    def __init__(self, config: Dict[str, Any], source_id: Optional[str] = None,
+                 network_mode: Optional[str] = None, deadline: Optional[float] = None):
+        """
+        Initialise l'ingesteur
+
+        Args:
+            config: Configuration chargée depuis un fichier YAML
+            source_id: Identifiant de la source (nom du fichier de config)
+            network_mode: 'record' pour archiver les documents, 'replay' pour les relire hors ligne
+            deadline: Échéance de l'ingestion (horloge time.monotonic), ou None ; au-delà,
+                ingest() lève DeadlineExceeded (budget --deadline)
+        """
+        self.config = config
+        self.source_id = source_id or config['source']['name']
+        self.network_mode = network_mode
+        self.deadline = deadline
+        self.source_config = config['source']
+        self.source_type = self.source_config['type']
+        self.type_config = config.get(self.source_type, {})
+        self.timeout = self.type_config.get('timeout_seconds', 30)
+
+        include = self.type_config.get('include')
+        self.include = re.compile(include) if include else None
+
+        max_age_days = self.type_config.get('max_age_days')
+        self.cutoff = None
+        if max_age_days:
+            self.cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+
+    def remaining(self) -> float:
+        """
+        Temps restant avant l'échéance, en secondes
+
+        Returns:
+            Temps restant (infini sans échéance)
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée
+        """
+        if self.deadline is None:
+            return float('inf')
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"{self.source_id} exceeded its time budget")
+        return remaining
+
+    @contextmanager
+    def open_stream(self, url: str) -> Iterator[BinaryIO]:
+        """
+        Ouvre une URL en streaming, en décompressant le gzip si nécessaire
+
+        La réponse HTTP est fermée en sortie du bloc with, y compris quand elle
+        est lue au travers du décompresseur gzip.
+
+        Args:
+            url: URL du document XML
+
+        Yields:
+            Objet fichier lisible
+        """
+        archive = document_path(self.source_id, url)
+        if self.network_mode == REPLAY:
+            logger.info(f"Replaying {url} from {archive}")
+            with open(archive, 'rb') as stream:
+                yield stream
+            return
+
+        request = urllib.request.Request(url, headers={
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': 'gzip',
+        })
+        # Aucune lecture réseau ne peut bloquer au-delà de l'échéance
+        with urllib.request.urlopen(request, timeout=min(self.timeout, self.remaining())) as response:
+            stream = response
+            if url.endswith('.gz') or response.headers.get('Content-Encoding') == 'gzip':
+                stream = gzip.GzipFile(fileobj=response)
+
+            if self.network_mode == RECORD:
+                # L'archive doit être complète : le document est lu entièrement avant d'être parsé
+                content = stream.read()
+                archive.parent.mkdir(parents=True, exist_ok=True)
+                archive.write_bytes(content)
+                logger.info(f"Recorded {url} to {archive}")
+                stream = io.BytesIO(content)
+
+            with stream:
+                yield stream
+
+    def is_recent(self, date: Optional[datetime]) -> bool:
+        """Indique si une date passe le filtre max_age_days (les dates inconnues passent)"""
+        return self.cutoff is None or date is None or date >= self.cutoff
+
+    def build_article(self, title: str, link: str, date: Optional[datetime],
+                      description: Optional[str], document_url: Optional[str] = None) -> Article:
+        """
+        Construit un article (même format que GenericScraper)
+
+        Args:
+            title: Titre de l'article
+            link: Lien de l'article
+            date: Date de publication, ou None
+            description: Description, ou None
+            document_url: Sitemap ou flux d'où provient le lien (défaut : source.url)
+
+        Returns:
+            Article normalisé
+        """
+        url_handling = self.config.get('scraping', {}).get('url_handling', {})
+        if url_handling.get('make_absolute', True):
+            if 'base_url' in url_handling:
+                link = make_absolute_url(link, url_handling['base_url'])
+            else:
+                # Comme GenericScraper.build_article : résolution par rapport au document d'origine
+                link = urllib.parse.urljoin(document_url or self.source_config['url'], link)
+
+        return Article(
+            title=title,
+            link=link,
+            date=date,
+            source=self.source_config['name'],
+            description=description or title,
+            date_text=date.isoformat() if date else '',
+        )
+
+    def iter_sitemap(self, url: str,
+                     depth: int = 0) -> Iterator[Tuple[str, Optional[datetime], Optional[str], str]]:
+        """
+        Parcourt un sitemap (ou un index de sitemaps) en streaming
+
+        Args:
+            url: URL du sitemap
+            depth: Profondeur d'imbrication courante
+
+        Yields:
+            Tuples (loc, lastmod, titre news, URL du sitemap) pour chaque URL retenue
+        """
+        max_depth = self.type_config.get('max_depth', 2)
+        child_sitemaps = []
+
+        logger.info(f"Streaming sitemap: {url}")
+        with self.open_stream(url) as stream:
+            for element in iter_elements(stream, ('url', 'sitemap')):
+                self.remaining()  # Lève DeadlineExceeded à l'échéance
+                tag = local_name(element.tag)
+                loc = lastmod = news_title = None
+                for child in element.iter():
+                    child_tag = local_name(child.tag)
+                    if child_tag == 'loc' and loc is None:
+                        loc = (child.text or '').strip()
+                    elif child_tag == 'lastmod':
+                        lastmod = parse_feed_date(child.text)
+                    elif child_tag == 'publication_date' and lastmod is None:
+                        lastmod = parse_feed_date(child.text)
+                    elif child_tag == 'title' and 'news' in child.tag:
+                        news_title = (child.text or '').strip() or None
+
+                if not loc or not self.is_recent(lastmod):
+                    continue
+
+                if tag == 'sitemap':
+                    child_sitemaps.append(urllib.parse.urljoin(url, loc))
+                elif self.include is None or self.include.search(loc):
+                    yield loc, lastmod, news_title, url
+
+        # Index de sitemaps : parcourir les sitemaps enfants (filtrés par lastmod ci-dessus)
+        if depth >= max_depth and child_sitemaps:
+            logger.warning(f"Sitemap index {url} nested too deep, ignoring {len(child_sitemaps)} child sitemaps")
+            return
+        for child_url in child_sitemaps[:self.type_config.get('max_sitemaps', 20)]:
+            try:
+                yield from self.iter_sitemap(child_url, depth + 1)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to read child sitemap {child_url}: {e}")
+
+    def ingest_sitemap(self) -> List[Article]:
+        """
+        Construit les articles depuis un sitemap
+
+        Seules les max_items URLs les plus récentes sont retenues. Les URLs sans
+        date (qui recevraient la date de l'exécution et remonteraient en tête du
+        flux fusionné à chaque fois) sont ignorées dès que le sitemap en contient
+        de datées ; sinon, les max_items premières sont retenues.
+
+        Returns:
+            Liste d'articles
+        """
+        max_items = self.type_config.get('max_items', DEFAULT_MAX_ITEMS)
+        # Tas des URLs datées les plus récentes : la mémoire reste bornée par max_items
+        dated: List[Tuple[datetime, str, int, Optional[str], str]] = []
+        undated: List[Tuple[str, Optional[str], str]] = []
+        undated_count = 0
+
+        for position, (loc, lastmod, news_title, sitemap_url) in enumerate(
+                self.iter_sitemap(self.source_config['url'])):
+            if lastmod is None:
+                undated_count += 1
+                if len(undated) < max_items:
+                    undated.append((loc, news_title, sitemap_url))
+                continue
+            # La position départage une même URL listée deux fois avec la même date
+            entry = (lastmod, loc, -position, news_title, sitemap_url)
+            if len(dated) < max_items:
+                heapq.heappush(dated, entry)
+            else:
+                heapq.heappushpop(dated, entry)
+
+        if dated:
+            if undated_count:
+                logger.info(f"Ignoring {undated_count} sitemap URLs without lastmod")
+            return [self.build_article(news_title or title_from_url(loc), loc, lastmod, None, sitemap_url)
+                    for lastmod, loc, _, news_title, sitemap_url in sorted(dated, reverse=True)]
+
+        if undated_count > len(undated):
+            logger.info(f"Sitemap has no dates, keeping the first {len(undated)} of {undated_count} URLs")
+        return [self.build_article(news_title or title_from_url(loc), loc, None, None, sitemap_url)
+                for loc, news_title, sitemap_url in undated]
+
+    def ingest_feed(self) -> List[Article]:
+        """
+        Construit les articles depuis un flux RSS 2.0 ou Atom existant
+
+        Returns:
+            Liste d'articles
+        """
+        articles = []
+        url = self.source_config['url']
+
+        logger.info(f"Streaming feed: {url}")
+        with self.open_stream(url) as stream:
+            for element in iter_elements(stream, ('item', 'entry')):
+                self.remaining()  # Lève DeadlineExceeded à l'échéance
+                title = link = description = None
+                date = None
+                for child in element:
+                    child_tag = local_name(child.tag)
+                    if child_tag == 'title':
+                        title = (child.text or '').strip()
+                    elif child_tag == 'link':
+                        # RSS : texte ; Atom : attribut href (rel="alternate" par défaut)
+                        if child.get('href') and child.get('rel', 'alternate') == 'alternate':
+                            link = child.get('href')
+                        elif child.text and child.text.strip():
+                            link = child.text.strip()
+                    elif child_tag in ('pubDate', 'published', 'date') or (child_tag == 'updated' and date is None):
+                        date = parse_feed_date(child.text) or date
+                    elif child_tag in ('description', 'summary') or (child_tag == 'content' and description is None):
+                        description = (child.text or '').strip() or description
+
+                if not title or not link:
+                    continue
+                if not self.is_recent(date):
+                    continue
+                if self.include is not None and not self.include.search(link):
+                    continue
+
+                articles.append(self.build_article(title, link, date, description, url))
+
+        return articles
+
+    def ingest(self) -> List[Article]:
+        """
+        Ingère la source selon son type
+
+        Returns:
+            Liste d'articles triés par date (plus récent en premier)
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée (y compris par un délai réseau
+                raccourci pour la tenir) ; les autres erreurs donnent une liste vide
+        """
+        articles_data = []
+        try:
+            if self.source_type == 'sitemap':
+                articles_data = self.ingest_sitemap()
+            else:
+                articles_data = self.ingest_feed()
+
+            articles_data.sort(key=lambda x: x.date, reverse=True)
+            logger.info(f"Successfully ingested {len(articles_data)} articles from {self.source_config['name']}")
+
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                raise DeadlineExceeded(f"{self.source_id} exceeded its time budget") from e
+            logger.error(f"Error during {self.source_type} ingestion: {e}", exc_info=True)
+
+        return articles_data
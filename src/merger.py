@@ -2,14 +2,16 @@
 Fusionneur de flux RSS multiples
 Combine plusieurs flux RSS en un seul flux unifié
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 from feedgen.feed import FeedGenerator
-from datetime import datetime
+from email.utils import parsedate_to_datetime
 import xml.etree.ElementTree as ET
 import logging
 
 from .utils import load_yaml_config
+from .models import Article
+from .websub import apply_websub, write_feed_if_changed, queue_notification
 
 logger = logging.getLogger(__name__)
 
@@ -19,16 +21,18 @@ class RSSMerger:
     Fusionne plusieurs flux RSS en un seul
     """
 
-    def __init__(self, merge_config: Dict[str, Any]):
+    def __init__(self, merge_config: Dict[str, Any], websub_config: Optional[Dict[str, Any]] = None):
         """
         Initialise le fusionneur
 
         Args:
             merge_config: Configuration de la fusion depuis sources.yaml
+            websub_config: Section websub de sources.yaml (optionnel)
         """
         self.merge_config = merge_config
+        self.websub_config = websub_config or {}
 
-    def parse_rss_file(self, rss_file: str) -> List[Dict[str, Any]]:
+    def parse_rss_file(self, rss_file: str) -> List[Article]:
         """
         Parse un fichier RSS et extrait les articles
 
@@ -74,24 +78,23 @@ class RSSMerger:
                     title = title_elem.text or ""
                     link = link_elem.text or ""
 
-                    # Parser la date
+                    # Parser la date (format RFC 822 utilisé dans RSS)
                     pub_date = None
                     if pubdate_elem is not None and pubdate_elem.text:
                         try:
-                            # Format RFC 822 utilisé dans RSS
-                            from email.utils import parsedate_to_datetime
                             pub_date = parsedate_to_datetime(pubdate_elem.text)
                         except Exception as e:
                             logger.debug(f"Failed to parse date '{pubdate_elem.text}': {e}")
 
-                    article = {
-                        'title': title,
-                        'link': link,
-                        'date': pub_date or datetime.now(),
-                        'description': description_elem.text if description_elem is not None else title,
-                        'guid': guid_elem.text if guid_elem is not None else link,
-                        'source': source_name
-                    }
+                    # Sans date, Article utilise l'heure courante (toujours avec timezone)
+                    article = Article(
+                        title=title,
+                        link=link,
+                        date=pub_date,
+                        source=source_name,
+                        description=(description_elem.text if description_elem is not None else None) or title,
+                        guid=(guid_elem.text if guid_elem is not None else None) or link,
+                    )
 
                     articles.append(article)
 
@@ -106,7 +109,7 @@ class RSSMerger:
 
         return articles
 
-    def merge_feeds(self, rss_files: List[str]) -> List[Dict[str, Any]]:
+    def merge_feeds(self, rss_files: List[str]) -> List[Article]:
         """
         Fusionne plusieurs fichiers RSS
 
@@ -124,7 +127,16 @@ class RSSMerger:
 
         # Trier par date si configuré
         if self.merge_config.get('sort_by_date', True):
-            all_articles.sort(key=lambda x: x['date'], reverse=True)
+            all_articles.sort(key=lambda x: x.date, reverse=True)
+
+        # Un même article publié par plusieurs sources n'apparaît qu'une fois
+        seen = set()
+        unique_articles = []
+        for article in all_articles:
+            if article.guid not in seen:
+                seen.add(article.guid)
+                unique_articles.append(article)
+        all_articles = unique_articles
 
         # Limiter le nombre d'articles
         max_items = self.merge_config.get('max_items', 100)
@@ -134,7 +146,7 @@ class RSSMerger:
 
         return all_articles
 
-    def create_merged_feed(self, articles: List[Dict[str, Any]], output_file: str) -> bool:
+    def create_merged_feed(self, articles: List[Article], output_file: str) -> bool:
         """
         Crée le flux RSS fusionné
 
@@ -162,31 +174,34 @@ class RSSMerger:
                     entry = feed.add_entry()
 
                     # Titre avec préfixe optionnel
-                    title = article['title']
-                    if add_prefix and 'source' in article:
-                        title = f"[{article['source']}] {title}"
+                    title = article.title
+                    if add_prefix and article.source:
+                        title = f"[{article.source}] {title}"
 
                     entry.title(title)
-                    entry.link(href=article['link'])
-                    entry.pubDate(article['date'])
-                    entry.description(article['description'])
-                    entry.guid(article['guid'], permalink=True)
+                    entry.link(href=article.link)
+                    entry.pubDate(article.date)
+                    entry.description(article.description)
+                    entry.guid(article.guid, permalink=True)
 
                 except Exception as e:
                     logger.error(f"Error adding article to merged feed: {e}")
                     continue
 
+            # Annoncer le hub WebSub (si activé)
+            apply_websub(feed, self.websub_config, output_file)
+
             # Générer le XML
             rss_content = feed.rss_str(pretty=True)
 
-            # Écrire le fichier
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'wb') as f:
-                f.write(rss_content)
+            # Écrire le fichier, seulement si le contenu a changé
+            changed = write_feed_if_changed(Path(output_file), rss_content)
+            queue_notification(self.websub_config, output_file, changed)
 
-            logger.info(f"Merged RSS feed generated successfully: {output_file}")
+            if changed:
+                logger.info(f"Merged RSS feed generated successfully: {output_file}")
+            else:
+                logger.info(f"Merged RSS feed unchanged: {output_file}")
             return True
 
         except Exception as e:
@@ -194,7 +209,8 @@ class RSSMerger:
             return False
 
 
-def merge_feeds(source_files: List[str], config: Dict[str, Any], output_file: str) -> bool:
+def merge_feeds(source_files: List[str], config: Dict[str, Any], output_file: str,
+                websub_config: Optional[Dict[str, Any]] = None) -> bool:
     """
     Fonction principale pour fusionner des flux RSS
 
@@ -202,12 +218,13 @@ def merge_feeds(source_files: List[str], config: Dict[str, Any], output_file: st
         source_files: Liste des fichiers RSS à fusionner
         config: Configuration de la fusion
         output_file: Chemin du fichier de sortie
+        websub_config: Section websub de sources.yaml (optionnel)
 
     Returns:
         True si succès, False sinon
     """
     try:
-        merger = RSSMerger(config)
+        merger = RSSMerger(config, websub_config)
         articles = merger.merge_feeds(source_files)
         return merger.create_merged_feed(articles, output_file)
     except Exception as e:
@@ -258,7 +275,7 @@ def merge_from_sources_config(sources_config_file: str = "config/sources.yaml")
 
         # Fusionner
         output_file = Path('output') / merge_config.get('output_file', 'merged_feed.xml')
-        return merge_feeds(rss_files, merge_config, str(output_file))
+        return merge_feeds(rss_files, merge_config, str(output_file), config.get('websub', {}))
 
     except Exception as e:
         logger.error(f"Failed to merge from sources config: {e}", exc_info=True)
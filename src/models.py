@@ -0,0 +1,101 @@
+"""
+Modèle d'article partagé par tout le pipeline
+(scraping → génération RSS → fusion → instantanés)
+"""
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+
+def aware_datetime(value: Optional[datetime]) -> datetime:
+    """
+    Normalise une date en datetime avec timezone
+
+    Args:
+        value: Date éventuellement naïve, ou None
+
+    Returns:
+        datetime avec timezone (UTC si absente ; maintenant si None)
+    """
+    if value is None:
+        return datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class Article:
+    """
+    Article normalisé, immuable
+
+    La date est toujours "aware" (avec timezone), ce qui permet de trier
+    sans erreur des articles venant de sources différentes. Le nom de la
+    source est internalisé : toutes les instances d'une même source
+    partagent la même chaîne.
+    """
+
+    title: str
+    link: str
+    date: datetime
+    source: str
+    description: str = ''
+    date_text: str = ''
+    guid: str = ''
+    author: Optional[str] = None
+
+    def __post_init__(self):
+        # frozen=True : les normalisations passent par object.__setattr__
+        object.__setattr__(self, 'date', aware_datetime(self.date))
+        object.__setattr__(self, 'source', sys.intern(self.source))
+        if not self.description:
+            object.__setattr__(self, 'description', self.title)
+        if not self.guid:
+            object.__setattr__(self, 'guid', self.link)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Article':
+        """
+        Construit un article depuis un dictionnaire (instantané JSON, ancien format)
+
+        Args:
+            data: Dictionnaire avec au moins title, link et source ; date en datetime ou ISO 8601
+
+        Returns:
+            Article normalisé
+        """
+        date = data.get('date')
+        if isinstance(date, str):
+            date = datetime.fromisoformat(date)
+
+        return cls(
+            title=data['title'],
+            link=data['link'],
+            date=date,
+            source=data.get('source', ''),
+            description=data.get('description') or '',
+            date_text=data.get('date_text') or '',
+            guid=data.get('guid') or '',
+            author=data.get('author'),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Sérialise l'article en dictionnaire compatible JSON (date ISO 8601)
+
+        Returns:
+            Dictionnaire de l'article
+        """
+        data = {
+            'title': self.title,
+            'link': self.link,
+            'date': self.date.isoformat(),
+            'source': self.source,
+            'description': self.description,
+            'date_text': self.date_text,
+            'guid': self.guid,
+        }
+        if self.author:
+            data['author'] = self.author
+        return data
@@ -0,0 +1,339 @@
+"""
+Pipeline asynchrone : scraping + génération des flux, intégrable dans une boucle asyncio existante
+Usage:
+    result = await run_feeds_async(browser=browser)
+    if not result.ok: ...
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+import logging
+
+from playwright.async_api import Browser, BrowserContext
+
+from .models import Article
+from .scraper import scrape_source_async
+from .feed_sources import DeadlineExceeded
+from .rss_generator import generate_rss_from_config
+from .merger import merge_from_sources_config
+from .circuit_breaker import CircuitBreaker
+from .snapshots import save_snapshot, load_snapshot
+from .run_stats import record_run
+from .search import index_source_articles, generate_query_feeds
+from .archives import REPLAY, REPLAY_OUTPUT_DIR
+from .utils import load_yaml_config, run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Issue du traitement d'une source
+SUCCESS = 'success'    # Scrapée, flux régénéré
+DEGRADED = 'degraded'  # Source en panne ou disjoncteur ouvert : flux servi depuis l'instantané
+FAILED = 'failed'      # Aucun flux généré
+SKIPPED = 'skipped'    # Non traitée pour tenir le budget --deadline : le flux précédent reste publié
+
+
+def run_exit_code(statuses: List[str]) -> int:
+    """
+    Code de sortie d'une exécution, partagé par generate_feeds.py et RunResult
+
+    Les sources dégradées ou en échec ne font pas échouer l'exécution tant
+    qu'au moins une source a été scrapée ; sans aucune source, elle échoue.
+    Les sources ignorées pour tenir le budget ne comptent pas : une exécution
+    qui les a toutes ignorées réussit (les flux précédents restent publiés).
+
+    Args:
+        statuses: Issue du traitement de chaque source
+
+    Returns:
+        0 si au moins une source a réussi ou si toutes ont été ignorées, 1 sinon
+    """
+    attempted = [status for status in statuses if status != SKIPPED]
+    if statuses and not attempted:
+        return 0
+    return 0 if SUCCESS in attempted else 1
+
+
+@dataclass
+class SourceResult:
+    """
+    Résultat du traitement d'une source
+    """
+
+    source: str
+    success: bool
+    articles: List[Article] = field(default_factory=list)
+    output_file: Optional[Path] = None
+    from_snapshot: bool = False
+    error: Optional[str] = None
+    duration: float = 0.0
+    new_articles: Optional[int] = None
+    timed_out: bool = False
+
+    @property
+    def status(self) -> str:
+        """Issue du traitement : SUCCESS, DEGRADED ou FAILED"""
+        if not self.success:
+            return FAILED
+        return DEGRADED if self.from_snapshot else SUCCESS
+
+
+@dataclass
+class RunResult:
+    """
+    Résultat d'une exécution complète (remplace le code de sortie du script)
+    """
+
+    sources: Dict[str, SourceResult] = field(default_factory=dict)
+    merged: Optional[bool] = None
+    query_feeds: Dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True si l'exécution réussit selon la règle du script (au moins une source scrapée)"""
+        return self.exit_code == 0
+
+    @property
+    def failed(self) -> List[str]:
+        """Sources sans flux généré"""
+        return [name for name, result in self.sources.items() if not result.success]
+
+    @property
+    def exit_code(self) -> int:
+        """Code de sortie équivalent de generate_feeds.py"""
+        return run_exit_code([result.status for result in self.sources.values()])
+
+
+# Répertoire des flux publiés
+OUTPUT_DIR = Path('output')
+
+
+def output_path(config: Dict[str, Any], output_dir: Path = OUTPUT_DIR) -> Path:
+    """Chemin du flux d'une source (output/ par défaut)"""
+    return Path(output_dir) / config['rss']['output_file']
+
+
+def publish_articles(source_name: str, config_file: str, articles: List[Article],
+                     search_config: Dict[str, Any], websub_config: Dict[str, Any],
+                     replay: bool = False) -> bool:
+    """
+    Persiste un lot d'articles scrapés : instantané, index de recherche et flux RSS
+
+    Args:
+        source_name: Nom de la source
+        config_file: Chemin vers le fichier de configuration de la source
+        articles: Articles scrapés
+        search_config: Section search de sources.yaml
+        websub_config: Section websub de sources.yaml
+        replay: True pour un replay : ni instantané ni index, flux écrit dans REPLAY_OUTPUT_DIR
+
+    Returns:
+        True si le flux a été généré
+    """
+    if replay:
+        logger.info(f"  📝 Generating RSS feed in {REPLAY_OUTPUT_DIR}/ (replay)...")
+        return generate_rss_from_config(config_file, articles, output_dir=REPLAY_OUTPUT_DIR)
+
+    save_snapshot(source_name, articles)
+    index_source_articles(source_name, articles, search_config)
+
+    logger.info(f"  📝 Generating RSS feed...")
+    return generate_rss_from_config(config_file, articles, websub_config)
+
+
+async def serve_snapshot_async(source_name: str, config_file: str,
+                               websub_config: Optional[Dict[str, Any]] = None,
+                               inline: bool = False) -> SourceResult:
+    """
+    Régénère le flux d'une source depuis son dernier instantané valide
+
+    Args:
+        source_name: Nom de la source (ex: 'mistral')
+        config_file: Chemin vers le fichier de configuration de la source
+        websub_config: Section websub de sources.yaml
+        inline: True pour rester dans le thread courant (exécution profilée)
+
+    Returns:
+        Résultat de la source (from_snapshot=True si un instantané a été servi)
+    """
+    articles = await run_blocking(load_snapshot, source_name, inline=inline)
+    if not articles:
+        logger.warning(f"  ⚠️  No snapshot available for {source_name}")
+        return SourceResult(source_name, False, error='no articles and no snapshot')
+
+    logger.info(f"  ♻️  Serving last good snapshot ({len(articles)} articles)")
+    success = await run_blocking(generate_rss_from_config, config_file, articles, websub_config, inline=inline)
+    return SourceResult(source_name, success, articles, from_snapshot=True,
+                        error=None if success else 'failed to generate RSS feed from snapshot')
+
+
+async def process_source_async(source_name: str, sources_config: Optional[Dict[str, Any]] = None,
+                               browser: Optional[Browser] = None, context: Optional[BrowserContext] = None,
+                               network_mode: Optional[str] = None, trace_dir: Optional[Path] = None,
+                               record_history: bool = True, wait_scale: float = 1.0,
+                               timeout: Optional[float] = None) -> SourceResult:
+    """
+    Traite une source RSS : scraping + génération du flux, en tenant compte du disjoncteur
+
+    Args:
+        source_name: Nom de la source (ex: 'mistral')
+        sources_config: Configuration centrale (sources.yaml), pour le disjoncteur, l'index de recherche et WebSub
+        browser: Navigateur à réutiliser (optionnel)
+        context: Contexte de navigation à réutiliser (optionnel, prioritaire sur browser)
+        network_mode: 'record' pour archiver le trafic, 'replay' pour scraper depuis l'archive
+        trace_dir: Répertoire des traces Playwright (--profile), ou None ; si défini, tout
+            le traitement reste dans le thread courant pour être vu par le profileur
+        record_history: False pour ne pas mettre à jour l'historique de durée (exécution profilée)
+        wait_scale: Facteur appliqué aux délais d'attente de la page (budget --deadline)
+        timeout: Durée maximale du scraping en secondes ; au-delà, il est annulé (ou, pour
+            un flux ou un sitemap, arrêté par l'ingesteur) et l'instantané est servi (budget --deadline)
+
+    Returns:
+        Résultat de la source
+    """
+    config_file = f"config/{source_name}.yaml"
+    if not Path(config_file).exists():
+        logger.error(f"❌ Configuration file not found: {config_file}")
+        return SourceResult(source_name, False, error=f"configuration file not found: {config_file}")
+
+    sources_config = sources_config or {}
+    replay = network_mode == REPLAY
+    # E/S bloquantes (état du disjoncteur, historique, configuration) hors de la boucle, sauf si profilé
+    inline = trace_dir is not None
+
+    search_config = {} if replay else sources_config.get('search', {})
+    websub_config = {} if replay else sources_config.get('websub', {})
+
+    start = time.monotonic()
+    scraped = False
+    try:
+        logger.info(f"📥 Processing source: {source_name}")
+
+        # Un replay rejoue une archive figée : il ne doit modifier aucun état persistant
+        breaker = None if replay else await run_blocking(
+            CircuitBreaker.from_config, source_name, sources_config.get('circuit_breaker', {}), inline=inline)
+
+        # 0. Source en panne : ne pas payer le temps d'attente, servir l'instantané
+        if breaker and not await run_blocking(breaker.allow_request, inline=inline):
+            logger.warning(f"  ⏸️  Circuit open for {source_name}, skipping scrape")
+            result = await serve_snapshot_async(source_name, config_file, websub_config, inline)
+
+        else:
+            # 1. Scraper les articles
+            logger.info(f"  🔍 Scraping {source_name}...")
+            scraped = True
+            timed_out = False
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            try:
+                articles = await asyncio.wait_for(
+                    scrape_source_async(config_file, network_mode, trace_dir, browser, context, wait_scale,
+                                        deadline),
+                    timeout=timeout,
+                )
+            except (asyncio.TimeoutError, DeadlineExceeded):
+                logger.warning(f"  ⏱️  Scraping {source_name} exceeded its time budget ({timeout:.0f}s)")
+                articles, timed_out = [], True
+
+            if timed_out and replay:
+                result = SourceResult(source_name, False, error='replay exceeded its time budget', timed_out=True)
+
+            elif timed_out:
+                # Le dépassement vient du budget de l'exécution, pas de la source : pas d'échec enregistré
+                result = await serve_snapshot_async(source_name, config_file, websub_config, inline)
+                result.timed_out = True
+
+            elif not articles:
+                logger.warning(f"  ⚠️  No articles found for {source_name}")
+                if replay:
+                    result = SourceResult(source_name, False, error='no articles found in archive')
+                else:
+                    if breaker:
+                        await run_blocking(breaker.record_failure, inline=inline)
+                    result = await serve_snapshot_async(source_name, config_file, websub_config, inline)
+
+            else:
+                logger.info(f"  ✓ Found {len(articles)} articles")
+                if breaker:
+                    await run_blocking(breaker.record_success, inline=inline)
+
+                if not replay:
+                    previous = await run_blocking(load_snapshot, source_name, inline=inline)
+                    previous_links = {article.link for article in previous}
+                    new_articles = sum(1 for article in articles if article.link not in previous_links)
+                else:
+                    new_articles = None
+
+                # 2. Persister et générer le flux RSS (E/S bloquantes, hors de la boucle sauf si profilé)
+                success = await run_blocking(publish_articles, source_name, config_file, articles,
+                                             search_config, websub_config, replay, inline=inline)
+                result = SourceResult(source_name, success, articles, new_articles=new_articles,
+                                      error=None if success else 'failed to generate RSS feed')
+
+        if result.success:
+            config = await run_blocking(load_yaml_config, config_file, inline=inline)
+            result.output_file = output_path(config, REPLAY_OUTPUT_DIR if replay else OUTPUT_DIR)
+            logger.info(f"  ✅ RSS feed generated: {result.output_file}")
+        else:
+            logger.error(f"  ❌ Failed to generate RSS feed for {source_name}")
+
+    except Exception as e:
+        logger.error(f"  ❌ Error processing {source_name}: {e}", exc_info=True)
+        result = SourceResult(source_name, False, error=str(e))
+
+    result.duration = time.monotonic() - start
+    # Une durée tronquée par le budget sous-estimerait le coût réel de la source, et
+    # servir l'instantané d'un disjoncteur ouvert ne dit rien de son coût
+    if record_history and not replay and scraped and not result.timed_out:
+        await run_blocking(record_run, source_name, result.duration, result.success, result.new_articles,
+                           inline=inline)
+    return result
+
+
+async def run_feeds_async(sources: Optional[List[str]] = None, config_file: str = "config/sources.yaml",
+                          browser: Optional[Browser] = None, context: Optional[BrowserContext] = None,
+                          concurrency: int = 1, merge: bool = True,
+                          network_mode: Optional[str] = None) -> RunResult:
+    """
+    Génère les flux de plusieurs sources, puis le flux fusionné et les flux de requêtes
+
+    Les sources partagent le navigateur ou le contexte fourni (une page chacune) ;
+    sans navigateur fourni, chaque source lance le sien. En replay, seuls les flux
+    des sources sont générés (dans REPLAY_OUTPUT_DIR) : ni fusion ni flux de requêtes.
+
+    Args:
+        sources: Sources à traiter (défaut : active_sources de sources.yaml)
+        config_file: Chemin vers sources.yaml
+        browser: Navigateur à réutiliser (optionnel)
+        context: Contexte de navigation à réutiliser (optionnel, prioritaire sur browser)
+        concurrency: Nombre de sources traitées simultanément
+        merge: False pour ne pas générer le flux fusionné
+        network_mode: 'record' ou 'replay' (voir archives.py)
+
+    Returns:
+        Résultat de l'exécution
+    """
+    sources_config = await run_blocking(load_yaml_config, config_file)
+    if sources is None:
+        sources = sources_config.get('active_sources', [])
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(source_name: str) -> SourceResult:
+        async with semaphore:
+            return await process_source_async(source_name, sources_config, browser, context, network_mode)
+
+    source_results = await asyncio.gather(*(run_one(source_name) for source_name in sources))
+    result = RunResult(sources={source_result.source: source_result for source_result in source_results})
+    if network_mode == REPLAY:
+        return result
+
+    if merge and sources_config.get('merge', {}).get('enabled', False) and any(
+            source_result.success for source_result in source_results):
+        result.merged = await run_blocking(merge_from_sources_config, config_file)
+
+    result.query_feeds = await run_blocking(
+        generate_query_feeds, sources_config.get('search', {}), sources_config.get('websub', {}),
+        sources_config.get('merge', {}).get('link')
+    )
+    return result
@@ -0,0 +1,212 @@
+"""
+Profilage des sources (--profile)
+Profil cProfile du pipeline Python, trace Playwright de la page et temps réseau, par source
+"""
+import cProfile
+import pstats
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+import logging
+
+from .utils import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+# Répertoire des artefacts de profilage (un sous-répertoire par exécution)
+PROFILING_DIR = Path('profiling')
+
+
+def profiling_run_dir(base_dir: Path = PROFILING_DIR) -> Path:
+    """
+    Crée le répertoire des artefacts d'une exécution (horodaté)
+
+    Args:
+        base_dir: Répertoire racine du profilage
+
+    Returns:
+        Chemin du répertoire créé
+    """
+    run_dir = Path(base_dir) / datetime.now().strftime('%Y%m%d-%H%M%S')
+    run_dir.mkdir(parents=True, exist_ok=True)
+    return run_dir
+
+
+def trace_path(output_dir: Path, source_id: str) -> Path:
+    """Chemin de la trace Playwright d'une source (à ouvrir avec `playwright show-trace`)"""
+    return Path(output_dir) / f"{source_id}.trace.zip"
+
+
+def network_log_path(output_dir: Path, source_id: str) -> Path:
+    """Chemin du journal des requêtes réseau d'une source"""
+    return Path(output_dir) / f"{source_id}.network.json"
+
+
+class SourceProfiler:
+    """
+    Profileur déterministe (cProfile) du pipeline d'une source
+
+    Usage:
+        with SourceProfiler('mistral', run_dir):
+            process(...)
+    """
+
+    def __init__(self, source_id: str, output_dir: Path):
+        """
+        Args:
+            source_id: Identifiant de la source
+            output_dir: Répertoire des artefacts de l'exécution
+        """
+        self.source_id = source_id
+        self.output_dir = Path(output_dir)
+        self.profile = cProfile.Profile()
+        self.start = 0.0
+
+    def __enter__(self) -> 'SourceProfiler':
+        self.start = time.perf_counter()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.profile.disable()
+        wall_time = time.perf_counter() - self.start
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.profile.dump_stats(str(self.output_dir / f"{self.source_id}.prof"))
+            save_json_state(self.output_dir / f"{self.source_id}.meta.json",
+                            {'source': self.source_id, 'wall_time': round(wall_time, 3)})
+        except Exception as e:
+            logger.warning(f"Failed to save profile for {self.source_id}: {e}")
+
+
+class NetworkRecorder:
+    """
+    Enregistre la durée des requêtes d'un contexte Playwright
+    """
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+
+    def attach(self, context: Any) -> None:
+        """
+        Écoute les requêtes terminées (ou échouées) du contexte
+
+        Args:
+            context: BrowserContext Playwright
+        """
+        context.on('requestfinished', lambda request: self.record(request, failed=False))
+        context.on('requestfailed', lambda request: self.record(request, failed=True))
+
+    def record(self, request: Any, failed: bool) -> None:
+        """
+        Mémorise une requête et sa durée (timing Playwright, en millisecondes)
+
+        Args:
+            request: Request Playwright
+            failed: True si la requête a échoué
+        """
+        timing = request.timing
+        response_end = timing.get('responseEnd', -1)
+        self.requests.append({
+            'url': request.url,
+            'method': request.method,
+            'resource_type': request.resource_type,
+            'duration_ms': round(response_end, 1) if response_end >= 0 else None,
+            'failed': failed,
+        })
+
+    def save(self, path: Path) -> None:
+        """Écrit le journal des requêtes"""
+        try:
+            save_json_state(path, self.requests)
+        except Exception as e:
+            logger.warning(f"Failed to save network log {path}: {e}")
+
+
+def hottest_functions(profile_files: List[Path], limit: int) -> List[Dict[str, Any]]:
+    """
+    Fonctions les plus coûteuses, tous profils confondus
+
+    Args:
+        profile_files: Fichiers .prof à agréger
+        limit: Nombre de fonctions à retourner
+
+    Returns:
+        Fonctions triées par temps propre (hors appels), décroissant
+    """
+    if not profile_files:
+        return []
+
+    stats = pstats.Stats(*[str(path) for path in profile_files])
+    functions = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        location = name if filename == '~' else f"{name} ({Path(filename).name}:{line})"
+        functions.append({'function': location, 'ncalls': ncalls, 'tottime': tottime, 'cumtime': cumtime})
+
+    functions.sort(key=lambda f: f['tottime'], reverse=True)
+    return functions[:limit]
+
+
+def slowest_requests(output_dir: Path, limit: int) -> List[Dict[str, Any]]:
+    """
+    Requêtes réseau les plus lentes, toutes sources confondues
+
+    Args:
+        output_dir: Répertoire des artefacts de l'exécution
+        limit: Nombre de requêtes à retourner
+
+    Returns:
+        Requêtes triées par durée décroissante, avec leur source
+    """
+    requests = []
+    for path in Path(output_dir).glob('*.network.json'):
+        source_id = path.name[:-len('.network.json')]
+        for request in load_json_state(path, []):
+            if request.get('duration_ms') is not None:
+                requests.append({**request, 'source': source_id})
+
+    requests.sort(key=lambda r: r['duration_ms'], reverse=True)
+    return requests[:limit]
+
+
+def write_profile_summary(output_dir: Path, top_functions: int = 25, top_requests: int = 15) -> Optional[Path]:
+    """
+    Écrit le résumé classé d'une exécution profilée (summary.txt)
+
+    Args:
+        output_dir: Répertoire des artefacts de l'exécution
+        top_functions: Nombre de fonctions à lister
+        top_requests: Nombre de requêtes à lister
+
+    Returns:
+        Chemin du résumé, ou None si aucun profil n'a été produit
+    """
+    output_dir = Path(output_dir)
+    profile_files = sorted(output_dir.glob('*.prof'))
+    if not profile_files:
+        return None
+
+    timings = [load_json_state(path, {}) for path in output_dir.glob('*.meta.json')]
+    timings.sort(key=lambda t: t.get('wall_time', 0), reverse=True)
+
+    lines = ["Sources (wall time)"]
+    for timing in timings:
+        lines.append(f"  {timing.get('wall_time', 0):8.2f}s  {timing.get('source')}")
+
+    lines += ["", f"Hottest Python functions (self time, top {top_functions})",
+              f"  {'tottime':>8}  {'cumtime':>8}  {'ncalls':>8}  function"]
+    for function in hottest_functions(profile_files, top_functions):
+        lines.append(f"  {function['tottime']:8.3f}  {function['cumtime']:8.3f}  "
+                     f"{function['ncalls']:8d}  {function['function']}")
+
+    lines += ["", f"Slowest network requests (top {top_requests})"]
+    for request in slowest_requests(output_dir, top_requests):
+        status = ' FAILED' if request['failed'] else ''
+        lines.append(f"  {request['duration_ms']:8.1f}ms  [{request['source']}] "
+                     f"{request['resource_type']:<10} {request['method']} {request['url']}{status}")
+
+    summary_path = output_dir / 'summary.txt'
+    summary_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return summary_path
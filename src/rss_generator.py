@@ -1,12 +1,14 @@
 """
 Générateur de flux RSS à partir de données d'articles
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 from feedgen.feed import FeedGenerator
 import logging
 
 from .utils import load_yaml_config
+from .models import Article
+from .websub import apply_websub, write_feed_if_changed, queue_notification
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ class RSSGenerator:
         self.config = config
         self.source_config = config.get('source', {})
         self.rss_config = config.get('rss', {})
+        self.websub_config = config.get('websub', {})
 
     def create_feed(self) -> FeedGenerator:
         """
@@ -47,7 +50,7 @@ class RSSGenerator:
 
         return feed
 
-    def add_articles(self, feed: FeedGenerator, articles: List[Dict[str, Any]]) -> None:
+    def add_articles(self, feed: FeedGenerator, articles: List[Article]) -> None:
         """
         Ajoute les articles au flux RSS
 
@@ -62,32 +65,31 @@ class RSSGenerator:
                 entry = feed.add_entry()
 
                 # Titre
-                entry.title(article['title'])
+                entry.title(article.title)
 
                 # Lien
-                entry.link(href=article['link'])
+                entry.link(href=article.link)
 
                 # Date de publication
-                entry.pubDate(article['date'])
+                entry.pubDate(article.date)
 
                 # Description
-                description = article.get('description', article['title'])
-                entry.description(description)
+                entry.description(article.description)
 
                 # GUID (identifiant unique) basé sur l'URL
-                entry.guid(article['link'], permalink=True)
+                entry.guid(article.guid, permalink=True)
 
                 # Auteur (optionnel)
-                if 'author' in article:
-                    entry.author(name=article['author'])
+                if article.author:
+                    entry.author(name=article.author)
 
             except Exception as e:
-                logger.error(f"Error adding article '{article.get('title', 'unknown')}' to feed: {e}")
+                logger.error(f"Error adding article '{article.title}' to feed: {e}")
                 continue
 
         logger.info(f"Added {min(len(articles), max_items)} articles to feed")
 
-    def generate(self, articles: List[Dict[str, Any]], output_file: str) -> bool:
+    def generate(self, articles: List[Article], output_file: str) -> bool:
         """
         Génère le fichier RSS complet
 
@@ -105,17 +107,20 @@ class RSSGenerator:
             # Ajouter les articles
             self.add_articles(feed, articles)
 
+            # Annoncer le hub WebSub (si activé)
+            apply_websub(feed, self.websub_config, output_file)
+
             # Générer le XML
             rss_content = feed.rss_str(pretty=True)
 
-            # Écrire dans le fichier
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'wb') as f:
-                f.write(rss_content)
+            # Écrire dans le fichier, seulement si le contenu a changé
+            changed = write_feed_if_changed(Path(output_file), rss_content)
+            queue_notification(self.websub_config, output_file, changed)
 
-            logger.info(f"RSS feed generated successfully: {output_file}")
+            if changed:
+                logger.info(f"RSS feed generated successfully: {output_file}")
+            else:
+                logger.info(f"RSS feed unchanged: {output_file}")
             return True
 
         except Exception as e:
@@ -123,7 +128,7 @@ class RSSGenerator:
             return False
 
 
-def generate_rss(articles: List[Dict[str, Any]], config: Dict[str, Any], output_file: str) -> bool:
+def generate_rss(articles: List[Article], config: Dict[str, Any], output_file: str) -> bool:
     """
     Fonction principale pour générer un flux RSS
 
@@ -143,20 +148,26 @@ def generate_rss(articles: List[Dict[str, Any]], config: Dict[str, Any], output_
         return False
 
 
-def generate_rss_from_config(config_file: str, articles: List[Dict[str, Any]]) -> bool:
+def generate_rss_from_config(config_file: str, articles: List[Article],
+                             websub_config: Optional[Dict[str, Any]] = None,
+                             output_dir: Path = Path('output')) -> bool:
     """
     Génère un flux RSS depuis un fichier de configuration
 
     Args:
         config_file: Chemin vers le fichier de configuration YAML
         articles: Liste des articles à inclure
+        websub_config: Section websub de sources.yaml (optionnel)
+        output_dir: Répertoire de sortie (défaut: output/)
 
     Returns:
         True si succès, False sinon
     """
     try:
         config = load_yaml_config(config_file)
-        output_file = Path('output') / config['rss']['output_file']
+        if websub_config:
+            config = {**config, 'websub': websub_config}
+        output_file = Path(output_dir) / config['rss']['output_file']
         return generate_rss(articles, config, str(output_file))
     except Exception as e:
         logger.error(f"Failed to generate RSS from config {config_file}: {e}", exc_info=True)
@@ -0,0 +1,85 @@
+"""
+Historique d'exécution par source
+Durées observées, utilisées pour répartir et ordonnancer les sources
+"""
+import time
+from typing import Dict, Any, Optional
+from pathlib import Path
+import logging
+
+from .utils import STATE_DIR, load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+# Poids de la dernière mesure dans la moyenne mobile exponentielle
+EWMA_ALPHA = 0.3
+
+# Coût supposé d'une source jamais exécutée (secondes)
+DEFAULT_SOURCE_COST = 10.0
+
+# Fréquence de changement supposée d'une source sans historique (la traiter comme fraîche)
+DEFAULT_CHANGE_RATE = 1.0
+
+
+def _stats_file(source_id: str, state_dir: Path) -> Path:
+    """Chemin du fichier d'historique d'une source"""
+    return Path(state_dir) / 'runs' / f"{source_id}.json"
+
+
+def load_run_stats(source_id: str, state_dir: Path = STATE_DIR) -> Dict[str, Any]:
+    """
+    Charge l'historique d'exécution d'une source
+
+    Args:
+        source_id: Identifiant de la source (nom du fichier de config)
+        state_dir: Répertoire de l'état persistant
+
+    Returns:
+        Dictionnaire d'historique (vide si la source n'a jamais été exécutée)
+    """
+    return load_json_state(_stats_file(source_id, state_dir), {})
+
+
+def record_run(source_id: str, duration: float, success: bool, new_articles: Optional[int] = None,
+               state_dir: Path = STATE_DIR) -> Dict[str, Any]:
+    """
+    Enregistre la durée d'une exécution de source
+
+    Un fichier par source, afin que plusieurs processus puissent écrire en parallèle.
+
+    Args:
+        source_id: Identifiant de la source
+        duration: Durée de traitement en secondes
+        success: True si un flux a été généré
+        new_articles: Nombre d'articles absents du lot précédent (None si inconnu, ex: instantané servi)
+        state_dir: Répertoire de l'état persistant
+
+    Returns:
+        Historique mis à jour
+    """
+    stats = load_run_stats(source_id, state_dir)
+    previous = stats.get('avg_duration')
+    stats['avg_duration'] = duration if previous is None else EWMA_ALPHA * duration + (1 - EWMA_ALPHA) * previous
+    stats['last_duration'] = duration
+    stats['last_run'] = time.time()
+    stats['runs'] = stats.get('runs', 0) + 1
+    if success:
+        stats['last_success'] = stats['last_run']
+
+    # Fréquence de changement : part (lissée) des exécutions ayant apporté des articles nouveaux
+    if new_articles is not None:
+        changed = 1.0 if new_articles > 0 else 0.0
+        previous_rate = stats.get('change_rate')
+        stats['change_rate'] = changed if previous_rate is None else (
+            EWMA_ALPHA * changed + (1 - EWMA_ALPHA) * previous_rate
+        )
+        if new_articles > 0:
+            stats['last_change'] = stats['last_run']
+
+    try:
+        save_json_state(_stats_file(source_id, state_dir), stats)
+    except Exception as e:
+        logger.warning(f"Failed to save run stats for {source_id}: {e}")
+
+    return stats
+
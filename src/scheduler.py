@@ -0,0 +1,332 @@
+"""
+Répartition des sources entre shards et processus, et budget de temps d'une exécution (--deadline)
+"""
+import hashlib
+import re
+import time
+from statistics import median
+from typing import List, Dict, Tuple, Optional, Any
+from pathlib import Path
+import logging
+
+from .utils import STATE_DIR, load_json_state, save_json_state
+from .run_stats import load_run_stats, DEFAULT_SOURCE_COST, DEFAULT_CHANGE_RATE
+
+logger = logging.getLogger(__name__)
+
+# Coûts utilisés pour répartir les shards : versionné, donc identique pour tous les
+# runners d'une même exécution (contrairement à state/, propre à chaque runner)
+SHARD_COSTS_FILE = Path('shard_costs.json')
+
+# Les coûts y sont arrondis : le fichier (et la répartition) ne change qu'avec une évolution notable
+SHARD_COST_STEP = 5.0
+
+# Durée maximale minimale d'une source sous budget : absorbe le démarrage du navigateur
+MIN_SOURCE_TIMEOUT = 10.0
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """
+    Parse une spécification de shard "i/n" (i commence à 1)
+
+    Args:
+        shard: Spécification, ex: "2/4"
+
+    Returns:
+        Tuple (index, total)
+
+    Raises:
+        ValueError: Si la spécification est invalide
+    """
+    try:
+        index_text, total_text = shard.split('/')
+        index, total = int(index_text), int(total_text)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{shard}', expected i/n (ex: 1/4)")
+
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{shard}', index must be between 1 and {max(total, 1)}")
+
+    return index, total
+
+
+def source_costs(sources: List[str], state_dir: Path = STATE_DIR) -> Dict[str, float]:
+    """
+    Coût estimé de chaque source d'après son historique
+
+    Les sources sans historique reçoivent la médiane des coûts connus.
+
+    Args:
+        sources: Identifiants des sources
+        state_dir: Répertoire de l'état persistant
+
+    Returns:
+        Dictionnaire source → durée estimée en secondes
+    """
+    known = {}
+    for source in sources:
+        avg_duration = load_run_stats(source, state_dir).get('avg_duration')
+        if avg_duration is not None:
+            known[source] = avg_duration
+
+    default = median(known.values()) if known else DEFAULT_SOURCE_COST
+    return {source: known.get(source, default) for source in sources}
+
+
+def stable_hash(source: str) -> str:
+    """Empreinte d'un nom de source, identique d'un processus et d'un runner à l'autre (contrairement à hash())"""
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def load_shard_costs(sources: List[str], costs_file: Path = SHARD_COSTS_FILE) -> Dict[str, float]:
+    """
+    Coût de chaque source pour la répartition en shards, lu depuis le fichier versionné
+
+    Les sources absentes du fichier reçoivent la médiane des coûts connus.
+
+    Args:
+        sources: Identifiants des sources
+        costs_file: Fichier des coûts (voir save_shard_costs)
+
+    Returns:
+        Dictionnaire source → durée estimée en secondes
+    """
+    stored = load_json_state(costs_file, {})
+    known = {source: float(stored[source]) for source in sources if source in stored}
+    default = median(known.values()) if known else DEFAULT_SOURCE_COST
+    return {source: known.get(source, default) for source in sources}
+
+
+def save_shard_costs(sources: List[str], state_dir: Path = STATE_DIR,
+                     costs_file: Path = SHARD_COSTS_FILE) -> Dict[str, float]:
+    """
+    Met à jour le fichier des coûts de shards depuis l'historique des exécutions (--reduce)
+
+    Args:
+        sources: Sources actives
+        state_dir: Répertoire de l'état persistant (historique state/runs)
+        costs_file: Fichier des coûts
+
+    Returns:
+        Coûts arrondis écrits dans le fichier
+    """
+    costs = source_costs(sources, state_dir)
+    rounded = {source: max(SHARD_COST_STEP, round(costs[source] / SHARD_COST_STEP) * SHARD_COST_STEP)
+               for source in sorted(set(sources))}
+    # Ne réécrire le fichier que s'il change : pas de commit sans évolution
+    if load_json_state(costs_file, {}) != rounded:
+        save_json_state(costs_file, rounded)
+        logger.info(f"Updated shard costs in {costs_file}")
+    return rounded
+
+
+def assign_shards(sources: List[str], total: int, costs: Optional[Dict[str, float]] = None) -> List[List[str]]:
+    """
+    Répartit les sources en shards de charge équilibrée
+
+    Plus longue d'abord (LPT) : les sources sont prises par coût décroissant et
+    chacune rejoint le shard le moins chargé. Les égalités sont départagées par
+    l'empreinte du nom puis par l'indice du shard : la répartition ne dépend que
+    des sources, des coûts et du nombre de shards. Sans coûts, les shards ne
+    diffèrent pas de plus d'une source.
+
+    Args:
+        sources: Identifiants des sources
+        total: Nombre de shards
+        costs: Coût de chaque source (voir load_shard_costs), DEFAULT_SOURCE_COST par défaut
+
+    Returns:
+        Liste de shards, chacun étant une liste de sources
+    """
+    costs = costs or {}
+    shards: List[List[str]] = [[] for _ in range(total)]
+    loads = [0.0] * total
+
+    for source in sorted(set(sources), key=lambda s: (-costs.get(s, DEFAULT_SOURCE_COST), stable_hash(s), s)):
+        target = min(range(total), key=lambda i: (loads[i], len(shards[i]), i))
+        shards[target].append(source)
+        loads[target] += costs.get(source, DEFAULT_SOURCE_COST)
+    return shards
+
+
+def shard_sources(sources: List[str], shard: str, costs_file: Path = SHARD_COSTS_FILE) -> List[str]:
+    """
+    Sélectionne les sources d'un shard
+
+    Les coûts viennent du fichier versionné, jamais de state/ : tous les runners
+    d'une exécution calculent la même répartition.
+
+    Args:
+        sources: Toutes les sources actives
+        shard: Spécification "i/n"
+        costs_file: Fichier des coûts de shards
+
+    Returns:
+        Sources attribuées au shard, dans l'ordre de la configuration
+    """
+    index, total = parse_shard(shard)
+    costs = load_shard_costs(sources, costs_file)
+    selected = set(assign_shards(sources, total, costs)[index - 1])
+
+    load = sum(costs[s] for s in selected)
+    logger.info(f"Shard {index}/{total}: {len(selected)} sources, estimated {load:.0f}s")
+    return [s for s in sources if s in selected]
+
+
+def order_by_cost(sources: List[str], state_dir: Path = STATE_DIR) -> List[str]:
+    """
+    Ordonne les sources de la plus coûteuse à la moins coûteuse
+
+    Soumettre les sources longues en premier à un pool de processus
+    évite qu'une source lente démarre en dernier et allonge toute l'exécution.
+
+    Args:
+        sources: Identifiants des sources
+        state_dir: Répertoire de l'état persistant
+
+    Returns:
+        Sources triées par coût décroissant
+    """
+    costs = source_costs(sources, state_dir)
+    return sorted(sources, key=lambda s: (-costs[s], s))
+
+
+def parse_duration(duration: str) -> float:
+    """
+    Parse une durée ("90", "90s", "25m", "1h")
+
+    Args:
+        duration: Durée, en secondes si aucune unité n'est précisée
+
+    Returns:
+        Durée en secondes
+
+    Raises:
+        ValueError: Si la durée est invalide
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*', duration)
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"Invalid duration '{duration}', expected a positive number of seconds or 25m, 1h...")
+
+    return float(match.group(1)) * {'': 1, 's': 1, 'm': 60, 'h': 3600}[match.group(2)]
+
+
+def order_by_value(sources: List[str], costs: Dict[str, float], priorities: Optional[Dict[str, float]] = None,
+                   state_dir: Path = STATE_DIR) -> List[str]:
+    """
+    Ordonne les sources par valeur décroissante : priorité x fréquence de changement / coût
+
+    Une source qui publie souvent et se scrape vite passe en premier ; une source
+    lente qui change rarement passe en dernier (et sera la première sacrifiée).
+
+    Args:
+        sources: Identifiants des sources
+        costs: Coût estimé de chaque source
+        priorities: Poids par source (défaut 1)
+        state_dir: Répertoire de l'état persistant
+
+    Returns:
+        Sources triées par valeur décroissante
+    """
+    priorities = priorities or {}
+
+    def value(source: str) -> float:
+        change_rate = load_run_stats(source, state_dir).get('change_rate', DEFAULT_CHANGE_RATE)
+        # Plancher : une source qui n'a pas changé récemment garde une chance d'être traitée
+        return priorities.get(source, 1.0) * max(change_rate, 0.05) / max(costs[source], 0.1)
+
+    values = {source: value(source) for source in sources}
+    return sorted(sources, key=lambda s: (-values[s], s))
+
+
+class DeadlineBudget:
+    """
+    Budget de temps d'une exécution
+
+    Les sources sont traitées par valeur décroissante. Avant chaque source, le temps
+    restant est comparé au coût estimé des sources en attente : s'il ne suffit plus,
+    les délais d'attente sont réduits (jusqu'à min_wait_scale), puis les sources
+    les moins utiles sont ignorées, leur flux précédent restant en place. Chaque
+    source est interrompue au-delà de sa part (coût réduit x timeout_slack), sans
+    jamais empiéter sur le temps réservé aux sources en attente.
+    """
+
+    def __init__(self, sources: List[str], deadline: float, workers: int = 1,
+                 scheduling_config: Optional[Dict[str, Any]] = None, state_dir: Path = STATE_DIR):
+        """
+        Args:
+            sources: Sources à traiter
+            deadline: Durée totale allouée à l'exécution, en secondes
+            workers: Nombre de sources traitées en parallèle
+            scheduling_config: Section scheduling de sources.yaml (priorities, reserve_seconds,
+                min_wait_scale, timeout_slack)
+            state_dir: Répertoire de l'état persistant
+        """
+        scheduling_config = scheduling_config or {}
+        self.workers = max(1, workers)
+        # Temps gardé pour la fusion, les flux de requêtes et la publication
+        self.reserve = float(scheduling_config.get('reserve_seconds', 60))
+        self.min_wait_scale = float(scheduling_config.get('min_wait_scale', 0.25))
+        # Marge accordée à une source au-delà de son coût estimé (réduit) avant de l'interrompre
+        self.timeout_slack = float(scheduling_config.get('timeout_slack', 2.0))
+        self.deadline_at = time.monotonic() + deadline
+
+        self.costs = source_costs(sources, state_dir)
+        self.order = order_by_value(sources, self.costs, scheduling_config.get('priorities'), state_dir)
+        self.pending = list(self.order)
+        self.skipped: Dict[str, str] = {}
+
+    def remaining(self) -> float:
+        """Temps restant avant la fin du budget des sources (réserve déduite), en secondes"""
+        return self.deadline_at - self.reserve - time.monotonic()
+
+    def allocate(self, source: str) -> Optional[Tuple[float, float]]:
+        """
+        Attribue son budget à la prochaine source (la retire de la file d'attente)
+
+        Args:
+            source: Source sur le point d'être traitée (tête de self.pending)
+
+        Returns:
+            Tuple (facteur des délais d'attente, durée maximale en secondes),
+            ou None si la source doit être ignorée
+        """
+        self.pending.remove(source)
+        remaining = self.remaining()
+        cost = self.costs[source]
+
+        if remaining < cost * self.min_wait_scale:
+            self.skipped[source] = f"needs ~{cost:.0f}s, {max(remaining, 0):.0f}s left"
+            return None
+
+        # Capacité restante (en secondes-processus). Les sources en attente qui tiennent
+        # encore dans le budget, par ordre de valeur, y gardent au moins leur coût réduit ;
+        # le reste revient à la source courante, la plus utile : les délais ne
+        # rétrécissent qu'à mesure que le budget s'épuise.
+        capacity = remaining * self.workers
+        reserved = cost * self.min_wait_scale
+        for other in self.pending:
+            if reserved + self.costs[other] * self.min_wait_scale > capacity:
+                break
+            reserved += self.costs[other] * self.min_wait_scale
+
+        available = capacity - (reserved - cost * self.min_wait_scale)
+        wait_scale = max(self.min_wait_scale, min(1.0, available / cost))
+
+        # Durée maximale : la part de la source (avec marge), dans la limite de ce que
+        # les sources en attente lui laissent
+        share = max(cost * wait_scale * self.timeout_slack, MIN_SOURCE_TIMEOUT)
+        return wait_scale, min(share, available, remaining)
+
+
+def plan_summary(budget: DeadlineBudget) -> str:
+    """
+    Résumé lisible du plan d'une exécution sous budget
+
+    Args:
+        budget: Budget de l'exécution
+
+    Returns:
+        Ordre de traitement avec le coût estimé de chaque source
+    """
+    return ', '.join(f"{source} (~{budget.costs[source]:.0f}s)" for source in budget.order)
@@ -3,33 +3,110 @@ Scraper générique piloté par configuration YAML
 Utilise Playwright pour extraire les articles de n'importe quel site web
 """
 import asyncio
+import time
+import urllib.parse
+from functools import partial
+from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Page
+from typing import List, Dict, Any, Optional, Tuple
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, APIRequestContext
 from dateutil import parser as date_parser
 import logging
 
-from .utils import load_yaml_config, make_absolute_url, get_selector_value
+from .utils import (
+    STATE_DIR, load_yaml_config, make_absolute_url, get_selector_value,
+    load_json_state, save_json_state, run_blocking
+)
+from .api_engine import ApiExtractor
+from .feed_sources import FeedIngester, DeadlineExceeded, INGESTED_SOURCE_TYPES
+from .models import Article
+from .archives import RECORD, REPLAY, har_path
+from .selector_health import SelectorHealth
+from .browser_profile import profile_dir, chromium_cache_args, enforce_profile_limit, touch_profile
+from .profiling import NetworkRecorder, trace_path, network_log_path
 
 logger = logging.getLogger(__name__)
 
+# Délai de chargement d'une page (ms, défaut de Playwright), réduit comme wait_time sous budget
+NAVIGATION_TIMEOUT = 30000
+
 
 class GenericScraper:
     """
     Scraper générique configurable via YAML
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], source_id: Optional[str] = None,
+                 network_mode: Optional[str] = None, trace_dir: Optional[Path] = None,
+                 wait_scale: float = 1.0, deadline: Optional[float] = None):
         """
         Initialise le scraper avec une configuration
 
         Args:
             config: Configuration chargée depuis un fichier YAML
+            source_id: Identifiant de la source (nom du fichier de config), utilisé pour l'état persistant
+            network_mode: 'record' pour archiver le trafic réseau, 'replay' pour le rejouer hors ligne
+            trace_dir: Si défini, trace Playwright et temps réseau de la page y sont écrits (--profile)
+            wait_scale: Facteur appliqué aux délais d'attente (< 1 quand le budget --deadline s'épuise)
+            deadline: Échéance de la source (horloge time.monotonic), qui borne le chargement des pages
         """
         self.config = config
         self.source_config = config['source']
         self.scraping_config = config['scraping']
-        self.selectors = self.scraping_config['selectors']
+        if wait_scale < 1.0:
+            wait_time = int(self.scraping_config.get('wait_time', 3000) * wait_scale)
+            logger.info(f"Reducing wait time to {wait_time}ms (x{wait_scale:.2f}) to meet the run deadline")
+            self.scraping_config = {**self.scraping_config, 'wait_time': wait_time}
+        self.wait_scale = wait_scale
+        self.deadline = deadline
+        self.selectors = self.scraping_config.get('selectors', {})
+        self.source_id = source_id or self.source_config['name']
+        self.network_mode = network_mode
+        self.trace_dir = trace_dir
+
+        # Moteur d'extraction : DOM + sélecteurs CSS (défaut) ou réponses JSON
+        self.api_extractor: Optional[ApiExtractor] = None
+        self.discovered_endpoint: Optional[str] = None
+        if self.scraping_config.get('engine', 'dom') == 'api':
+            self.api_extractor = ApiExtractor(self.scraping_config['api'])
+
+        # Suivi de santé des sélecteurs (réordonnancement automatique des fallbacks)
+        # Jamais en replay : une archive figée ne doit pas influencer les statistiques réelles
+        self.selector_health: Optional[SelectorHealth] = None
+        if (self.scraping_config.get('adaptive_selectors', True) and not self.api_extractor
+                and network_mode != REPLAY):
+            self.selector_health = SelectorHealth(self.source_id)
+
+        # Ordre des sélecteurs par champ, calculé une fois par scraping
+        self._selector_order: Dict[str, List[str]] = {}
+
+        # Pages de liste à scraper (source.urls, ou source.url seule)
+        self.listings = self.listing_pages()
+
+    def listing_pages(self) -> List[Dict[str, Any]]:
+        """
+        Pages de liste de la source
+
+        Chaque entrée de source.urls est une URL, ou un dictionnaire {url, selectors,
+        wait_time} dont les sélecteurs complètent ou remplacent ceux de scraping.selectors.
+
+        Returns:
+            Liste de {'url', 'selectors', 'wait_time'}
+        """
+        wait_time = self.scraping_config.get('wait_time', 3000)
+        entries = self.source_config.get('urls') or [self.source_config['url']]
+
+        listings = []
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {'url': entry}
+            overrides = entry.get('selectors')
+            listings.append({
+                'url': entry['url'],
+                'selectors': {**self.selectors, **overrides} if overrides else self.selectors,
+                'wait_time': int(entry['wait_time'] * self.wait_scale) if 'wait_time' in entry else wait_time,
+            })
+        return listings
 
     def parse_date(self, date_text: str) -> datetime:
         """
@@ -78,22 +155,45 @@ class GenericScraper:
         logger.error(f"Failed to parse date '{date_text}' and no valid fallback")
         return datetime.now(timezone.utc)
 
-    async def try_selectors(self, element: Any, selectors_config: Dict[str, Any]) -> Optional[str]:
+    def ordered_selectors(self, field: str) -> List[str]:
+        """
+        Retourne les sélecteurs d'un champ dans l'ordre à essayer
+
+        Args:
+            field: Nom du champ (title, link, date, description)
+
+        Returns:
+            Liste de sélecteurs, le meilleur observé en tête si le suivi est actif
+        """
+        if field not in self._selector_order:
+            selectors = get_selector_value(self.selectors[field])
+            if self.selector_health:
+                selectors = self.selector_health.order(field, selectors)
+            self._selector_order[field] = selectors
+        return self._selector_order[field]
+
+    async def try_selectors(self, element: Any, selectors_config: Dict[str, Any],
+                            field: Optional[str] = None) -> Optional[str]:
         """
         Essaie plusieurs sélecteurs CSS jusqu'à trouver un élément
 
         Args:
             element: Élément Playwright dans lequel chercher
             selectors_config: Configuration des sélecteurs (primary, fallback, attribute, optional)
+            field: Nom du champ, pour l'ordre adaptatif et les statistiques de santé
 
         Returns:
             Texte ou attribut trouvé, ou None si rien trouvé et optional=True
         """
-        selectors = get_selector_value(selectors_config)
+        if field:
+            selectors = self.ordered_selectors(field)
+        else:
+            selectors = get_selector_value(selectors_config)
         attribute = selectors_config.get('attribute')
         optional = selectors_config.get('optional', False)
 
         for selector in selectors:
+            value = None
             try:
                 # Cas spécial : sélecteur vide ou "." signifie l'élément lui-même
                 if selector == "" or selector == ".":
@@ -101,156 +201,637 @@ class GenericScraper:
                         value = await element.get_attribute(attribute)
                     else:
                         value = await element.text_content()
-
-                    if value:
-                        return value.strip()
-                    continue
-
-                found_element = await element.query_selector(selector)
-                if found_element:
-                    if attribute:
-                        value = await found_element.get_attribute(attribute)
-                    else:
-                        value = await found_element.text_content()
-
-                    if value:
-                        return value.strip()
+                else:
+                    found_element = await element.query_selector(selector)
+                    if found_element:
+                        if attribute:
+                            value = await found_element.get_attribute(attribute)
+                        else:
+                            value = await found_element.text_content()
             except Exception as e:
                 logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+
+            if field and self.selector_health:
+                self.selector_health.record(field, selector, bool(value))
+
+            if value:
+                return value.strip()
 
         if not optional:
             logger.warning(f"No element found for selectors: {selectors}")
 
         return None
 
-    async def scrape_article(self, article_element: Any) -> Optional[Dict[str, Any]]:
+    def build_article(self, title: str, link: str, date_text: Optional[str],
+                      description: Optional[str], page_url: Optional[str] = None) -> Article:
+        """
+        Construit un article à partir des valeurs extraites
+
+        Args:
+            title: Titre de l'article
+            link: Lien (relatif ou absolu)
+            date_text: Texte brut de la date, ou None
+            description: Description, ou None
+            page_url: Page de liste d'où provient le lien (défaut : source.url)
+
+        Returns:
+            Article normalisé
+        """
+        # Convertir en URL absolue si nécessaire
+        url_handling = self.scraping_config.get('url_handling', {})
+        if url_handling.get('make_absolute', True):
+            if 'base_url' in url_handling:
+                link = make_absolute_url(link, url_handling['base_url'])
+            else:
+                # Sans base_url, un lien relatif se résout comme dans le navigateur : par rapport à sa page
+                link = urllib.parse.urljoin(page_url or self.source_config['url'], link)
+
+        parsed_date = self.parse_date(date_text) if date_text else datetime.now(timezone.utc)
+
+        logger.info(f"Found: {title} - {date_text} → parsed as {parsed_date.strftime('%Y-%m-%d')}")
+        return Article(
+            title=title,
+            link=link,
+            date=parsed_date,
+            source=self.source_config['name'],
+            description=description or title,  # Fallback au titre si pas de description
+            date_text=date_text or '',
+        )
+
+    async def scrape_article(self, article_element: Any, selectors: Optional[Dict[str, Any]] = None,
+                             page_url: Optional[str] = None) -> Optional[Article]:
         """
         Extrait les données d'un seul article
 
         Args:
             article_element: Élément Playwright représentant un article
+            selectors: Sélecteurs propres à une page de liste (défaut : scraping.selectors)
+            page_url: URL de la page de liste, pour résoudre les liens relatifs
 
         Returns:
-            Dictionnaire avec les données de l'article ou None si erreur
+            Article extrait ou None si erreur
         """
+        selectors = selectors or self.selectors
+
+        def tracked(field: str) -> Optional[str]:
+            # Ordre adaptatif et statistiques de santé : seulement pour les sélecteurs partagés
+            return field if selectors[field] is self.selectors.get(field) else None
+
         try:
             # Extraire le titre
-            title = await self.try_selectors(article_element, self.selectors['title'])
+            title = await self.try_selectors(article_element, selectors['title'], tracked('title'))
             if not title:
                 logger.warning("Article without title, skipping")
                 return None
 
             # Extraire le lien
-            link = await self.try_selectors(article_element, self.selectors['link'])
+            link = await self.try_selectors(article_element, selectors['link'], tracked('link'))
             if not link:
                 logger.warning(f"Article '{title}' without link, skipping")
                 return None
 
-            # Convertir en URL absolue si nécessaire
-            url_handling = self.scraping_config.get('url_handling', {})
-            if url_handling.get('make_absolute', True):
-                base_url = url_handling.get('base_url', self.source_config['url'])
-                link = make_absolute_url(link, base_url)
-
             # Extraire la date
-            date_text = await self.try_selectors(article_element, self.selectors['date'])
-            parsed_date = self.parse_date(date_text) if date_text else datetime.now(timezone.utc)
+            date_text = await self.try_selectors(article_element, selectors['date'], tracked('date'))
 
             # Extraire la description (optionnel)
             description = None
-            if 'description' in self.selectors:
-                description = await self.try_selectors(article_element, self.selectors['description'])
-
-            article_data = {
-                'title': title,
-                'link': link,
-                'date': parsed_date,
-                'date_text': date_text or '',
-                'description': description or title,  # Fallback au titre si pas de description
-                'source': self.source_config['name']
-            }
+            if 'description' in selectors:
+                description = await self.try_selectors(article_element, selectors['description'],
+                                                       tracked('description'))
 
-            logger.info(f"Found: {title} - {date_text} → parsed as {parsed_date.strftime('%Y-%m-%d')}")
-            return article_data
+            return self.build_article(title, link, date_text, description, page_url)
 
         except Exception as e:
             logger.error(f"Error scraping article: {e}", exc_info=True)
             return None
 
-    async def scrape(self) -> List[Dict[str, Any]]:
+    def record_options(self) -> Dict[str, Any]:
         """
-        Lance le scraping complet du site
+        Options de contexte pour l'archivage HAR (mode 'record')
 
         Returns:
-            Liste de dictionnaires contenant les articles
+            Options à passer à new_context / launch_persistent_context
         """
-        articles_data = []
+        if self.network_mode != RECORD:
+            return {}
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        archive = har_path(self.source_id)
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Recording network traffic to {archive}")
+        return {'record_har_path': str(archive), 'record_har_content': 'attach'}
+
+    async def new_context(self, browser: Browser) -> BrowserContext:
+        """
+        Crée un contexte vierge dans un navigateur, avec archivage ou rejeu HAR selon le mode
+
+        Args:
+            browser: Navigateur Chromium lancé
+
+        Returns:
+            Contexte de navigation
+
+        Raises:
+            FileNotFoundError: En mode 'replay', si la source n'a pas d'archive
+        """
+        context = await browser.new_context(**self.record_options())
+
+        if self.network_mode == REPLAY:
+            archive = har_path(self.source_id)
+            if not archive.exists():
+                await context.close()
+                raise FileNotFoundError(f"No network archive for {self.source_id}: {archive} (run with --record first)")
+            logger.info(f"Replaying network traffic from {archive}")
+            await context.route_from_har(str(archive), not_found='abort')
+
+        return context
+
+    async def launch_context(self, playwright: Any) -> Tuple[Optional[Browser], BrowserContext]:
+        """
+        Lance Chromium et crée le contexte de navigation
+
+        Si scraping.browser_profile.enabled est actif, un contexte persistant est utilisé :
+        le cache HTTP et l'état de stockage (cookies, localStorage) de la source sont
+        conservés d'une exécution à l'autre.
+
+        En mode 'record', tout le trafic est archivé en HAR à la fermeture du contexte ;
+        en mode 'replay', les requêtes sont servies depuis cette archive et celles qui n'y
+        figurent pas sont bloquées (aucun accès réseau).
+
+        Args:
+            playwright: Instance Playwright démarrée
+
+        Returns:
+            Tuple (navigateur, contexte) ; le navigateur est None pour un contexte persistant
+        """
+        profile_config = self.scraping_config.get('browser_profile', {})
 
+        # Le replay utilise toujours un contexte vierge : le cache du profil fausserait le résultat
+        if not profile_config.get('enabled', False) or self.network_mode == REPLAY:
+            browser = await playwright.chromium.launch(headless=True)
             try:
-                # Charger la page
-                url = self.source_config['url']
-                logger.info(f"Loading page: {url}")
-                await page.goto(url)
-
-                # Attendre selon la stratégie configurée
-                wait_strategy = self.scraping_config.get('wait_strategy', 'networkidle')
-                wait_time = self.scraping_config.get('wait_time', 3000)
-
-                if wait_strategy == 'networkidle':
-                    await page.wait_for_load_state('networkidle', timeout=wait_time)
-                elif wait_strategy == 'load':
-                    await page.wait_for_load_state('load', timeout=wait_time)
-                elif wait_strategy == 'domcontentloaded':
-                    await page.wait_for_load_state('domcontentloaded', timeout=wait_time)
-
-                # Attendre aussi le container principal
-                container_selector = self.selectors['container']
-                logger.info(f"Waiting for container: {container_selector}")
-                await page.wait_for_selector(container_selector, timeout=wait_time)
-
-                # Récupérer tous les articles
-                articles = await page.query_selector_all(container_selector)
-                logger.info(f"Found {len(articles)} article containers")
-
-                # Scraper chaque article
-                for article in articles:
-                    article_data = await self.scrape_article(article)
-                    if article_data:
-                        articles_data.append(article_data)
-
-                # Trier par date (plus récent en premier)
-                articles_data.sort(key=lambda x: x['date'], reverse=True)
-
-                logger.info(f"Successfully scraped {len(articles_data)} articles from {self.source_config['name']}")
+                return browser, await self.new_context(browser)
+            except Exception:
+                await browser.close()
+                raise
+
+        profile = profile_dir(self.source_id)
+        enforce_profile_limit(profile, profile_config.get('max_profile_mb', 200))
+        touch_profile(profile)
+
+        logger.info(f"Using persistent browser profile: {profile}")
+        context = await playwright.chromium.launch_persistent_context(
+            str(profile),
+            headless=True,
+            args=chromium_cache_args(profile, profile_config.get('cache_size_mb', 50)),
+            **self.record_options(),
+        )
+        return None, context
+
+    def navigation_timeout(self) -> int:
+        """
+        Délai maximal de chargement d'une page, en millisecondes
+
+        Returns:
+            NAVIGATION_TIMEOUT réduit par wait_scale, borné par le temps restant avant l'échéance
+        """
+        timeout = NAVIGATION_TIMEOUT * self.wait_scale
+        if self.deadline is not None:
+            timeout = min(timeout, (self.deadline - time.monotonic()) * 1000)
+        # 0 désactiverait le délai côté Playwright
+        return max(int(timeout), 1)
+
+    async def wait_for_page(self, page: Page, wait_time: Optional[int] = None) -> None:
+        """
+        Attend le chargement de la page selon la stratégie configurée
+
+        Args:
+            page: Page Playwright déjà naviguée
+            wait_time: Délai maximal en millisecondes (défaut : scraping.wait_time)
+        """
+        wait_strategy = self.scraping_config.get('wait_strategy', 'networkidle')
+        if wait_time is None:
+            wait_time = self.scraping_config.get('wait_time', 3000)
+
+        if wait_strategy == 'networkidle':
+            await page.wait_for_load_state('networkidle', timeout=wait_time)
+        elif wait_strategy == 'load':
+            await page.wait_for_load_state('load', timeout=wait_time)
+        elif wait_strategy == 'domcontentloaded':
+            await page.wait_for_load_state('domcontentloaded', timeout=wait_time)
+
+    async def scrape_dom(self, page: Page, listing: Dict[str, Any]) -> List[Article]:
+        """
+        Extrait les articles depuis le DOM rendu, via les sélecteurs CSS (engine: dom)
+
+        Args:
+            page: Page Playwright vierge
+            listing: Page de liste (voir listing_pages)
+
+        Returns:
+            Liste des articles extraits
+        """
+        articles_data = []
+        selectors = listing['selectors']
+
+        # Charger la page
+        url = listing['url']
+        logger.info(f"Loading page: {url}")
+        await page.goto(url, timeout=self.navigation_timeout())
+
+        # Attendre selon la stratégie configurée
+        wait_time = listing['wait_time']
+        await self.wait_for_page(page, wait_time)
+
+        # Attendre aussi le container principal
+        container_selector = selectors['container']
+        logger.info(f"Waiting for container: {container_selector}")
+        await page.wait_for_selector(container_selector, timeout=wait_time)
+
+        # Récupérer tous les articles
+        articles = await page.query_selector_all(container_selector)
+        logger.info(f"Found {len(articles)} article containers")
+
+        # Scraper chaque article
+        # Après d'éventuelles redirections, page.url est la base des liens relatifs
+        for article in articles:
+            article_data = await self.scrape_article(article, selectors, page.url)
+            if article_data:
+                articles_data.append(article_data)
+
+        return articles_data
+
+    def articles_from_payload(self, payload: Any, page_url: Optional[str] = None) -> List[Article]:
+        """
+        Convertit une réponse JSON en articles (engine: api)
+
+        Args:
+            payload: Réponse JSON décodée
+            page_url: Page de liste ayant émis la requête, pour résoudre les liens relatifs
+
+        Returns:
+            Liste des articles extraits
+        """
+        articles_data = []
+        for item in self.api_extractor.extract(payload):
+            if not item['title'] or not item['link']:
+                logger.debug(f"Skipping API item without title or link: {item}")
+                continue
+            articles_data.append(self.build_article(item['title'], item['link'], item['date'],
+                                                    item['description'], page_url))
+        return articles_data
+
+    async def fetch_api(self, request_context: APIRequestContext, endpoint: str) -> List[Article]:
+        """
+        Interroge directement l'endpoint JSON de la source, sans ouvrir de page
+
+        Args:
+            request_context: Client HTTP Playwright (playwright.request ou context.request)
+            endpoint: URL de l'API
+
+        Returns:
+            Liste des articles extraits (vide en cas d'échec)
+        """
+        wait_time = self.scraping_config.get('wait_time', 3000)
+        try:
+            logger.info(f"Fetching API endpoint: {endpoint}")
+            response = await request_context.get(endpoint, timeout=wait_time)
+            if not response.ok:
+                logger.warning(f"API endpoint returned HTTP {response.status}: {endpoint}")
+                return []
+            return self.articles_from_payload(await response.json())
+        except Exception as e:
+            logger.warning(f"Direct API fetch failed for {endpoint}: {e}")
+            return []
+
+    def known_endpoint(self) -> Optional[str]:
+        """
+        Endpoint JSON à interroger directement, s'il est connu (engine: api)
+
+        Jamais en record/replay : tout le trafic doit alors passer par l'archive HAR.
+        Un endpoint découvert ne couvre qu'une page : il n'est pas utilisé avec source.urls.
+
+        Returns:
+            URL de l'endpoint (configuré ou découvert), ou None
+        """
+        if not self.api_extractor or self.network_mode:
+            return None
+        endpoint = self.scraping_config['api'].get('endpoint')
+        if not endpoint and len(self.listings) == 1:
+            endpoint = self.load_discovered_endpoint()
+        return endpoint
+
+    async def scrape_api(self, page: Page, listing: Dict[str, Any]) -> List[Article]:
+        """
+        Capture les réponses JSON de la page pendant son chargement (engine: api)
+
+        Le DOM n'est jamais parcouru : les réponses correspondant à
+        scraping.api.url_pattern sont lues au fil de l'eau, jusqu'à ce que l'une
+        d'elles produise des articles ou que wait_time soit écoulé. Une réponse
+        sans articles (configuration, analytics...) n'arrête pas la capture.
+
+        Args:
+            page: Page Playwright vierge
+            listing: Page de liste (voir listing_pages)
+
+        Returns:
+            Liste des articles extraits
+        """
+        captured: asyncio.Queue = asyncio.Queue()
+
+        def on_response(response: Any) -> None:
+            if response.request.resource_type in ('xhr', 'fetch') and self.api_extractor.matches(response.url):
+                captured.put_nowait(response)
+
+        page.on('response', on_response)
+
+        url = listing['url']
+        logger.info(f"Loading page: {url} (capturing API responses)")
+        capture_until = time.monotonic() + listing['wait_time'] / 1000
+        await page.goto(url, wait_until='commit', timeout=self.navigation_timeout())
+
+        articles_data: List[Article] = []
+        while True:
+            if articles_data:
+                # Des articles ont été trouvés : lire les réponses déjà reçues, sans plus attendre
+                if captured.empty():
+                    break
+                response = captured.get_nowait()
+            else:
+                remaining = capture_until - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    response = await asyncio.wait_for(captured.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
 
+            try:
+                articles = self.articles_from_payload(await response.json(), page.url)
             except Exception as e:
-                logger.error(f"Error during scraping: {e}", exc_info=True)
-            finally:
-                await browser.close()
+                logger.debug(f"Ignoring non-JSON response {response.url}: {e}")
+                continue
+            if articles:
+                logger.info(f"Extracted {len(articles)} articles from {response.url}")
+                self.discovered_endpoint = response.url if response.request.method == 'GET' else None
+                articles_data.extend(articles)
+            else:
+                logger.debug(f"No articles in {response.url}, still capturing")
+
+        if not articles_data:
+            logger.warning(f"No API response with articles within {listing['wait_time']}ms: {url}")
+        return articles_data
+
+    def finalize(self, articles_data: List[Article]) -> List[Article]:
+        """
+        Trie les articles (plus récent en premier) et journalise le résultat
+
+        Args:
+            articles_data: Articles extraits
+
+        Returns:
+            La même liste, triée sur place
+        """
+        articles_data.sort(key=lambda x: x.date, reverse=True)
+        logger.info(f"Successfully scraped {len(articles_data)} articles from {self.source_config['name']}")
+        return articles_data
+
+    def load_discovered_endpoint(self) -> Optional[str]:
+        """Endpoint JSON découvert lors d'une exécution précédente, s'il existe"""
+        state = load_json_state(STATE_DIR / 'endpoints' / f"{self.source_id}.json", {})
+        return state.get('endpoint')
+
+    def save_discovered_endpoint(self) -> None:
+        """Mémorise l'endpoint JSON capturé pour l'interroger directement la prochaine fois"""
+        if not self.discovered_endpoint or len(self.listings) > 1:
+            return
+        try:
+            save_json_state(STATE_DIR / 'endpoints' / f"{self.source_id}.json",
+                            {'endpoint': self.discovered_endpoint})
+        except Exception as e:
+            logger.warning(f"Failed to save discovered endpoint for {self.source_id}: {e}")
+
+    async def scrape_listing(self, context: BrowserContext, listing: Dict[str, Any]) -> List[Article]:
+        """
+        Scrape une page de liste dans son propre onglet
+
+        Une page en échec est journalisée sans interrompre les autres.
+
+        Args:
+            context: Contexte de navigation
+            listing: Page de liste (voir listing_pages)
+
+        Returns:
+            Articles extraits de la page (vide en cas d'échec)
+        """
+        page = await context.new_page()
+        try:
+            if self.api_extractor:
+                return await self.scrape_api(page, listing)
+            return await self.scrape_dom(page, listing)
+        except Exception as e:
+            logger.error(f"Error during scraping of {listing['url']}: {e}", exc_info=True)
+            return []
+        finally:
+            await page.close()
+
+    def deduplicate(self, articles_data: List[Article]) -> List[Article]:
+        """
+        Supprime les articles présents sur plusieurs pages de liste (même lien)
+
+        Args:
+            articles_data: Articles extraits, dans l'ordre des pages
+
+        Returns:
+            Articles uniques (première occurrence conservée)
+        """
+        seen = set()
+        unique = []
+        for article in articles_data:
+            if article.link not in seen:
+                seen.add(article.link)
+                unique.append(article)
+
+        if len(unique) < len(articles_data):
+            logger.info(f"Removed {len(articles_data) - len(unique)} duplicate articles across listing pages")
+        return unique
+
+    async def scrape_in_context(self, context: BrowserContext) -> List[Article]:
+        """
+        Scrape la source dans un contexte de navigation existant
+
+        Les pages de liste (source.urls) sont ouvertes en parallèle, un onglet chacune,
+        puis leurs articles sont fusionnés. Seuls ces onglets sont fermés : le contexte
+        reste à l'appelant.
+
+        Args:
+            context: Contexte de navigation
+
+        Returns:
+            Liste des articles
+        """
+        articles_data: List[Article] = []
+
+        network: Optional[NetworkRecorder] = None
+        if self.trace_dir:
+            network = NetworkRecorder()
+            network.attach(context)
+            await context.tracing.start(screenshots=True, snapshots=True)
+
+        try:
+            results = await asyncio.gather(*(self.scrape_listing(context, listing) for listing in self.listings))
+            for listing_articles in results:
+                articles_data.extend(listing_articles)
+
+            articles_data = self.deduplicate(articles_data)
+            if self.api_extractor and self.network_mode != REPLAY:
+                self.save_discovered_endpoint()
+
+            self.finalize(articles_data)
+
+        except Exception as e:
+            logger.error(f"Error during scraping: {e}", exc_info=True)
+        finally:
+            if network:
+                try:
+                    await context.tracing.stop(path=str(trace_path(self.trace_dir, self.source_id)))
+                except Exception as e:
+                    logger.warning(f"Failed to save Playwright trace for {self.source_id}: {e}")
+                network.save(network_log_path(self.trace_dir, self.source_id))
+            if self.selector_health:
+                await run_blocking(self.selector_health.save, inline=self.trace_dir is not None)
+                for stale in self.selector_health.stale_selectors():
+                    logger.warning(f"Selector '{stale['selector']}' for {stale['field']} has not matched "
+                                   f"in {stale['consecutive_misses']} consecutive attempts")
 
         return articles_data
 
+    async def scrape(self, browser: Optional[Browser] = None,
+                     context: Optional[BrowserContext] = None) -> List[Article]:
+        """
+        Lance le scraping complet du site
+
+        Sans navigateur ni contexte fourni, Playwright et Chromium sont démarrés puis
+        arrêtés ici. Un navigateur fourni reçoit un nouveau contexte (fermé à la fin) ;
+        un contexte fourni est utilisé tel quel : ni le profil persistant ni
+        l'archivage HAR ne s'appliquent alors.
+
+        Args:
+            browser: Navigateur déjà lancé par l'appelant (optionnel)
+            context: Contexte déjà créé par l'appelant (optionnel, prioritaire)
+
+        Returns:
+            Liste des articles
+        """
+        endpoint = self.known_endpoint()
+
+        if context is not None:
+            if endpoint:
+                articles_data = await self.fetch_api(context.request, endpoint)
+                if articles_data:
+                    return self.finalize(articles_data)
+            return await self.scrape_in_context(context)
+
+        if browser is not None:
+            own_context = await self.new_context(browser)
+            try:
+                if endpoint:
+                    articles_data = await self.fetch_api(own_context.request, endpoint)
+                    if articles_data:
+                        return self.finalize(articles_data)
+                return await self.scrape_in_context(own_context)
+            finally:
+                await own_context.close()
+
+        async with async_playwright() as p:
+            # engine: api avec endpoint connu : pas besoin de navigateur
+            if endpoint:
+                request_context = await p.request.new_context()
+                try:
+                    articles_data = await self.fetch_api(request_context, endpoint)
+                finally:
+                    await request_context.dispose()
+                if articles_data:
+                    return self.finalize(articles_data)
+
+            browser, own_context = await self.launch_context(p)
+            try:
+                return await self.scrape_in_context(own_context)
+            finally:
+                await own_context.close()
+                if browser:
+                    await browser.close()
 
-def scrape_source(config_file: str) -> List[Dict[str, Any]]:
+
+async def scrape_source_async(config_file: str, network_mode: Optional[str] = None,
+                              trace_dir: Optional[Path] = None, browser: Optional[Browser] = None,
+                              context: Optional[BrowserContext] = None, wait_scale: float = 1.0,
+                              deadline: Optional[float] = None) -> List[Article]:
     """
-    Fonction principale pour scraper une source depuis un fichier de config
+    Scrape une source depuis un fichier de config, dans la boucle asyncio de l'appelant
 
     Args:
         config_file: Chemin vers le fichier de configuration YAML
+        network_mode: 'record' ou 'replay' pour le scraping hors ligne (voir archives.py)
+        trace_dir: Répertoire des traces Playwright (--profile), ou None ; si défini,
+            l'ingestion de flux reste dans le thread courant pour être vue par le profileur
+        browser: Navigateur à réutiliser (optionnel, voir GenericScraper.scrape)
+        context: Contexte à réutiliser (optionnel, voir GenericScraper.scrape)
+        wait_scale: Facteur appliqué aux délais d'attente de la page (budget --deadline)
+        deadline: Échéance de la source (horloge time.monotonic) : borne le chargement des
+            pages et l'ingestion de flux ; le thread d'ingestion ne peut pas être annulé,
+            il s'arrête lui-même à l'échéance
 
     Returns:
         Liste d'articles scrapés
+
+    Raises:
+        DeadlineExceeded: Si l'ingestion d'un flux ou d'un sitemap a dépassé l'échéance
     """
+    # Lecture de la config et de l'état des sélecteurs : fichiers, hors de la boucle
+    inline = trace_dir is not None
     try:
-        config = load_yaml_config(config_file)
-        scraper = GenericScraper(config)
-        articles = asyncio.run(scraper.scrape())
-        return articles
+        config = await run_blocking(load_yaml_config, config_file, inline=inline)
+        source_id = Path(config_file).stem
+
+        # Sitemaps et flux existants : ingestion directe (bloquante), hors de la boucle
+        if config['source'].get('type', 'page') in INGESTED_SOURCE_TYPES:
+            ingester = FeedIngester(config, source_id=source_id, network_mode=network_mode, deadline=deadline)
+            return await run_blocking(ingester.ingest, inline=inline)
+
+        scraper = await run_blocking(partial(GenericScraper, config, source_id=source_id,
+                                             network_mode=network_mode, trace_dir=trace_dir,
+                                             wait_scale=wait_scale, deadline=deadline), inline=inline)
+        return await scraper.scrape(browser=browser, context=context)
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"Failed to scrape source {config_file}: {e}", exc_info=True)
-        return []
\ No newline at end of file
+        return []
+
+
+def scrape_source(config_file: str, network_mode: Optional[str] = None,
+                  trace_dir: Optional[Path] = None) -> List[Article]:
+    """
+    Fonction principale pour scraper une source depuis un fichier de config
+
+    Démarre sa propre boucle asyncio : depuis du code asynchrone, utiliser
+    scrape_source_async().
+
+    Args:
+        config_file: Chemin vers le fichier de configuration YAML
+        network_mode: 'record' ou 'replay' pour le scraping hors ligne (voir archives.py)
+        trace_dir: Répertoire des traces Playwright (--profile), ou None
+
+    Returns:
+        Liste d'articles scrapés
+
+    Raises:
+        RuntimeError: Si appelée depuis une boucle asyncio en cours
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(scrape_source_async(config_file, network_mode, trace_dir))
+
+    raise RuntimeError(f"scrape_source() cannot run inside an event loop, "
+                       f"use await scrape_source_async() instead: {config_file}")
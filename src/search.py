@@ -0,0 +1,300 @@
+"""
+Index de recherche plein texte des articles collectés (SQLite FTS5)
+Conserve tout l'historique, au-delà des max_items des flux, et génère des flux par requête
+"""
+import sqlite3
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+import logging
+
+from .models import Article
+from .rss_generator import generate_rss
+from .utils import STATE_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = STATE_DIR / 'articles.db'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    guid TEXT NOT NULL UNIQUE,
+    source_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    description TEXT NOT NULL,
+    published REAL NOT NULL,
+    date_text TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles(published);
+CREATE INDEX IF NOT EXISTS articles_source ON articles(source_id, published);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, description ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO articles_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+"""
+
+
+def fts_query(query: str) -> str:
+    """
+    Rend une requête utilisateur sûre pour FTS5
+
+    Chaque mot est cité, afin que la ponctuation (tirets, deux-points...) ne soit pas
+    interprétée comme syntaxe FTS5. Les mots sont combinés par un ET implicite ;
+    un mot terminé par `*` reste une recherche par préfixe.
+
+    Args:
+        query: Requête saisie (ex: "claude 3.5 sonnet")
+
+    Returns:
+        Expression FTS5
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith('*') and len(word) > 1
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return ' '.join(terms)
+
+
+class ArticleIndex:
+    """
+    Index SQLite FTS5 des titres et descriptions de tous les articles collectés
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_INDEX_PATH):
+        """
+        Ouvre (ou crée) l'index
+
+        Args:
+            db_path: Chemin de la base SQLite
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Plusieurs processus (--workers) peuvent écrire : attendre le verrou plutôt qu'échouer
+        self.connection = sqlite3.connect(str(self.db_path), timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, search_config: Dict[str, Any]) -> 'ArticleIndex':
+        """
+        Ouvre l'index décrit par la section search de sources.yaml
+
+        Args:
+            search_config: Section search de sources.yaml
+
+        Returns:
+            Index ouvert
+        """
+        return cls(search_config.get('db_path', DEFAULT_INDEX_PATH))
+
+    def close(self) -> None:
+        """Ferme la connexion"""
+        self.connection.close()
+
+    def __enter__(self) -> 'ArticleIndex':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def add_articles(self, source_id: str, articles: List[Article]) -> int:
+        """
+        Ajoute ou met à jour des articles dans l'index (clé : guid)
+
+        Args:
+            source_id: Identifiant de la source (nom du fichier de config)
+            articles: Articles à indexer
+
+        Returns:
+            Nombre d'articles nouveaux
+        """
+        with self.connection:
+            # Deux requêtes plutôt qu'un upsert : rowcount de l'insertion = articles nouveaux,
+            # sans compter toute la table avant et après
+            inserted = self.connection.executemany(
+                """
+                INSERT INTO articles (guid, source_id, source, title, link, description, published, date_text)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guid) DO NOTHING
+                """,
+                [
+                    (article.guid, source_id, article.source, article.title, article.link,
+                     article.description, article.date.timestamp(), article.date_text)
+                    for article in articles
+                ],
+            ).rowcount
+            self.connection.executemany(
+                """
+                UPDATE articles SET title = ?, description = ?, link = ?
+                WHERE guid = ? AND (title != ? OR description != ? OR link != ?)
+                """,
+                [
+                    (article.title, article.description, article.link,
+                     article.guid, article.title, article.description, article.link)
+                    for article in articles
+                ],
+            )
+            return inserted
+
+    def search(self, query: str, limit: int = 50, source_id: Optional[str] = None,
+               order: str = 'date') -> List[Article]:
+        """
+        Recherche plein texte dans les titres et descriptions
+
+        Args:
+            query: Requête (mots combinés par ET, `mot*` pour un préfixe)
+            limit: Nombre maximum de résultats
+            source_id: Restreindre à une source
+            order: 'date' (plus récent d'abord) ou 'rank' (pertinence BM25)
+
+        Returns:
+            Articles correspondants
+        """
+        expression = fts_query(query)
+        if not expression:
+            return []
+
+        sql = """
+            SELECT a.title, a.link, a.published, a.source, a.description, a.date_text, a.guid
+            FROM articles_fts
+            JOIN articles a ON a.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        """
+        params: List[Any] = [expression]
+        if source_id:
+            sql += " AND a.source_id = ?"
+            params.append(source_id)
+        sql += " ORDER BY bm25(articles_fts)" if order == 'rank' else " ORDER BY a.published DESC"
+        sql += " LIMIT ?"
+        params.append(limit)
+
+        return [
+            Article(
+                title=title,
+                link=link,
+                date=datetime.fromtimestamp(published, tz=timezone.utc),
+                source=source,
+                description=description,
+                date_text=date_text,
+                guid=guid,
+            )
+            for title, link, published, source, description, date_text, guid
+            in self.connection.execute(sql, params)
+        ]
+
+    def count(self) -> int:
+        """Nombre total d'articles indexés"""
+        return self.connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+def index_source_articles(source_id: str, articles: List[Article], search_config: Dict[str, Any]) -> None:
+    """
+    Ajoute les articles d'une source à l'index de recherche, si activé
+
+    Args:
+        source_id: Identifiant de la source
+        articles: Articles scrapés
+        search_config: Section search de sources.yaml
+    """
+    if not search_config.get('enabled', False):
+        return
+
+    try:
+        with ArticleIndex.from_config(search_config) as index:
+            new_count = index.add_articles(source_id, articles)
+        logger.info(f"Indexed {len(articles)} articles from {source_id} ({new_count} new)")
+    except Exception as e:
+        logger.error(f"Failed to index articles from {source_id}: {e}", exc_info=True)
+
+
+def generate_query_feed(index: ArticleIndex, query_config: Dict[str, Any],
+                        websub_config: Optional[Dict[str, Any]] = None,
+                        default_link: Optional[str] = None) -> bool:
+    """
+    Génère le flux RSS d'une requête enregistrée
+
+    Args:
+        index: Index de recherche ouvert
+        query_config: Entrée de search.queries (name, query, output_file, title...)
+        websub_config: Section websub de sources.yaml (optionnel)
+        default_link: Lien du flux si la requête n'en définit pas (ex: merge.link)
+
+    Returns:
+        True si succès, False sinon
+    """
+    # RSS 2.0 exige un <link> : sans lien, feedgen refuserait de générer le flux
+    link = query_config.get('link') or default_link
+    if not link:
+        logger.error(f"Query feed '{query_config['name']}' has no link (set search.queries[].link or merge.link)")
+        return False
+
+    max_items = query_config.get('max_items', 50)
+    articles = index.search(query_config['query'], limit=max_items, source_id=query_config.get('source'))
+
+    feed_config = {
+        'source': {
+            'name': query_config['name'],
+            'url': link,
+            'description': query_config.get('description', f"Articles matching: {query_config['query']}"),
+        },
+        'rss': {
+            'title': query_config.get('title', query_config['name']),
+            'max_items': max_items,
+        },
+        'websub': websub_config or {},
+    }
+
+    output_file = Path('output') / query_config['output_file']
+    logger.info(f"Query '{query_config['query']}': {len(articles)} articles → {output_file}")
+    return generate_rss(articles, feed_config, str(output_file))
+
+
+def generate_query_feeds(search_config: Dict[str, Any],
+                         websub_config: Optional[Dict[str, Any]] = None,
+                         default_link: Optional[str] = None) -> Dict[str, bool]:
+    """
+    Génère les flux de toutes les requêtes enregistrées (search.queries)
+
+    Args:
+        search_config: Section search de sources.yaml
+        websub_config: Section websub de sources.yaml (optionnel)
+        default_link: Lien des flux dont la requête n'en définit pas (ex: merge.link)
+
+    Returns:
+        Dictionnaire nom de requête → succès
+    """
+    results: Dict[str, bool] = {}
+    queries = search_config.get('queries', [])
+    if not search_config.get('enabled', False) or not queries:
+        return results
+
+    with ArticleIndex.from_config(search_config) as index:
+        for query_config in queries:
+            try:
+                results[query_config['name']] = generate_query_feed(index, query_config, websub_config,
+                                                                    default_link)
+            except Exception as e:
+                logger.error(f"Failed to generate query feed '{query_config.get('name')}': {e}", exc_info=True)
+                results[query_config.get('name', '?')] = False
+
+    return results
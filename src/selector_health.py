@@ -0,0 +1,181 @@
+"""
+Suivi de santé des sélecteurs CSS
+Mémorise, par source et par champ, quels sélecteurs trouvent réellement des éléments
+afin de promouvoir le meilleur en tête et de signaler ceux qui ne matchent plus
+"""
+from datetime import datetime, timezone
+from typing import List, Dict, Any
+from pathlib import Path
+import logging
+
+from .utils import STATE_DIR, load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+# Nombre d'échecs consécutifs à partir duquel un sélecteur est considéré comme cassé
+DEFAULT_STALE_THRESHOLD = 20
+
+# Nombre minimal de tentatives avant de juger un sélecteur (en tête ou candidat à le remplacer)
+MIN_ATTEMPTS = 10
+
+# Le sélecteur en tête n'est rétrogradé que s'il échoue réellement
+DEMOTE_CONSECUTIVE_MISSES = 5
+DEMOTE_HIT_RATE = 0.5
+
+
+class SelectorHealth:
+    """
+    Statistiques de succès des sélecteurs d'une source, persistées entre les exécutions
+    """
+
+    def __init__(self, source_id: str, state_dir: Path = STATE_DIR):
+        """
+        Initialise le suivi pour une source
+
+        Args:
+            source_id: Identifiant de la source (nom du fichier de config)
+            state_dir: Répertoire de l'état persistant
+        """
+        self.source_id = source_id
+        self.state_file = Path(state_dir) / 'selectors' / f"{source_id}.json"
+        self.stats: Dict[str, Dict[str, Dict[str, Any]]] = load_json_state(self.state_file, {})
+
+    def _entry(self, field: str, selector: str) -> Dict[str, Any]:
+        """Retourne (en la créant si besoin) l'entrée de statistiques d'un sélecteur"""
+        field_stats = self.stats.setdefault(field, {})
+        return field_stats.setdefault(selector, {
+            'hits': 0,
+            'misses': 0,
+            'consecutive_misses': 0,
+            'last_hit': None,
+        })
+
+    def is_failing(self, field: str, selector: str) -> bool:
+        """
+        Indique si un sélecteur échoue réellement (assez de tentatives, échecs répétés ou taux de succès faible)
+
+        Args:
+            field: Nom du champ
+            selector: Sélecteur CSS
+
+        Returns:
+            True si le sélecteur doit céder sa place
+        """
+        entry = self.stats.get(field, {}).get(selector)
+        if not entry or entry['hits'] + entry['misses'] < MIN_ATTEMPTS:
+            return False
+        hit_rate = entry['hits'] / (entry['hits'] + entry['misses'])
+        return entry['consecutive_misses'] >= DEMOTE_CONSECUTIVE_MISSES or hit_rate < DEMOTE_HIT_RATE
+
+    def order(self, field: str, selectors: List[str]) -> List[str]:
+        """
+        Réordonne les sélecteurs d'un champ selon l'historique observé
+
+        L'ordre du YAML est conservé tant que le premier sélecteur fonctionne : un
+        fallback n'est essayé qu'après un échec du premier, son taux de succès est
+        donc biaisé (un fallback large comme "a" trouve presque toujours quelque
+        chose). Ce n'est que lorsque le premier échoue réellement (voir is_failing)
+        que le fallback au meilleur taux de succès, sur assez de tentatives, passe en tête.
+
+        Args:
+            field: Nom du champ (title, link, date, description)
+            selectors: Sélecteurs dans l'ordre de la configuration
+
+        Returns:
+            Sélecteurs dans l'ordre à essayer
+        """
+        if not selectors or not self.is_failing(field, selectors[0]):
+            return list(selectors)
+
+        field_stats = self.stats.get(field, {})
+        best_selector = None
+        best_score = (0.0, 0)
+
+        for selector in selectors[1:]:
+            entry = field_stats.get(selector)
+            if not entry or entry['hits'] + entry['misses'] < MIN_ATTEMPTS or self.is_failing(field, selector):
+                continue
+            score = (entry['hits'] / (entry['hits'] + entry['misses']), entry['hits'])
+            if score > best_score:
+                best_selector, best_score = selector, score
+
+        if best_selector is None:
+            return list(selectors)
+
+        logger.info(f"Promoting selector '{best_selector}' for {self.source_id}.{field} "
+                    f"(hit rate {best_score[0]:.0%})")
+        return [best_selector] + [s for s in selectors if s != best_selector]
+
+    def record(self, field: str, selector: str, hit: bool) -> None:
+        """
+        Enregistre le résultat d'une tentative de sélecteur
+
+        Args:
+            field: Nom du champ
+            selector: Sélecteur CSS essayé
+            hit: True si le sélecteur a retourné une valeur
+        """
+        entry = self._entry(field, selector)
+        if hit:
+            entry['hits'] += 1
+            entry['consecutive_misses'] = 0
+            entry['last_hit'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        else:
+            entry['misses'] += 1
+            entry['consecutive_misses'] += 1
+
+    def stale_selectors(self, threshold: int = DEFAULT_STALE_THRESHOLD) -> List[Dict[str, Any]]:
+        """
+        Liste les sélecteurs qui ne matchent plus
+
+        Args:
+            threshold: Nombre minimal d'échecs consécutifs pour signaler un sélecteur
+
+        Returns:
+            Liste de dictionnaires décrivant chaque sélecteur en échec
+        """
+        stale = []
+        for field, field_stats in self.stats.items():
+            for selector, entry in field_stats.items():
+                if entry['consecutive_misses'] >= threshold:
+                    stale.append({
+                        'source': self.source_id,
+                        'field': field,
+                        'selector': selector,
+                        'hits': entry['hits'],
+                        'consecutive_misses': entry['consecutive_misses'],
+                        'last_hit': entry['last_hit'],
+                        'never_matched': entry['hits'] == 0,
+                    })
+        return stale
+
+    def save(self) -> None:
+        """Persiste les statistiques sur disque"""
+        try:
+            save_json_state(self.state_file, self.stats)
+        except Exception as e:
+            logger.warning(f"Failed to save selector health for {self.source_id}: {e}")
+
+
+def selector_health_report(state_dir: Path = STATE_DIR,
+                           threshold: int = DEFAULT_STALE_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Construit le rapport des sélecteurs cassés pour toutes les sources connues
+
+    Args:
+        state_dir: Répertoire de l'état persistant
+        threshold: Nombre minimal d'échecs consécutifs pour signaler un sélecteur
+
+    Returns:
+        Liste des sélecteurs en échec, toutes sources confondues
+    """
+    report = []
+    selectors_dir = Path(state_dir) / 'selectors'
+    if not selectors_dir.is_dir():
+        return report
+
+    for state_file in sorted(selectors_dir.glob('*.json')):
+        health = SelectorHealth(state_file.stem, state_dir)
+        report.extend(health.stale_selectors(threshold))
+
+    return report
@@ -0,0 +1,53 @@
+"""
+Instantanés des derniers articles scrapés avec succès
+Permettent de continuer à servir un flux quand une source est temporairement indisponible
+"""
+from typing import List
+from pathlib import Path
+import logging
+
+from .utils import STATE_DIR, load_json_state, save_json_state
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+
+def _snapshot_file(source_id: str, state_dir: Path) -> Path:
+    """Chemin de l'instantané d'une source"""
+    return Path(state_dir) / 'snapshots' / f"{source_id}.json"
+
+
+def save_snapshot(source_id: str, articles: List[Article], state_dir: Path = STATE_DIR) -> None:
+    """
+    Sauvegarde le dernier lot d'articles valide d'une source
+
+    Args:
+        source_id: Identifiant de la source (nom du fichier de config)
+        articles: Articles scrapés
+        state_dir: Répertoire de l'état persistant
+    """
+    try:
+        save_json_state(_snapshot_file(source_id, state_dir), [article.to_dict() for article in articles])
+    except Exception as e:
+        logger.warning(f"Failed to save snapshot for {source_id}: {e}")
+
+
+def load_snapshot(source_id: str, state_dir: Path = STATE_DIR) -> List[Article]:
+    """
+    Charge le dernier lot d'articles valide d'une source
+
+    Args:
+        source_id: Identifiant de la source
+        state_dir: Répertoire de l'état persistant
+
+    Returns:
+        Liste d'articles (vide si aucun instantané)
+    """
+    articles = []
+    for item in load_json_state(_snapshot_file(source_id, state_dir), []):
+        try:
+            articles.append(Article.from_dict(item))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Skipping invalid snapshot item for {source_id}: {e}")
+
+    return articles
@@ -1,13 +1,20 @@
 """
 Fonctions utilitaires pour le générateur RSS
 """
+import asyncio
 import yaml
-from typing import Dict, Any, Optional, List
+import json
+import os
+import tempfile
+from typing import Dict, Any, Optional, List, Callable
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Répertoire de l'état persistant entre deux exécutions (statistiques, caches...)
+STATE_DIR = Path('state')
+
 
 def load_yaml_config(config_path: str) -> Dict[str, Any]:
     """
@@ -86,6 +93,71 @@ def get_selector_value(selectors: Dict[str, Any]) -> List[str]:
     return result
 
 
+def load_json_state(state_file: Path, default: Any = None) -> Any:
+    """
+    Charge un fichier d'état JSON persistant
+
+    Args:
+        state_file: Chemin vers le fichier JSON
+        default: Valeur retournée si le fichier est absent ou illisible
+
+    Returns:
+        Contenu du fichier, ou la valeur par défaut
+    """
+    state_path = Path(state_file)
+    if not state_path.exists():
+        return default
+
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable state file {state_file}: {e}")
+        return default
+
+
+def save_json_state(state_file: Path, data: Any) -> None:
+    """
+    Écrit un fichier d'état JSON de manière atomique
+
+    Le contenu est d'abord écrit dans un fichier temporaire puis renommé,
+    afin qu'une exécution interrompue ne laisse jamais un fichier tronqué.
+
+    Args:
+        state_file: Chemin vers le fichier JSON
+        data: Données sérialisables en JSON
+    """
+    state_path = Path(state_file)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=state_path.parent, prefix=f".{state_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+        os.replace(tmp_path, state_path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, inline: bool = False) -> Any:
+    """
+    Exécute une fonction bloquante (fichiers, SQLite, parsing XML) sans bloquer la boucle asyncio
+
+    Args:
+        func: Fonction à appeler
+        *args: Arguments de la fonction
+        inline: True pour l'appeler dans le thread courant (exécution profilée :
+            cProfile ne voit que le thread où il est activé)
+
+    Returns:
+        Valeur retournée par la fonction
+    """
+    if inline:
+        return func(*args)
+    return await asyncio.to_thread(func, *args)
+
+
 def setup_logging(level: str = "INFO") -> None:
     """
     Configure le système de logging
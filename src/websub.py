@@ -0,0 +1,232 @@
+"""
+Publication WebSub (ex-PubSubHubbub)
+Les flux annoncent leur hub ; le hub n'est notifié que si le contenu d'un flux a réellement changé
+"""
+import hashlib
+import re
+import urllib.parse
+import urllib.request
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+from feedgen.ext.base import BaseExtension
+from feedgen.feed import FeedGenerator
+from feedgen.util import xml_elem
+import logging
+
+from .utils import STATE_DIR
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+
+# Notifications en attente (une par topic modifié), envoyées par flush_notifications() ;
+# dans state/ pour survivre à un échec de --notify-hubs (le flux, lui, ne changera plus)
+PENDING_DIR = STATE_DIR / 'websub_pending'
+
+# Éléments régénérés à chaque exécution, qui ne reflètent pas un changement de contenu
+_VOLATILE_ELEMENTS = re.compile(rb'<lastBuildDate>[^<]*</lastBuildDate>\s*')
+
+
+class WebSubExtension(BaseExtension):
+    """
+    Extension feedgen ajoutant <atom:link rel="hub"> au channel RSS
+
+    feedgen n'écrit que le lien rel="self" dans les flux RSS ; le lien vers
+    le hub doit donc être ajouté par extension.
+    """
+
+    def __init__(self):
+        self.__hubs: List[str] = []
+
+    def extend_ns(self) -> Dict[str, str]:
+        return {'atom': ATOM_NS}
+
+    def hub(self, href: Optional[str] = None) -> List[str]:
+        """
+        Ajoute un hub WebSub (ou retourne la liste des hubs)
+
+        Args:
+            href: URL du hub
+
+        Returns:
+            Liste des hubs déclarés
+        """
+        if href:
+            self.__hubs.append(href)
+        return self.__hubs
+
+    def extend_rss(self, rss_feed: Any) -> Any:
+        channel = rss_feed[0]
+        for href in self.__hubs:
+            xml_elem(f'{{{ATOM_NS}}}link', channel, href=href, rel='hub')
+        return rss_feed
+
+    def extend_atom(self, atom_feed: Any) -> Any:
+        for href in self.__hubs:
+            xml_elem(f'{{{ATOM_NS}}}link', atom_feed, href=href, rel='hub')
+        return atom_feed
+
+
+def topic_url(websub_config: Dict[str, Any], output_file: str) -> str:
+    """
+    URL publique (topic) d'un fichier de flux
+
+    Args:
+        websub_config: Section websub de sources.yaml
+        output_file: Nom du fichier dans output/
+
+    Returns:
+        URL publique du flux
+    """
+    return websub_config['base_url'].rstrip('/') + '/' + Path(output_file).name
+
+
+def apply_websub(feed: FeedGenerator, websub_config: Dict[str, Any], output_file: str) -> None:
+    """
+    Annonce le hub WebSub et l'URL publique (self) dans un flux
+
+    Args:
+        feed: Flux en cours de construction
+        websub_config: Section websub de sources.yaml
+        output_file: Nom du fichier dans output/
+    """
+    if not websub_config.get('enabled', False):
+        return
+
+    # feedgen utilise le dernier lien pour <link> en RSS : self doit passer avant alternate
+    existing_links = [dict(link) for link in feed.link()]
+    feed.link([{'href': topic_url(websub_config, output_file), 'rel': 'self'}] + existing_links, replace=True)
+    feed.register_extension('websub', WebSubExtension)
+    for hub in hub_urls(websub_config):
+        feed.websub.hub(hub)
+
+
+def hub_urls(websub_config: Dict[str, Any]) -> List[str]:
+    """Liste des hubs configurés (websub.hub accepte une URL ou une liste)"""
+    hubs = websub_config.get('hub', [])
+    return [hubs] if isinstance(hubs, str) else list(hubs)
+
+
+def content_fingerprint(rss_content: bytes) -> str:
+    """
+    Empreinte du contenu d'un flux, indépendante de sa date de génération
+
+    Args:
+        rss_content: XML du flux
+
+    Returns:
+        Empreinte SHA-256 hexadécimale
+    """
+    return hashlib.sha256(_VOLATILE_ELEMENTS.sub(b'', rss_content)).hexdigest()
+
+
+def write_feed_if_changed(output_path: Path, rss_content: bytes) -> bool:
+    """
+    Écrit un flux uniquement si son contenu a changé
+
+    Un flux identique n'est pas réécrit : lastBuildDate ne bouge pas, le fichier
+    n'est pas recommité et les lecteurs qui interrogent le flux ne retéléchargent rien.
+
+    Args:
+        output_path: Chemin du fichier de sortie
+        rss_content: XML du flux
+
+    Returns:
+        True si le fichier a été écrit, False s'il était déjà à jour
+    """
+    output_path = Path(output_path)
+    if output_path.exists():
+        try:
+            if content_fingerprint(output_path.read_bytes()) == content_fingerprint(rss_content):
+                return False
+        except OSError as e:
+            logger.debug(f"Could not read existing feed {output_path}: {e}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(rss_content)
+    return True
+
+
+def notify_hub(hub: str, topics: List[str], timeout: int = 10) -> bool:
+    """
+    Notifie un hub WebSub que des topics ont changé (hub.mode=publish)
+
+    Args:
+        hub: URL du hub
+        topics: URLs des flux modifiés
+        timeout: Délai maximal de la requête en secondes
+
+    Returns:
+        True si le hub a accepté la notification
+    """
+    body = urllib.parse.urlencode(
+        [('hub.mode', 'publish')] + [('hub.url', topic) for topic in topics]
+    ).encode('utf-8')
+    request = urllib.request.Request(hub, data=body, headers={
+        'Content-Type': 'application/x-www-form-urlencoded',
+    })
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            logger.info(f"Notified WebSub hub {hub} ({response.status}) for {len(topics)} topics")
+            return True
+    except Exception as e:
+        logger.warning(f"Failed to notify WebSub hub {hub}: {e}")
+        return False
+
+
+def queue_notification(websub_config: Dict[str, Any], output_file: str, changed: bool) -> None:
+    """
+    Met en attente la notification d'un flux dont le contenu a changé
+
+    La notification n'est pas envoyée tout de suite : le hub va relire le flux
+    à son URL publique, qui n'est à jour qu'une fois les fichiers publiés
+    (ex: après le git push du workflow). Un fichier par topic, afin que
+    plusieurs processus puissent écrire en parallèle.
+
+    Args:
+        websub_config: Section websub de sources.yaml
+        output_file: Nom du fichier dans output/
+        changed: True si le contenu du flux a changé
+    """
+    if not changed or not websub_config.get('enabled', False):
+        return
+
+    topic = topic_url(websub_config, output_file)
+    PENDING_DIR.mkdir(parents=True, exist_ok=True)
+    (PENDING_DIR / hashlib.sha1(topic.encode('utf-8')).hexdigest()).write_text(topic, encoding='utf-8')
+    logger.debug(f"Queued WebSub notification for {topic}")
+
+
+def flush_notifications(websub_config: Dict[str, Any]) -> int:
+    """
+    Envoie aux hubs les notifications en attente, regroupées en une requête par hub
+
+    Les notifications ne sont retirées de la file qu'une fois acceptées par
+    tous les hubs : sinon, elles sont renvoyées au prochain appel.
+
+    Args:
+        websub_config: Section websub de sources.yaml
+
+    Returns:
+        Nombre de topics notifiés
+    """
+    if not websub_config.get('enabled', False) or not PENDING_DIR.is_dir():
+        return 0
+
+    pending = sorted(PENDING_DIR.iterdir())
+    topics = [marker.read_text(encoding='utf-8') for marker in pending]
+    if not topics:
+        return 0
+
+    hubs = hub_urls(websub_config)
+    if not hubs:
+        logger.warning(f"No WebSub hub configured, keeping {len(topics)} pending notifications")
+        return 0
+
+    delivered = all([notify_hub(hub, topics) for hub in hubs])
+    if delivered:
+        for marker in pending:
+            marker.unlink(missing_ok=True)
+    return len(topics) if delivered else 0
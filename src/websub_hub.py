@@ -0,0 +1,314 @@
+"""
+Hub WebSub minimal, à lancer localement ou sur un petit serveur
+Usage:
+    python -m src.websub_hub --port 8080
+
+Gère les abonnements (avec vérification d'intention et durée de bail) et,
+à chaque notification de publication, relit le flux et le pousse aux abonnés.
+"""
+import argparse
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+import logging
+
+from .utils import load_json_state, save_json_state, setup_logging
+from .websub import content_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Hors de state/ et ignoré par git : les abonnements contiennent les secrets HMAC des abonnés
+DEFAULT_STATE_FILE = Path('websub_hub') / 'subscriptions.json'
+DEFAULT_LEASE_SECONDS = 10 * 24 * 3600
+MAX_LEASE_SECONDS = 30 * 24 * 3600
+REQUEST_TIMEOUT = 10
+
+
+class WebSubHub:
+    """
+    État du hub : abonnements par topic, avec l'empreinte du dernier contenu remis à chaque abonné
+    """
+
+    def __init__(self, state_file: Path = DEFAULT_STATE_FILE):
+        """
+        Charge l'état du hub
+
+        Args:
+            state_file: Fichier JSON des abonnements
+        """
+        self.state_file = Path(state_file)
+        self.lock = threading.Lock()
+
+        state = load_json_state(self.state_file, {})
+        # {topic: {callback: {'expires': timestamp, 'secret': str|None, 'fingerprint': str|None}}}
+        self.subscriptions: Dict[str, Dict[str, Dict[str, Any]]] = state.get('subscriptions', {})
+
+    def save(self) -> None:
+        """Écrit l'état du hub (appelé sous verrou ; fichier lisible par son seul propriétaire)"""
+        save_json_state(self.state_file, {'subscriptions': self.subscriptions})
+
+    def verify_intent(self, mode: str, topic: str, callback: str, lease_seconds: int) -> bool:
+        """
+        Vérifie auprès de l'abonné qu'il a bien demandé (dés)abonnement
+
+        Args:
+            mode: 'subscribe' ou 'unsubscribe'
+            topic: URL du flux
+            callback: URL de l'abonné
+            lease_seconds: Durée du bail demandée
+
+        Returns:
+            True si l'abonné a renvoyé le challenge
+        """
+        challenge = secrets.token_urlsafe(24)
+        params = {'hub.mode': mode, 'hub.topic': topic, 'hub.challenge': challenge}
+        if mode == 'subscribe':
+            params['hub.lease_seconds'] = str(lease_seconds)
+
+        separator = '&' if urllib.parse.urlparse(callback).query else '?'
+        url = callback + separator + urllib.parse.urlencode(params)
+
+        try:
+            with urllib.request.urlopen(url, timeout=REQUEST_TIMEOUT) as response:
+                body = response.read().decode('utf-8', errors='replace').strip()
+                return 200 <= response.status < 300 and body == challenge
+        except Exception as e:
+            logger.warning(f"Intent verification failed for {callback}: {e}")
+            return False
+
+    def handle_subscription(self, mode: str, topic: str, callback: str,
+                            lease_seconds: int, secret: Optional[str]) -> None:
+        """
+        Traite une demande d'abonnement ou de désabonnement (après la réponse 202)
+
+        Args:
+            mode: 'subscribe' ou 'unsubscribe'
+            topic: URL du flux
+            callback: URL de l'abonné
+            lease_seconds: Durée du bail
+            secret: Secret HMAC des notifications (optionnel)
+        """
+        if not self.verify_intent(mode, topic, callback, lease_seconds):
+            logger.info(f"Rejected {mode} of {callback} to {topic}")
+            return
+
+        with self.lock:
+            subscribers = self.subscriptions.setdefault(topic, {})
+            if mode == 'subscribe':
+                subscribers[callback] = {'expires': time.time() + lease_seconds, 'secret': secret,
+                                         'fingerprint': None}
+            else:
+                subscribers.pop(callback, None)
+                if not subscribers:
+                    del self.subscriptions[topic]
+            self.save()
+
+        logger.info(f"{mode.capitalize()}d {callback} to {topic}")
+
+    def active_subscribers(self, topic: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Abonnés dont le bail court encore (les baux expirés sont supprimés)
+
+        Args:
+            topic: URL du flux
+
+        Returns:
+            Dictionnaire callback → abonnement
+        """
+        now = time.time()
+        with self.lock:
+            subscribers = self.subscriptions.get(topic, {})
+            expired = [callback for callback, sub in subscribers.items() if sub['expires'] <= now]
+            for callback in expired:
+                del subscribers[callback]
+            if expired:
+                self.save()
+            return dict(subscribers)
+
+    def publish(self, topics: List[str]) -> None:
+        """
+        Relit les topics notifiés et pousse leur contenu aux abonnés qui ne l'ont pas encore reçu
+
+        L'empreinte du contenu n'est mémorisée, par abonné, qu'après une remise
+        réussie : un abonné injoignable le recevra à la publication suivante.
+
+        Args:
+            topics: URLs des flux modifiés
+        """
+        for topic in topics:
+            subscribers = self.active_subscribers(topic)
+            if not subscribers:
+                continue
+
+            try:
+                with urllib.request.urlopen(topic, timeout=REQUEST_TIMEOUT) as response:
+                    content = response.read()
+                    content_type = response.headers.get('Content-Type', 'application/rss+xml')
+            except Exception as e:
+                logger.warning(f"Failed to fetch topic {topic}: {e}")
+                continue
+
+            fingerprint = content_fingerprint(content)
+            pending = {callback: subscription for callback, subscription in subscribers.items()
+                       if subscription.get('fingerprint') != fingerprint}
+            if not pending:
+                logger.info(f"Topic unchanged, nothing to distribute: {topic}")
+                continue
+
+            delivered = [callback for callback, subscription in pending.items()
+                         if self.distribute(topic, callback, subscription.get('secret'), content, content_type)]
+            if delivered:
+                self.mark_delivered(topic, delivered, fingerprint)
+
+    def mark_delivered(self, topic: str, callbacks: List[str], fingerprint: str) -> None:
+        """
+        Mémorise le contenu remis aux abonnés (ceux désabonnés entre-temps sont ignorés)
+
+        Args:
+            topic: URL du flux
+            callbacks: Abonnés ayant accepté le contenu
+            fingerprint: Empreinte du contenu remis
+        """
+        with self.lock:
+            subscribers = self.subscriptions.get(topic, {})
+            for callback in callbacks:
+                if callback in subscribers:
+                    subscribers[callback]['fingerprint'] = fingerprint
+            self.save()
+
+    def distribute(self, topic: str, callback: str, secret: Optional[str],
+                   content: bytes, content_type: str) -> bool:
+        """
+        Envoie le contenu d'un topic à un abonné
+
+        Args:
+            topic: URL du flux
+            callback: URL de l'abonné
+            secret: Secret HMAC de l'abonnement (optionnel)
+            content: Contenu du flux
+            content_type: Type MIME du flux
+
+        Returns:
+            True si l'abonné a accepté le contenu
+        """
+        headers = {
+            'Content-Type': content_type,
+            'Link': f'<{topic}>; rel="self"',
+        }
+        if secret:
+            signature = hmac.new(secret.encode('utf-8'), content, hashlib.sha256).hexdigest()
+            headers['X-Hub-Signature'] = f'sha256={signature}'
+
+        request = urllib.request.Request(callback, data=content, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT):
+                logger.info(f"Delivered {topic} to {callback}")
+                return True
+        except Exception as e:
+            logger.warning(f"Failed to deliver {topic} to {callback}: {e}")
+            return False
+
+
+class HubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Point d'entrée HTTP du hub (POST application/x-www-form-urlencoded)
+    """
+
+    hub: WebSubHub
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get('Content-Length', 0))
+        params = urllib.parse.parse_qs(self.rfile.read(length).decode('utf-8'))
+        mode = params.get('hub.mode', [''])[0]
+
+        if mode in ('subscribe', 'unsubscribe'):
+            topic = params.get('hub.topic', [''])[0]
+            callback = params.get('hub.callback', [''])[0]
+            if not topic or not callback.startswith(('http://', 'https://')):
+                self.respond(400, 'hub.topic and a valid hub.callback are required')
+                return
+
+            try:
+                lease_seconds = int(params.get('hub.lease_seconds', [DEFAULT_LEASE_SECONDS])[0])
+            except ValueError:
+                lease_seconds = DEFAULT_LEASE_SECONDS
+            lease_seconds = max(1, min(lease_seconds, MAX_LEASE_SECONDS))
+            secret = params.get('hub.secret', [None])[0]
+
+            # La vérification d'intention est asynchrone : répondre 202 tout de suite
+            self.respond(202, 'Accepted')
+            threading.Thread(
+                target=self.hub.handle_subscription,
+                args=(mode, topic, callback, lease_seconds, secret),
+                daemon=True,
+            ).start()
+
+        elif mode == 'publish':
+            topics = params.get('hub.url', []) + params.get('hub.topic', [])
+            if not topics:
+                self.respond(400, 'hub.url is required')
+                return
+
+            self.respond(204)
+            threading.Thread(target=self.hub.publish, args=(topics,), daemon=True).start()
+
+        else:
+            self.respond(400, f'Unsupported hub.mode: {mode}')
+
+    def respond(self, status: int, message: str = '') -> None:
+        body = message.encode('utf-8')
+        self.send_response(status)
+        if body:
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def run_hub(host: str = '127.0.0.1', port: int = 8080, state_file: Path = DEFAULT_STATE_FILE) -> None:
+    """
+    Lance le hub jusqu'à interruption (Ctrl+C)
+
+    Args:
+        host: Adresse d'écoute
+        port: Port d'écoute
+        state_file: Fichier JSON des abonnements
+    """
+    HubRequestHandler.hub = WebSubHub(state_file)
+    server = ThreadingHTTPServer((host, port), HubRequestHandler)
+    logger.info(f"WebSub hub listening on http://{host}:{port}/")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("WebSub hub stopped")
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Hub WebSub minimal')
+    parser.add_argument('--host', default='127.0.0.1', help="Adresse d'écoute (défaut: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8080, help="Port d'écoute (défaut: 8080)")
+    parser.add_argument('--state-file', type=Path, default=DEFAULT_STATE_FILE,
+                        help=f'Fichier des abonnements (défaut: {DEFAULT_STATE_FILE})')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args()
+
+    setup_logging(args.log_level)
+    run_hub(args.host, args.port, args.state_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Tests du moteur d'extraction par API (chemins JSON, champs, capture des réponses)
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.api_engine import ApiExtractor, json_path, json_path_first, parse_json_path
+from src.scraper import GenericScraper
+
+PAYLOAD = {
+    'data': {
+        'posts': [
+            {'title': 'First', 'slug': 'first', 'publishedAt': 1736157600, 'author': {'name': 'Ada'}},
+            {'title': 'Second', 'slug': 'second', 'publishedAt': 1736244000000, 'meta data': {'lead': 'Lead'}},
+        ],
+    },
+}
+
+FIELDS = {
+    'title': 'title',
+    'link': {'path': 'slug', 'template': '/blog/{}'},
+    'date': 'publishedAt',
+    'description': "$['meta data'].lead",
+}
+
+
+def test_parse_json_path():
+    assert parse_json_path('$.data.posts[*]') == ['data', 'posts', '*']
+    assert parse_json_path("$['meta data'][0]") == ['meta data', 0]
+    assert parse_json_path('$["key"][-1].*') == ['key', -1, '*']
+    assert parse_json_path('author.name') == ['author', 'name']
+    assert parse_json_path('$') == []
+    with pytest.raises(ValueError):
+        parse_json_path('$.data[posts]')
+
+
+def test_json_path():
+    assert [post['title'] for post in json_path(PAYLOAD, '$.data.posts[*]')] == ['First', 'Second']
+    assert json_path(PAYLOAD, '$.data.posts[*].author.name') == ['Ada']
+    assert json_path(PAYLOAD, '$.data.posts[-1].slug') == ['second']
+    assert json_path(PAYLOAD, '$.data.posts[5]') == []
+    assert json_path({'a': {'x': 1, 'y': 2}}, '$.a.*') == [1, 2]
+    assert json_path_first({'a': ['', None, 'b']}, '$.a[*]') == 'b'
+
+
+def test_field_value_templates_and_timestamps():
+    extractor = ApiExtractor({'url_pattern': '/api/posts', 'items': '$.data.posts[*]', 'fields': FIELDS})
+
+    first, second = extractor.extract(PAYLOAD)
+
+    assert first == {'title': 'First', 'link': '/blog/first', 'date': '2025-01-06T10:00:00+00:00',
+                     'description': None}
+    # Timestamp en millisecondes
+    assert second['date'] == '2025-01-07T10:00:00+00:00'
+    assert second['description'] == 'Lead'
+
+
+def test_url_pattern_is_required():
+    with pytest.raises(ValueError):
+        ApiExtractor({'fields': FIELDS})
+    with pytest.raises(ValueError):
+        ApiExtractor({'url_pattern': '/api/', 'fields': {'title': '$.[oops'}})
+
+
+class FakeResponse:
+    def __init__(self, url, payload):
+        self.url = url
+        self.request = SimpleNamespace(resource_type='fetch', method='GET')
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+
+class FakePage:
+    """Page qui émet ses réponses réseau après la navigation"""
+
+    url = 'https://example.com/blog'
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    async def goto(self, url, **kwargs):
+        loop = asyncio.get_running_loop()
+        for delay, response in enumerate(self.responses, start=1):
+            for handler in self.handlers:
+                loop.call_later(delay * 0.01, handler, response)
+
+
+def api_scraper(url_pattern):
+    return GenericScraper({
+        'source': {'name': 'Example', 'url': 'https://example.com/blog'},
+        'scraping': {'engine': 'api', 'wait_time': 500, 'url_handling': {'base_url': 'https://example.com'},
+                     'api': {'url_pattern': url_pattern, 'items': '$.data.posts[*]', 'fields': FIELDS}},
+    }, source_id='example')
+
+
+def test_scrape_api_keeps_capturing_past_responses_without_articles():
+    scraper = api_scraper('/api/')
+    page = FakePage([FakeResponse('https://example.com/api/config', {'theme': 'dark'}),
+                     FakeResponse('https://example.com/api/posts', PAYLOAD)])
+
+    articles = asyncio.run(scraper.scrape_api(page, scraper.listings[0]))
+
+    assert [article.link for article in articles] == ['https://example.com/blog/first',
+                                                      'https://example.com/blog/second']
+    assert scraper.discovered_endpoint == 'https://example.com/api/posts'
+
+
+def test_scrape_api_without_articles_stops_at_wait_time():
+    scraper = api_scraper('/api/')
+    page = FakePage([FakeResponse('https://example.com/api/config', {'theme': 'dark'})])
+
+    assert asyncio.run(scraper.scrape_api(page, scraper.listings[0])) == []
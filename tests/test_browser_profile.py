@@ -0,0 +1,73 @@
+"""
+Tests des profils navigateur persistants (limites de taille, purge)
+"""
+import os
+import time
+
+from src.browser_profile import (chromium_cache_args, directory_size, enforce_profile_limit, profile_dir,
+                                 prune_stale_profiles, touch_profile)
+
+MB = 1024 * 1024
+
+
+def write_file(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'\0' * size)
+
+
+def test_profile_dir_is_created(tmp_path):
+    profile = profile_dir('example', tmp_path)
+    assert profile == tmp_path / 'example' and profile.is_dir()
+
+
+def test_chromium_cache_args(tmp_path):
+    assert chromium_cache_args(tmp_path, 50) == [
+        f"--disk-cache-dir={tmp_path / 'http-cache'}",
+        f"--disk-cache-size={50 * MB}",
+    ]
+
+
+def test_profile_under_limit_is_untouched(tmp_path):
+    write_file(tmp_path / 'Default' / 'IndexedDB' / 'db', MB // 2)
+
+    enforce_profile_limit(tmp_path, 1)
+
+    assert (tmp_path / 'Default' / 'IndexedDB' / 'db').exists()
+
+
+def test_auxiliary_data_is_evicted_first(tmp_path):
+    write_file(tmp_path / 'Default' / 'Cookies', MB // 2)
+    write_file(tmp_path / 'Default' / 'Service Worker' / 'cache', MB)
+    write_file(tmp_path / 'Default' / 'IndexedDB' / 'db', MB)
+
+    enforce_profile_limit(tmp_path, 1)
+
+    assert (tmp_path / 'Default' / 'Cookies').exists()
+    assert not (tmp_path / 'Default' / 'Service Worker').exists()
+    assert not (tmp_path / 'Default' / 'IndexedDB').exists()
+    assert directory_size(tmp_path) == MB // 2
+
+
+def test_profile_still_over_limit_is_reset(tmp_path):
+    profile = tmp_path / 'example'
+    write_file(profile / 'http-cache' / 'data', 2 * MB)
+
+    enforce_profile_limit(profile, 1)
+
+    assert profile.is_dir() and list(profile.iterdir()) == []
+
+
+def test_prune_stale_profiles(tmp_path):
+    old = profile_dir('old', tmp_path)
+    recent = profile_dir('recent', tmp_path)
+    long_ago = time.time() - 40 * 86400
+    os.utime(old, (long_ago, long_ago))
+    os.utime(recent, (long_ago, long_ago))
+    touch_profile(recent)
+
+    assert prune_stale_profiles(30, tmp_path) == ['old']
+    assert not old.exists() and recent.exists()
+
+
+def test_prune_without_profiles(tmp_path):
+    assert prune_stale_profiles(30, tmp_path / 'missing') == []
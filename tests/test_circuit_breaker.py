@@ -0,0 +1,83 @@
+"""
+Tests du disjoncteur par source
+"""
+from datetime import datetime, timezone, timedelta
+
+from src.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+
+def expire_cooldown(breaker):
+    opened_at = datetime.now(timezone.utc) - breaker.cooldown - timedelta(seconds=1)
+    breaker.state['opened_at'] = opened_at.isoformat(timespec='seconds')
+
+
+def test_opens_after_consecutive_failures(tmp_path):
+    breaker = CircuitBreaker('example', failure_threshold=3, state_dir=tmp_path)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.status == CLOSED and breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.status == OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count(tmp_path):
+    breaker = CircuitBreaker('example', failure_threshold=2, state_dir=tmp_path)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.status == CLOSED
+    assert breaker.state['consecutive_failures'] == 1
+
+
+def test_half_open_probe_success_closes(tmp_path):
+    breaker = CircuitBreaker('example', failure_threshold=1, state_dir=tmp_path)
+    breaker.record_failure()
+    expire_cooldown(breaker)
+
+    assert breaker.status == HALF_OPEN and breaker.allow_request()
+    breaker.record_success()
+
+    assert breaker.status == CLOSED
+    assert breaker.state == {'status': CLOSED, 'consecutive_failures': 0, 'opened_at': None}
+
+
+def test_half_open_probe_failure_reopens_for_a_new_cooldown(tmp_path):
+    breaker = CircuitBreaker('example', failure_threshold=3, state_dir=tmp_path)
+    for _ in range(3):
+        breaker.record_failure()
+    expire_cooldown(breaker)
+    assert breaker.status == HALF_OPEN
+
+    breaker.record_failure()
+
+    assert breaker.status == OPEN and not breaker.allow_request()
+    opened_at = datetime.fromisoformat(breaker.state['opened_at'])
+    assert datetime.now(timezone.utc) - opened_at < timedelta(minutes=1)
+
+
+def test_state_and_cooldown_persist(tmp_path):
+    breaker = CircuitBreaker('example', failure_threshold=1, cooldown_minutes=60, state_dir=tmp_path)
+    breaker.record_failure()
+
+    assert (tmp_path / 'circuits' / 'example.json').exists()
+    reloaded = CircuitBreaker('example', failure_threshold=1, cooldown_minutes=60, state_dir=tmp_path)
+    assert reloaded.status == OPEN
+    assert reloaded.state['opened_at'] == breaker.state['opened_at']
+
+    # Un refroidissement plus court dans la configuration s'applique au disjoncteur déjà ouvert
+    shorter = CircuitBreaker('example', failure_threshold=1, cooldown_minutes=0, state_dir=tmp_path)
+    assert shorter.status == HALF_OPEN
+
+
+def test_from_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert CircuitBreaker.from_config('example', {'enabled': False}) is None
+
+    breaker = CircuitBreaker.from_config('example', {'failure_threshold': 5, 'cooldown_minutes': 30})
+    assert breaker.failure_threshold == 5
+    assert breaker.cooldown == timedelta(minutes=30)
@@ -0,0 +1,231 @@
+"""
+Tests de l'ingestion sans navigateur (sitemaps et flux RSS/Atom)
+"""
+import gzip
+import io
+import time
+from datetime import datetime, timezone
+
+from src.archives import REPLAY, document_path
+import pytest
+
+from src.feed_sources import DeadlineExceeded, FeedIngester, iter_elements, parse_feed_date, title_from_url
+
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <title>Blog</title>
+  <item><title>First</title><link>https://example.com/blog/first</link>
+    <pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate><description>One</description></item>
+  <item><title>Second</title><link>/blog/second</link>
+    <pubDate>Tue, 07 Jan 2025 10:00:00 GMT</pubDate></item>
+  <item><title>No link</title></item>
+</channel></rss>
+"""
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry><title>Entry</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link href="https://example.com/entry"/>
+    <updated>2025-01-08T09:00:00Z</updated><summary>Summary</summary></entry>
+</feed>
+"""
+
+SITEMAP = b"""<?xml version="1.0"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://example.com/blog/new-model-release</loc><lastmod>2025-01-05</lastmod></url>
+  <url><loc>https://example.com/about</loc></url>
+  <url><loc>https://example.com/blog/launch</loc>
+    <news:news><news:title>Launch day</news:title>
+      <news:publication_date>2025-01-06T09:00:00Z</news:publication_date></news:news></url>
+</urlset>
+"""
+
+
+def make_config(source_type, url, **type_config):
+    return {
+        'source': {'name': 'Example', 'url': url, 'type': source_type},
+        source_type: type_config,
+        'scraping': {'url_handling': {'base_url': 'https://example.com'}},
+    }
+
+
+def replay_ingester(tmp_path, monkeypatch, config, documents):
+    """Ingesteur en mode replay, les documents étant servis depuis archives/"""
+    monkeypatch.chdir(tmp_path)
+    for url, content in documents.items():
+        archive = document_path('example', url)
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        archive.write_bytes(content)
+    return FeedIngester(config, source_id='example', network_mode=REPLAY)
+
+
+def test_parse_feed_date_formats():
+    assert parse_feed_date('Mon, 06 Jan 2025 10:00:00 GMT') == datetime(2025, 1, 6, 10, tzinfo=timezone.utc)
+    assert parse_feed_date('2025-01-05') == datetime(2025, 1, 5, tzinfo=timezone.utc)
+    assert parse_feed_date('not a date') is None
+    assert parse_feed_date(None) is None
+
+
+def test_title_from_url():
+    assert title_from_url('https://example.com/blog/new-model-release/') == 'New model release'
+    assert title_from_url('https://example.com/posts/hello_world.html') == 'Hello world'
+
+
+def test_iter_elements_detaches_processed_elements():
+    items = ''.join(f'<item><title>{i}</title></item>' for i in range(1000))
+    document = f'<rss><channel><title>Blog</title>{items}</channel></rss>'.encode()
+
+    titles = []
+    channel = None
+    for element in iter_elements(io.BytesIO(document), ('item', 'channel')):
+        if element.tag == 'channel':
+            channel = element
+            break
+        titles.append(element.find('title').text)
+
+    assert titles == [str(i) for i in range(1000)]
+    # À la fermeture du channel, les items traités n'y sont plus attachés
+    assert [child.tag for child in channel] == ['title']
+
+
+def test_ingest_rss_feed(tmp_path, monkeypatch):
+    config = make_config('feed', 'https://example.com/feed.xml')
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {'https://example.com/feed.xml': RSS})
+
+    articles = ingester.ingest()
+
+    assert [article.title for article in articles] == ['Second', 'First']
+    assert articles[0].link == 'https://example.com/blog/second'
+    assert articles[0].description == 'Second'
+    assert articles[1].description == 'One'
+    assert articles[1].source == 'Example'
+
+
+def test_ingest_atom_feed_prefers_alternate_link(tmp_path, monkeypatch):
+    config = make_config('feed', 'https://example.com/atom.xml')
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {'https://example.com/atom.xml': ATOM})
+
+    [article] = ingester.ingest()
+
+    assert article.link == 'https://example.com/entry'
+    assert article.date == datetime(2025, 1, 8, 9, tzinfo=timezone.utc)
+    assert article.description == 'Summary'
+
+
+def test_ingest_sitemap_filters_and_titles(tmp_path, monkeypatch):
+    config = make_config('sitemap', 'https://example.com/sitemap.xml', include='/blog/')
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {'https://example.com/sitemap.xml': SITEMAP})
+
+    articles = ingester.ingest()
+
+    assert {article.title for article in articles} == {'New model release', 'Launch day'}
+    assert all('/blog/' in article.link for article in articles)
+
+
+def test_ingest_sitemap_index(tmp_path, monkeypatch):
+    index = b"""<?xml version="1.0"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-blog.xml</loc></sitemap>
+</sitemapindex>
+"""
+    config = make_config('sitemap', 'https://example.com/sitemap.xml')
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {
+        'https://example.com/sitemap.xml': index,
+        'https://example.com/sitemap-blog.xml': SITEMAP,
+    })
+
+    # /about n'a pas de lastmod : ignorée, le sitemap ayant des URLs datées
+    assert [article.title for article in ingester.ingest()] == ['Launch day', 'New model release']
+
+
+def sitemap(urls):
+    entries = ''.join(f'<url><loc>{loc}</loc>{f"<lastmod>{lastmod}</lastmod>" if lastmod else ""}</url>'
+                      for loc, lastmod in urls)
+    return (f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f'{entries}</urlset>').encode()
+
+
+def test_ingest_sitemap_keeps_most_recent_max_items(tmp_path, monkeypatch):
+    urls = [(f'https://example.com/blog/post-{day}', f'2025-01-{day:02d}') for day in (3, 9, 1, 7, 5)]
+    config = make_config('sitemap', 'https://example.com/sitemap.xml', max_items=2)
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {'https://example.com/sitemap.xml': sitemap(urls)})
+
+    assert [article.link for article in ingester.ingest()] == ['https://example.com/blog/post-9',
+                                                               'https://example.com/blog/post-7']
+
+
+def test_ingest_undated_sitemap_is_capped(tmp_path, monkeypatch):
+    urls = [(f'https://example.com/blog/post-{i}', None) for i in range(5)]
+    config = make_config('sitemap', 'https://example.com/sitemap.xml', max_items=3)
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {'https://example.com/sitemap.xml': sitemap(urls)})
+
+    assert {article.link for article in ingester.ingest()} == {f'https://example.com/blog/post-{i}'
+                                                               for i in range(3)}
+
+
+def test_relative_links_resolve_against_their_document(tmp_path, monkeypatch):
+    config = make_config('feed', 'https://example.com/news/feed.xml')
+    config['scraping'] = {}
+    feed = RSS.replace(b'<link>/blog/second</link>', b'<link>second</link>')
+    ingester = replay_ingester(tmp_path, monkeypatch, config, {'https://example.com/news/feed.xml': feed})
+
+    assert ingester.ingest()[0].link == 'https://example.com/news/second'
+
+
+def test_open_stream_closes_gzip_response(monkeypatch):
+    class FakeResponse(io.BytesIO):
+        headers = {'Content-Encoding': 'gzip'}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.close()
+
+    response = FakeResponse(gzip.compress(RSS))
+    monkeypatch.setattr('urllib.request.urlopen', lambda request, timeout: response)
+    ingester = FeedIngester(make_config('feed', 'https://example.com/feed.xml'), source_id='example')
+
+    with ingester.open_stream('https://example.com/feed.xml') as stream:
+        assert stream.read() == RSS
+
+    assert response.closed
+
+
+class SlowFeed(io.RawIOBase):
+    """Flux RSS sans fin, un article par lecture"""
+
+    def __init__(self):
+        self.chunks = [b'<?xml version="1.0"?><rss version="2.0"><channel>']
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        time.sleep(0.01)
+        chunk = self.chunks.pop() if self.chunks else b'<item><title>T</title><link>https://example.com/t</link></item>'
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def test_ingest_stops_at_deadline(monkeypatch):
+    ingester = FeedIngester(make_config('feed', 'https://example.com/feed.xml'), source_id='example',
+                            deadline=time.monotonic() + 0.2)
+    monkeypatch.setattr(ingester, 'open_stream', lambda url: SlowFeed())
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        ingester.ingest()
+    assert time.monotonic() - start < 1
+
+
+def test_ingest_past_deadline_does_not_open_network(monkeypatch):
+    ingester = FeedIngester(make_config('feed', 'https://example.com/feed.xml'), source_id='example',
+                            deadline=time.monotonic() - 1)
+    monkeypatch.setattr('urllib.request.urlopen', lambda *args, **kwargs: pytest.fail('network opened'))
+
+    with pytest.raises(DeadlineExceeded):
+        ingester.ingest()
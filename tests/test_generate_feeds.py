@@ -0,0 +1,69 @@
+"""
+Tests des fonctions du script principal (résultats des shards, budget, code de sortie)
+"""
+import os
+
+import pytest
+
+import generate_feeds
+from src.pipeline import SUCCESS, FAILED, SKIPPED
+from src.scheduler import DeadlineBudget
+from src.utils import load_json_state, save_json_state
+
+
+@pytest.fixture
+def shard_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_feeds, 'SHARD_RESULTS_DIR', tmp_path)
+    return tmp_path
+
+
+def test_save_shard_results_removes_other_shard_counts(shard_dir):
+    save_json_state(shard_dir / '1-of-3.json', {'openai': 'success'})
+    save_json_state(shard_dir / '1-of-2.json', {'mistral': 'failed'})
+
+    generate_feeds.save_shard_results(2, 2, {'anthropic': 'success'})
+
+    assert sorted(path.name for path in shard_dir.iterdir()) == ['1-of-2.json', '2-of-2.json']
+    assert load_json_state(shard_dir / '2-of-2.json') == {'anthropic': 'success'}
+
+
+def test_load_shard_results_ignores_stale_shard_counts(shard_dir):
+    save_json_state(shard_dir / '1-of-3.json', {'openai': 'success'})
+    os.utime(shard_dir / '1-of-3.json', (0, 0))
+    save_json_state(shard_dir / '1-of-2.json', {'mistral': 'success'})
+    save_json_state(shard_dir / '2-of-2.json', {'anthropic': 'failed'})
+
+    assert generate_feeds.load_shard_results() == {'mistral': 'success', 'anthropic': 'failed'}
+
+
+def test_load_shard_results_without_results(shard_dir):
+    assert generate_feeds.load_shard_results() == {}
+
+
+def test_sources_skipped_by_the_deadline_are_reported(tmp_path, monkeypatch):
+    # Sans historique, chaque source coûte 10s : une seule tient dans le budget
+    budget = DeadlineBudget(['a', 'b', 'c'], 12, scheduling_config={'reserve_seconds': 0}, state_dir=tmp_path)
+    processed = []
+
+    def process_source(source_name, *args):
+        processed.append(source_name)
+        budget.deadline_at -= 10  # La source a pris 10s
+        return SUCCESS
+
+    monkeypatch.setattr(generate_feeds, 'process_source', process_source)
+
+    results = generate_feeds.run_sources_with_deadline(budget, {})
+
+    assert processed == ['a']
+    assert results == {'a': SUCCESS, 'b': SKIPPED, 'c': SKIPPED}
+
+
+@pytest.mark.parametrize('statuses, expected', [
+    ([SKIPPED, SKIPPED], 0),
+    ([SUCCESS, SKIPPED], 0),
+    ([FAILED, SKIPPED], 1),
+])
+def test_exit_status_with_skipped_sources(statuses, expected):
+    with pytest.raises(SystemExit) as exit_info:
+        generate_feeds.exit_with_status({f"source{i}": status for i, status in enumerate(statuses)})
+    assert exit_info.value.code == expected
@@ -0,0 +1,69 @@
+"""
+Tests du modèle Article
+"""
+import dataclasses
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from src.models import Article, aware_datetime
+
+
+def test_aware_datetime():
+    naive = datetime(2025, 1, 6, 10, 0)
+    paris = datetime(2025, 1, 6, 10, 0, tzinfo=timezone(timedelta(hours=1)))
+
+    assert aware_datetime(naive) == datetime(2025, 1, 6, 10, 0, tzinfo=timezone.utc)
+    assert aware_datetime(paris) is paris
+    assert aware_datetime(None).tzinfo is not None
+
+
+def test_article_defaults():
+    article = Article(title='Title', link='https://example.com/a', date=datetime(2025, 1, 6), source='Example')
+
+    assert article.date.tzinfo == timezone.utc
+    assert article.description == 'Title'
+    assert article.guid == 'https://example.com/a'
+    assert article.author is None
+
+
+def test_articles_from_different_sources_sort_by_date():
+    naive = Article(title='A', link='a', date=datetime(2025, 1, 6, 12), source='A')
+    aware = Article(title='B', link='b', date=datetime(2025, 1, 6, 10, tzinfo=timezone.utc), source='B')
+
+    assert sorted([aware, naive], key=lambda article: article.date, reverse=True) == [naive, aware]
+
+
+def test_article_is_immutable_and_slotted():
+    article = Article(title='Title', link='link', date=None, source='Example')
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        article.title = 'Other'
+    assert not hasattr(article, '__dict__')
+
+
+def test_source_is_interned():
+    first = Article(title='A', link='a', date=None, source=''.join(['Mistral', ' AI']))
+    second = Article(title='B', link='b', date=None, source=''.join(['Mistral', ' A', 'I']))
+
+    assert first.source is second.source
+
+
+def test_dict_round_trip():
+    article = Article(title='Title', link='https://example.com/a', date=datetime(2025, 1, 6, tzinfo=timezone.utc),
+                      source='Example', description='Text', date_text='Jan 6, 2025', guid='id-1', author='Ada')
+
+    data = article.to_dict()
+
+    assert data['date'] == '2025-01-06T00:00:00+00:00'
+    assert Article.from_dict(data) == article
+
+
+def test_from_dict_legacy_snapshot():
+    article = Article.from_dict({'title': 'Title', 'link': 'link', 'date': '2025-01-06T10:00:00',
+                                 'description': None})
+
+    assert article.date == datetime(2025, 1, 6, 10, tzinfo=timezone.utc)
+    assert article.source == ''
+    assert article.description == 'Title'
+    assert 'author' not in article.to_dict()
@@ -0,0 +1,136 @@
+"""
+Tests du pipeline asynchrone sur une source de type feed (sans navigateur)
+"""
+import asyncio
+import io
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+import generate_feeds
+
+from src.circuit_breaker import CircuitBreaker
+from src.archives import REPLAY, REPLAY_OUTPUT_DIR, document_path
+from src.run_stats import load_run_stats
+from src.pipeline import (process_source_async, run_feeds_async, RunResult, SourceResult,
+                          SUCCESS, DEGRADED, FAILED)
+
+FEED_URL = 'https://example.com/feed.xml'
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+  <item><title>Archived post</title><link>https://example.com/archived</link>
+    <pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate></item>
+</channel></rss>
+"""
+
+
+def write_source(root: Path) -> None:
+    """Source 'example' (type feed) avec son archive de replay"""
+    (root / 'config').mkdir()
+    (root / 'config' / 'example.yaml').write_text(yaml.safe_dump({
+        'source': {'name': 'Example', 'url': FEED_URL, 'type': 'feed', 'description': 'Example blog'},
+        'rss': {'title': 'Example', 'link': 'https://example.com', 'output_file': 'example_rss.xml'},
+    }), encoding='utf-8')
+    (root / 'config' / 'sources.yaml').write_text(yaml.safe_dump({
+        'active_sources': ['example'],
+        'merge': {'enabled': True, 'output_file': 'merged_feed.xml', 'link': 'https://example.com'},
+        'search': {'enabled': True, 'db_path': 'state/articles.db',
+                   'queries': [{'name': 'All', 'query': 'archived', 'output_file': 'search_all.xml'}]},
+        'circuit_breaker': {'enabled': True},
+    }), encoding='utf-8')
+
+    archive = root / document_path('example', FEED_URL)
+    archive.parent.mkdir(parents=True)
+    archive.write_bytes(RSS)
+
+
+def test_replay_leaves_published_feeds_and_state_untouched(tmp_path, monkeypatch):
+    write_source(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = asyncio.run(run_feeds_async(network_mode=REPLAY))
+
+    assert result.sources['example'].status == SUCCESS
+    assert result.sources['example'].output_file == REPLAY_OUTPUT_DIR / 'example_rss.xml'
+    assert (REPLAY_OUTPUT_DIR / 'example_rss.xml').exists()
+    assert result.merged is None and result.query_feeds == {}
+    assert not Path('output').exists()
+    assert not Path('state').exists()
+
+
+def test_live_run_publishes_feed_and_state(tmp_path, monkeypatch):
+    write_source(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    # Ingestion "en ligne" servie par l'archive, pour rester hors réseau
+    sources_config = yaml.safe_load(Path('config/sources.yaml').read_text(encoding='utf-8'))
+    monkeypatch.setattr('src.feed_sources.FeedIngester.open_stream',
+                        lambda self, url: open(document_path('example', url), 'rb'))
+
+    result = asyncio.run(process_source_async('example', sources_config))
+
+    assert result.status == SUCCESS
+    assert result.new_articles == 1
+    assert Path('output/example_rss.xml').exists()
+    assert Path('state/snapshots/example.json').exists()
+    assert Path('state/articles.db').exists()
+
+
+def source_result(name, status):
+    return SourceResult(name, status != FAILED, from_snapshot=status == DEGRADED)
+
+
+@pytest.mark.parametrize('statuses, expected', [
+    ([SUCCESS, SUCCESS], 0),
+    ([SUCCESS, FAILED, DEGRADED], 0),
+    ([DEGRADED, FAILED], 1),
+    ([], 1),
+])
+def test_run_result_exit_code_matches_cli(statuses, expected):
+    results = {f"source{i}": status for i, status in enumerate(statuses)}
+    run_result = RunResult(sources={name: source_result(name, status) for name, status in results.items()})
+
+    with pytest.raises(SystemExit) as exit_info:
+        generate_feeds.exit_with_status(results)
+
+    assert run_result.exit_code == exit_info.value.code == expected
+    assert run_result.ok == (expected == 0)
+
+
+def test_feed_source_stops_at_its_timeout(tmp_path, monkeypatch):
+    write_source(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    sources_config = yaml.safe_load(Path('config/sources.yaml').read_text(encoding='utf-8'))
+
+    def endless_feed(self, url):
+        stream = io.BytesIO(RSS.replace(b'</channel></rss>', b'<item><title>T</title><link>x</link></item>' * 10**6))
+        stream.read = lambda size=-1, read=stream.read: time.sleep(0.01) or read(64)
+        return stream
+
+    monkeypatch.setattr('src.feed_sources.FeedIngester.open_stream', endless_feed)
+
+    start = time.monotonic()
+    result = asyncio.run(process_source_async('example', sources_config, timeout=0.3))
+
+    assert time.monotonic() - start < 2
+    assert result.timed_out and result.status == FAILED
+    # Le dépassement vient du budget : il n'est pas compté comme une panne de la source
+    breaker = CircuitBreaker.from_config('example', sources_config['circuit_breaker'])
+    assert breaker.state['consecutive_failures'] == 0
+
+
+def test_open_circuit_does_not_record_a_run(tmp_path, monkeypatch):
+    write_source(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    sources_config = yaml.safe_load(Path('config/sources.yaml').read_text(encoding='utf-8'))
+    breaker = CircuitBreaker.from_config('example', sources_config['circuit_breaker'])
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    result = asyncio.run(process_source_async('example', sources_config))
+
+    assert result.status == FAILED  # Aucun instantané à servir
+    # Aucun scraping tenté : la durée de l'exécution ne reflète pas le coût de la source
+    assert load_run_stats('example') == {}
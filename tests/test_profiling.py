@@ -0,0 +1,67 @@
+"""
+Tests du profilage (--profile) : artefacts par source et résumé classé
+"""
+import time
+from types import SimpleNamespace
+
+from src.profiling import (NetworkRecorder, SourceProfiler, network_log_path, profiling_run_dir,
+                           write_profile_summary)
+from src.utils import load_json_state
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def fake_request(url, response_end, resource_type='document'):
+    return SimpleNamespace(url=url, method='GET', resource_type=resource_type,
+                           timing={'responseEnd': response_end})
+
+
+def profile_source(run_dir, source_id, seconds, requests=()):
+    with SourceProfiler(source_id, run_dir):
+        busy_wait(seconds)
+    recorder = NetworkRecorder()
+    for request, failed in requests:
+        recorder.record(request, failed)
+    recorder.save(network_log_path(run_dir, source_id))
+
+
+def test_profiler_writes_profile_and_wall_time(tmp_path):
+    profile_source(tmp_path, 'example', 0.02)
+
+    assert (tmp_path / 'example.prof').exists()
+    meta = load_json_state(tmp_path / 'example.meta.json')
+    assert meta['source'] == 'example' and meta['wall_time'] >= 0.02
+
+
+def test_summary_ranks_sources_functions_and_requests(tmp_path):
+    profile_source(tmp_path, 'fast', 0.01, [(fake_request('https://fast.example/', 120.0), False)])
+    profile_source(tmp_path, 'slow', 0.05, [
+        (fake_request('https://slow.example/', 900.0), False),
+        (fake_request('https://slow.example/app.js', 300.0, 'script'), True),
+        (fake_request('https://slow.example/pending', -1), False),
+    ])
+
+    summary = write_profile_summary(tmp_path, top_functions=5, top_requests=2)
+
+    lines = summary.read_text(encoding='utf-8').splitlines()
+    sources = lines[1:lines.index('')]
+    assert [line.split()[-1] for line in sources] == ['slow', 'fast']
+    assert any('busy_wait' in line for line in lines)
+
+    requests = lines[lines.index('Slowest network requests (top 2)') + 1:]
+    assert [line.split()[0] for line in requests] == ['900.0ms', '300.0ms']
+    assert requests[1].endswith('https://slow.example/app.js FAILED')
+
+
+def test_summary_without_profiles(tmp_path):
+    assert write_profile_summary(tmp_path) is None
+    assert not (tmp_path / 'summary.txt').exists()
+
+
+def test_profiling_run_dir_is_created(tmp_path):
+    first = profiling_run_dir(tmp_path)
+    assert first.parent == tmp_path and first.is_dir()
@@ -0,0 +1,135 @@
+"""
+Tests de la répartition et de l'ordonnancement des sources
+"""
+import pytest
+
+from src.run_stats import record_run
+from src.scheduler import (MIN_SOURCE_TIMEOUT, DeadlineBudget, assign_shards, load_shard_costs, order_by_cost,
+                           order_by_value, parse_duration, parse_shard, save_shard_costs, shard_sources)
+from src.utils import load_json_state
+
+
+SOURCES = ['mistral', 'anthropic', 'anthropic_news', 'openai', 'huggingface', 'google', 'meta']
+
+
+def test_parse_shard():
+    assert parse_shard('2/4') == (2, 4)
+    for invalid in ('0/3', '4/3', '1/0', 'a/b', '3'):
+        with pytest.raises(ValueError):
+            parse_shard(invalid)
+
+
+@pytest.mark.parametrize('total', [1, 2, 3, 5, 10])
+def test_assign_shards_covers_every_source_once(total):
+    shards = assign_shards(SOURCES, total)
+
+    assigned = [source for shard in shards for source in shard]
+    assert sorted(assigned) == sorted(SOURCES)
+    assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+def test_assign_shards_ignores_configuration_order():
+    assert assign_shards(SOURCES, 3) == assign_shards(list(reversed(SOURCES)), 3)
+
+
+def test_assign_shards_balances_costs():
+    costs = {'a': 100.0, 'b': 50.0, 'c': 50.0, 'd': 10.0, 'e': 10.0}
+
+    shards = assign_shards(list(costs), 2, costs)
+
+    assert sorted(map(sorted, shards)) == [['a', 'd'], ['b', 'c', 'e']]
+    assert assign_shards(list(reversed(list(costs))), 2, costs) == shards
+
+
+def test_shard_membership_ignores_local_run_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    costs_file = tmp_path / 'shard_costs.json'
+    save_shard_costs(SOURCES, tmp_path / 'empty', costs_file)
+    before = [shard_sources(SOURCES, f"{index}/3", costs_file) for index in range(1, 4)]
+
+    # Un runner dont l'historique local a changé répartit de la même façon
+    for duration, source in enumerate(SOURCES):
+        record_run(source, 100.0 - duration * 10, True)
+
+    assert [shard_sources(SOURCES, f"{index}/3", costs_file) for index in range(1, 4)] == before
+
+
+def test_shard_sources_keeps_configuration_order(tmp_path):
+    selected = shard_sources(SOURCES, '1/2', tmp_path / 'shard_costs.json')
+    assert selected == [source for source in SOURCES if source in selected]
+
+
+def test_save_and_load_shard_costs(tmp_path):
+    costs_file = tmp_path / 'shard_costs.json'
+    record_run('mistral', 42.0, True, state_dir=tmp_path)
+    record_run('openai', 1.0, True, state_dir=tmp_path)
+
+    assert save_shard_costs(['openai', 'mistral'], tmp_path, costs_file) == {'mistral': 40.0, 'openai': 5.0}
+    assert load_json_state(costs_file) == {'mistral': 40.0, 'openai': 5.0}
+    # Source inconnue du fichier : médiane des coûts connus
+    assert load_shard_costs(['mistral', 'openai', 'meta'], costs_file) == {
+        'mistral': 40.0, 'openai': 5.0, 'meta': 22.5}
+
+    # Un écart sous l'arrondi ne réécrit pas le fichier
+    mtime = costs_file.stat().st_mtime_ns
+    record_run('mistral', 43.0, True, state_dir=tmp_path)
+    save_shard_costs(['openai', 'mistral'], tmp_path, costs_file)
+    assert costs_file.stat().st_mtime_ns == mtime
+
+
+def test_order_by_cost(tmp_path):
+    record_run('mistral', 5.0, True, state_dir=tmp_path)
+    record_run('anthropic', 30.0, True, state_dir=tmp_path)
+
+    # Sans historique, une source reçoit la médiane des coûts connus
+    assert order_by_cost(['mistral', 'openai', 'anthropic'], tmp_path) == ['anthropic', 'openai', 'mistral']
+
+
+def test_parse_duration():
+    assert parse_duration('90') == 90
+    assert parse_duration('90s') == 90
+    assert parse_duration('25m') == 1500
+    assert parse_duration('1.5h') == 5400
+    for invalid in ('', '0', '-5', '10d', 'm'):
+        with pytest.raises(ValueError):
+            parse_duration(invalid)
+
+
+def test_order_by_value(tmp_path):
+    costs = {'slow': 10.0, 'fast': 5.0, 'important': 10.0}
+
+    assert order_by_value(list(costs), costs, {'important': 3}, tmp_path) == ['important', 'fast', 'slow']
+
+
+def test_deadline_budget_shrinks_waits_then_skips(tmp_path):
+    # Sans historique, chaque source coûte DEFAULT_SOURCE_COST (10s)
+    budget = DeadlineBudget(['a', 'b', 'c'], 12, scheduling_config={'reserve_seconds': 0},
+                            state_dir=tmp_path)
+    assert budget.order == ['a', 'b', 'c']
+
+    wait_scale, timeout = budget.allocate('a')
+    # Les deux autres sources gardent 25 % de leur coût : il reste ~7s sur 10 pour la première,
+    # qui est interrompue au-delà pour ne pas consommer leur part
+    assert wait_scale == pytest.approx(0.7, abs=0.01)
+    assert timeout == pytest.approx(7, abs=0.1)
+
+    budget.deadline_at -= 10
+    assert budget.allocate('b') is None
+    assert list(budget.skipped) == ['b']
+    assert budget.pending == ['c']
+
+
+def test_deadline_budget_with_ample_time(tmp_path):
+    budget = DeadlineBudget(['a', 'b'], 600, scheduling_config={'reserve_seconds': 60}, state_dir=tmp_path)
+
+    assert budget.allocate('a') == (1.0, pytest.approx(20, abs=0.1))
+    assert budget.allocate('b') == (1.0, pytest.approx(20, abs=0.1))
+    assert budget.skipped == {}
+
+
+def test_deadline_budget_keeps_a_minimum_timeout_for_cheap_sources(tmp_path):
+    for _ in range(3):
+        record_run('fast', 1.0, True, 0, tmp_path)
+    budget = DeadlineBudget(['fast'], 600, scheduling_config={'reserve_seconds': 60}, state_dir=tmp_path)
+
+    assert budget.allocate('fast') == (1.0, MIN_SOURCE_TIMEOUT)
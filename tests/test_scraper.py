@@ -0,0 +1,86 @@
+"""
+Tests de la construction des articles par le scraper (sans navigateur)
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src import scraper as scraper_module
+from src.scraper import NAVIGATION_TIMEOUT, GenericScraper, scrape_source, scrape_source_async
+
+
+def make_scraper(url_handling=None, **kwargs):
+    return GenericScraper({
+        'source': {'name': 'Example', 'url': 'https://example.com/blog',
+                   'urls': ['https://example.com/blog', 'https://example.com/research/papers/']},
+        'scraping': {'adaptive_selectors': False, 'selectors': {},
+                     'url_handling': url_handling or {}},
+    }, source_id='example', **kwargs)
+
+
+def test_relative_links_resolve_against_their_listing_page():
+    scraper = make_scraper()
+
+    papers = 'https://example.com/research/papers/'
+    assert scraper.build_article('A', 'attention', None, None, papers).link == papers + 'attention'
+    assert scraper.build_article('B', '../news/launch', None, None, papers).link == \
+        'https://example.com/research/news/launch'
+    assert scraper.build_article('C', '/blog/c', None, None, papers).link == 'https://example.com/blog/c'
+    assert scraper.build_article('D', 'https://other.com/d', None, None, papers).link == 'https://other.com/d'
+
+
+def test_relative_links_default_to_source_url():
+    assert make_scraper().build_article('A', '/blog/a', None, None).link == 'https://example.com/blog/a'
+
+
+def test_configured_base_url_takes_precedence():
+    scraper = make_scraper({'base_url': 'https://example.com'})
+
+    article = scraper.build_article('A', '/blog/a', None, None, 'https://example.com/research/papers/')
+
+    assert article.link == 'https://example.com/blog/a'
+
+
+def test_make_absolute_disabled_keeps_link():
+    scraper = make_scraper({'make_absolute': False})
+    assert scraper.build_article('A', 'a', None, None, 'https://example.com/blog/').link == 'a'
+
+
+def test_navigation_timeout_follows_the_run_budget():
+    assert make_scraper().navigation_timeout() == NAVIGATION_TIMEOUT
+    assert make_scraper(wait_scale=0.5).navigation_timeout() == NAVIGATION_TIMEOUT // 2
+
+    near_deadline = make_scraper(wait_scale=0.5, deadline=time.monotonic() + 2)
+    assert 1000 < near_deadline.navigation_timeout() <= 2000
+    assert make_scraper(deadline=time.monotonic() - 1).navigation_timeout() == 1
+
+
+def test_scrape_source_async_reads_files_off_the_event_loop(tmp_path, monkeypatch):
+    config_file = tmp_path / 'example.yaml'
+    config_file.write_text("source: {name: Example, url: 'https://example.com/blog'}\n"
+                           "scraping: {selectors: {}}\n", encoding='utf-8')
+    loop_thread = threading.get_ident()
+    health_threads = []
+
+    class RecordingHealth:
+        def __init__(self, source_id):
+            health_threads.append(threading.get_ident())
+
+    async def fake_scrape(self, browser=None, context=None):
+        return []
+
+    monkeypatch.setattr(scraper_module, 'SelectorHealth', RecordingHealth)
+    monkeypatch.setattr(GenericScraper, 'scrape', fake_scrape)
+
+    assert asyncio.run(scrape_source_async(str(config_file))) == []
+    assert health_threads and loop_thread not in health_threads
+
+
+def test_scrape_source_refuses_a_running_loop():
+    async def call_from_loop():
+        scrape_source('config/openai.yaml')
+
+    with pytest.raises(RuntimeError, match='scrape_source_async'):
+        asyncio.run(call_from_loop())
@@ -0,0 +1,87 @@
+"""
+Tests de l'index de recherche plein texte et des flux de requêtes
+"""
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.models import Article
+from src.search import ArticleIndex, fts_query, generate_query_feed, generate_query_feeds
+from src.utils import load_yaml_config
+
+SOURCES_CONFIG = Path(__file__).resolve().parent.parent / 'config' / 'sources.yaml'
+
+
+def article(title, day, description='', source='Example'):
+    return Article(title=title, link=f"https://example.com/{title.lower().replace(' ', '-')}",
+                   date=datetime(2025, 1, day, tzinfo=timezone.utc), source=source, description=description)
+
+
+@pytest.fixture
+def index(tmp_path):
+    with ArticleIndex(tmp_path / 'articles.db') as index:
+        yield index
+
+
+def test_fts_query_quotes_terms():
+    assert fts_query('claude 3.5') == '"claude" "3.5"'
+    assert fts_query('agent*') == '"agent"*'
+    assert fts_query('say "hi"') == '"say" """hi"""'
+    assert fts_query(' * ') == ''
+
+
+def test_add_articles_counts_only_new_articles(index):
+    assert index.add_articles('example', [article('First agent', 1), article('Second', 2)]) == 2
+    assert index.add_articles('example', [article('First agent', 1), article('Third', 3)]) == 1
+    assert index.count() == 3
+
+
+def test_add_articles_updates_changed_articles(index):
+    index.add_articles('example', [article('Launch', 1, 'Old text')])
+
+    assert index.add_articles('example', [article('Launch', 1, 'Agents everywhere')]) == 0
+    assert [a.description for a in index.search('agents')] == ['Agents everywhere']
+    assert index.search('old') == []
+
+
+def test_search_prefix_order_and_source(index):
+    index.add_articles('mistral', [article('Agents', 1, source='Mistral AI')])
+    index.add_articles('anthropic', [article('Agentic coding', 3, source='Anthropic'),
+                                     article('Unrelated', 2, source='Anthropic')])
+
+    assert [a.title for a in index.search('agent*')] == ['Agentic coding', 'Agents']
+    assert [a.title for a in index.search('agent*', source_id='mistral')] == ['Agents']
+    assert index.search('agent*')[0].date == datetime(2025, 1, 3, tzinfo=timezone.utc)
+    assert index.search('') == []
+
+
+def test_search_ignores_accents(index):
+    index.add_articles('example', [article('Modèle génératif', 1)])
+    assert len(index.search('generatif')) == 1
+
+
+def test_default_query_feed_renders(tmp_path, monkeypatch):
+    sources_config = load_yaml_config(SOURCES_CONFIG)
+    search_config = dict(sources_config['search'], db_path=str(tmp_path / 'articles.db'))
+    monkeypatch.chdir(tmp_path)
+
+    with ArticleIndex.from_config(search_config) as index:
+        index.add_articles('example', [article('Building agents', 1), article('Other news', 2)])
+
+    results = generate_query_feeds(search_config, {}, sources_config['merge'].get('link'))
+
+    assert results and all(results.values())
+    for query_config in search_config['queries']:
+        channel = ET.parse(tmp_path / 'output' / query_config['output_file']).getroot().find('channel')
+        assert channel.findtext('link') == sources_config['merge']['link']
+        assert [item.findtext('title') for item in channel.iter('item')] == ['Building agents']
+
+
+def test_query_feed_without_link_fails_cleanly(index, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    query_config = {'name': 'Agents', 'query': 'agent*', 'output_file': 'agents.xml'}
+
+    assert generate_query_feed(index, query_config) is False
+    assert generate_query_feed(index, dict(query_config, link='https://example.com')) is True
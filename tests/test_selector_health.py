@@ -0,0 +1,90 @@
+"""
+Tests du suivi de santé des sélecteurs
+"""
+from src.selector_health import SelectorHealth, selector_health_report
+
+SELECTORS = ['h2.title', 'h3', '.headline']
+
+
+def record_many(health, field, selector, hits=0, misses=0):
+    for _ in range(hits):
+        health.record(field, selector, True)
+    for _ in range(misses):
+        health.record(field, selector, False)
+
+
+def test_order_without_history_keeps_configuration(tmp_path):
+    assert SelectorHealth('example', tmp_path).order('title', SELECTORS) == SELECTORS
+
+
+def test_order_promotes_best_hit_rate_when_primary_fails(tmp_path):
+    health = SelectorHealth('example', tmp_path)
+    record_many(health, 'title', 'h2.title', hits=1, misses=9)
+    record_many(health, 'title', 'h3', hits=6, misses=4)
+    record_many(health, 'title', '.headline', hits=9, misses=1)
+
+    assert health.order('title', SELECTORS) == ['.headline', 'h2.title', 'h3']
+    assert health.order('link', SELECTORS) == SELECTORS
+
+
+def test_order_keeps_working_primary_over_loose_fallback(tmp_path):
+    health = SelectorHealth('example', tmp_path)
+    # Un fallback large n'est essayé qu'après les rares échecs du principal : il réussit toujours
+    record_many(health, 'link', 'a.post-link', hits=98, misses=2)
+    record_many(health, 'link', 'a', hits=2)
+
+    assert health.order('link', ['a.post-link', 'a']) == ['a.post-link', 'a']
+
+
+def test_order_needs_enough_attempts(tmp_path):
+    health = SelectorHealth('example', tmp_path)
+    record_many(health, 'title', 'h2.title', misses=9)
+    record_many(health, 'title', 'h3', hits=9)
+    assert health.order('title', SELECTORS) == SELECTORS
+
+    health.record('title', 'h2.title', False)
+    assert health.order('title', SELECTORS) == SELECTORS  # h3 : seulement 9 tentatives
+
+    health.record('title', 'h3', True)
+    assert health.order('title', SELECTORS) == ['h3', 'h2.title', '.headline']
+
+
+def test_record_tracks_consecutive_misses(tmp_path):
+    health = SelectorHealth('example', tmp_path)
+    record_many(health, 'date', 'time', hits=2, misses=3)
+
+    entry = health.stats['date']['time']
+    assert (entry['hits'], entry['misses'], entry['consecutive_misses']) == (2, 3, 3)
+    assert entry['last_hit'] is not None
+
+    health.record('date', 'time', True)
+    assert entry['consecutive_misses'] == 0
+
+
+def test_stale_selectors(tmp_path):
+    health = SelectorHealth('example', tmp_path)
+    record_many(health, 'title', 'h2.title', hits=5, misses=3)
+    record_many(health, 'date', '.date', misses=4)
+
+    assert health.stale_selectors(threshold=5) == []
+    stale = health.stale_selectors(threshold=3)
+    assert [(s['field'], s['selector'], s['never_matched']) for s in stale] == [
+        ('title', 'h2.title', False), ('date', '.date', True)]
+
+
+def test_save_and_report(tmp_path):
+    health = SelectorHealth('example', tmp_path)
+    record_many(health, 'title', 'h2.title', hits=9, misses=1)
+    record_many(health, 'date', '.date', misses=3)
+    health.save()
+
+    reloaded = SelectorHealth('example', tmp_path)
+    assert reloaded.stats == health.stats
+    assert reloaded.order('title', ['h2.title', 'h3']) == ['h2.title', 'h3']
+
+    report = selector_health_report(tmp_path, threshold=3)
+    assert [(s['source'], s['field'], s['selector']) for s in report] == [('example', 'date', '.date')]
+
+
+def test_report_without_state(tmp_path):
+    assert selector_health_report(tmp_path / 'missing') == []
@@ -0,0 +1,70 @@
+"""
+Tests de la publication WebSub (file des notifications en attente)
+"""
+import pytest
+
+from src import websub
+from src.websub import content_fingerprint, flush_notifications, queue_notification
+
+CONFIG = {'enabled': True, 'hub': 'https://hub.example.com/', 'base_url': 'https://example.com/output/'}
+
+
+@pytest.fixture
+def pending_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(websub, 'PENDING_DIR', tmp_path / 'websub_pending')
+    return tmp_path / 'websub_pending'
+
+
+def fake_hub(monkeypatch, accept):
+    calls = []
+
+    def notify_hub(hub, topics, timeout=10):
+        calls.append((hub, topics))
+        return accept
+
+    monkeypatch.setattr(websub, 'notify_hub', notify_hub)
+    return calls
+
+
+def test_queue_only_changed_feeds(pending_dir):
+    queue_notification(CONFIG, 'example_rss.xml', changed=False)
+    assert not pending_dir.exists()
+
+    queue_notification(CONFIG, 'example_rss.xml', changed=True)
+    queue_notification(CONFIG, 'example_rss.xml', changed=True)
+    assert [marker.read_text() for marker in pending_dir.iterdir()] == [
+        'https://example.com/output/example_rss.xml']
+
+
+def test_failed_notification_stays_pending(pending_dir, monkeypatch):
+    queue_notification(CONFIG, 'example_rss.xml', changed=True)
+
+    fake_hub(monkeypatch, accept=False)
+    assert flush_notifications(CONFIG) == 0
+    assert len(list(pending_dir.iterdir())) == 1
+
+    calls = fake_hub(monkeypatch, accept=True)
+    assert flush_notifications(CONFIG) == 1
+    assert calls == [('https://hub.example.com/', ['https://example.com/output/example_rss.xml'])]
+    assert list(pending_dir.iterdir()) == []
+
+
+def test_notifications_kept_without_hub(pending_dir, monkeypatch):
+    queue_notification(CONFIG, 'example_rss.xml', changed=True)
+    calls = fake_hub(monkeypatch, accept=True)
+
+    assert flush_notifications(dict(CONFIG, hub=[])) == 0
+    assert calls == []
+    assert len(list(pending_dir.iterdir())) == 1
+
+
+def test_pending_queue_lives_in_state():
+    assert websub.PENDING_DIR.parts[0] == 'state'
+
+
+def test_fingerprint_ignores_build_date():
+    first = b'<rss><channel><lastBuildDate>Mon</lastBuildDate><item>A</item></channel></rss>'
+    second = b'<rss><channel><lastBuildDate>Tue</lastBuildDate><item>A</item></channel></rss>'
+
+    assert content_fingerprint(first) == content_fingerprint(second)
+    assert content_fingerprint(first) != content_fingerprint(first.replace(b'A', b'B'))
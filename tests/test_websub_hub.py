@@ -0,0 +1,95 @@
+"""
+Tests du hub WebSub (remise du contenu aux abonnés)
+"""
+import io
+import time
+
+import pytest
+
+from src import websub_hub
+from src.websub_hub import WebSubHub
+
+TOPIC = 'https://example.com/output/example_rss.xml'
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title><lastBuildDate>{date}</lastBuildDate>
+  <item><title>{title}</title><link>https://example.com/post</link></item>
+</channel></rss>
+"""
+
+
+class FakeResponse(io.BytesIO):
+    headers = {'Content-Type': 'application/rss+xml'}
+
+
+@pytest.fixture
+def hub(tmp_path):
+    hub = WebSubHub(tmp_path / 'subscriptions.json')
+    for callback in ('https://a.example/cb', 'https://b.example/cb'):
+        hub.subscriptions.setdefault(TOPIC, {})[callback] = {
+            'expires': time.time() + 3600, 'secret': 's3cret', 'fingerprint': None}
+    return hub
+
+
+def serve_topic(monkeypatch, title, date='Mon, 06 Jan 2025 10:00:00 GMT'):
+    content = RSS.replace(b'{title}', title.encode()).replace(b'{date}', date.encode())
+    monkeypatch.setattr(websub_hub.urllib.request, 'urlopen', lambda url, timeout: FakeResponse(content))
+
+
+def record_deliveries(monkeypatch, hub, failing=()):
+    delivered = []
+
+    def distribute(topic, callback, secret, content, content_type):
+        if callback in failing:
+            return False
+        delivered.append(callback)
+        return True
+
+    monkeypatch.setattr(hub, 'distribute', distribute)
+    return delivered
+
+
+def test_failed_delivery_is_retried_on_next_publish(hub, monkeypatch):
+    serve_topic(monkeypatch, 'Post')
+    delivered = record_deliveries(monkeypatch, hub, failing={'https://b.example/cb'})
+    hub.publish([TOPIC])
+    assert delivered == ['https://a.example/cb']
+
+    delivered = record_deliveries(monkeypatch, hub)
+    hub.publish([TOPIC])
+    assert delivered == ['https://b.example/cb']
+
+    delivered = record_deliveries(monkeypatch, hub)
+    hub.publish([TOPIC])
+    assert delivered == []
+
+
+def test_build_date_change_is_not_redistributed(hub, monkeypatch):
+    serve_topic(monkeypatch, 'Post')
+    record_deliveries(monkeypatch, hub)
+    hub.publish([TOPIC])
+
+    serve_topic(monkeypatch, 'Post', date='Tue, 07 Jan 2025 10:00:00 GMT')
+    delivered = record_deliveries(monkeypatch, hub)
+    hub.publish([TOPIC])
+    assert delivered == []
+
+    serve_topic(monkeypatch, 'New post')
+    hub.publish([TOPIC])
+    assert sorted(delivered) == ['https://a.example/cb', 'https://b.example/cb']
+
+
+def test_delivery_state_survives_restart(hub, monkeypatch):
+    serve_topic(monkeypatch, 'Post')
+    record_deliveries(monkeypatch, hub)
+    hub.publish([TOPIC])
+
+    restarted = WebSubHub(hub.state_file)
+    delivered = record_deliveries(monkeypatch, restarted)
+    restarted.publish([TOPIC])
+    assert delivered == []
+    assert restarted.state_file.stat().st_mode & 0o077 == 0
+
+
+def test_default_state_file_is_outside_state_dir():
+    assert 'state' not in websub_hub.DEFAULT_STATE_FILE.parts